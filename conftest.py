@@ -0,0 +1 @@
+# Lets the tests import the socialpulse package from a plain checkout
@@ -0,0 +1,7 @@
+"""Allow ``python -m socialpulse``."""
+
+import sys
+
+from socialpulse.cli import main
+
+sys.exit(main())
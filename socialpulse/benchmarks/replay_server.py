@@ -0,0 +1,239 @@
+"""Local HTTP stand-in for the alpha.pumpagent.ai API.
+
+Serves recorded or synthetic ``user-tweets``, ``search`` and ``user-info``
+payloads so connector code can be benchmarked without network access or
+API quota. Latency and 429 responses can be injected.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+ENDPOINTS = ("user-tweets", "search", "user-info")
+
+_WORDS = (
+    "crypto bitcoin ethereum blockchain nft defi staking yield layer2 rollup "
+    "open source code provenance dao governance wallet airdrop mainnet testnet"
+).split()
+_TAGS = ("BTC", "ETH", "DeFi", "NFT", "Web3", "DeSci", "AI", "Solana")
+_CASHTAGS = ("BTC", "ETH", "SOL", "ARB", "OP")
+
+def synthetic_tweet(index: int, handle: str = "replay", now: Optional[int] = None,
+                    rng: Optional[random.Random] = None) -> Dict:
+    """A raw tweet in the API's user-tweets/search format."""
+    rng = rng or random
+    now = int(time.time()) if now is None else now
+    words = " ".join(rng.choice(_WORDS) for _ in range(12))
+    text = (f"{words} #{rng.choice(_TAGS)} ${rng.choice(_CASHTAGS)} @{handle} "
+            f"https://example.com/{index}")
+    return {
+        "id": str(1_800_000_000_000_000_000 + index),
+        "text": text,
+        "timestamp": now - index * 30,
+        "username": handle,
+        "likes": rng.randint(0, 5000),
+        "retweets": rng.randint(0, 1000),
+        "replies": rng.randint(0, 200),
+        "views": rng.randint(100, 100000),
+        "isPin": False,
+        "permanentUrl": f"https://x.com/{handle}/status/{1_800_000_000_000_000_000 + index}"
+    }
+
+def synthetic_payloads(base_size: int = 20, seed: int = 7) -> Dict[str, object]:
+    """Synthetic base payloads, one per endpoint."""
+    rng = random.Random(seed)
+    now = int(time.time())
+    tweets = [synthetic_tweet(i, now=now, rng=rng) for i in range(base_size)]
+    return {
+        "user-tweets": tweets,
+        "search": {"data": tweets},
+        "user-info": {"data": {"userName": "replay", "followers": 1234}}
+    }
+
+def load_payloads(directory: str) -> Dict[str, object]:
+    """
+    Load recorded payloads saved as <endpoint>.json (user-tweets.json, search.json, user-info.json).
+
+    Missing endpoints fall back to synthetic payloads.
+    """
+    payloads = synthetic_payloads()
+    for endpoint in ENDPOINTS:
+        path = Path(directory) / f"{endpoint}.json"
+        if path.exists():
+            with open(path, "r") as f:
+                payloads[endpoint] = json.load(f)
+    return payloads
+
+def _tweet_list(payload) -> Optional[List[Dict]]:
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict) and isinstance(payload.get("data"), list):
+        return payload["data"]
+    return None
+
+def scale_payload(payload, scale: int, now: Optional[int] = None):
+    """
+    Repeat a payload's tweets scale times with fresh ids and older timestamps.
+
+    Timestamps are shifted so the scaled timeline still lies within today,
+    newest first; non-tweet payloads are returned unchanged.
+    """
+    tweets = _tweet_list(payload)
+    if tweets is None or scale <= 1:
+        return payload
+    now = int(time.time()) if now is None else now
+    step = max(1, min(30, int(now % 86400) // max(1, len(tweets) * scale)))
+    scaled = []
+    for copy in range(scale):
+        for tweet in tweets:
+            index = len(scaled)
+            scaled.append({**tweet, "id": str(1_800_000_000_000_000_000 + index),
+                           "timestamp": now - index * step})
+    if isinstance(payload, list):
+        return scaled
+    return {**payload, "data": scaled}
+
+class ReplayServer:
+    """Threaded local server replaying payloads with optional latency and 429 injection.
+
+    The base URL to pass to XConnector is ``server.base_url``. Payload
+    bodies are serialized once per scale, so the server itself adds little
+    beyond the configured latency.
+    """
+
+    def __init__(self, payloads: Optional[Dict[str, object]] = None, scale: int = 1,
+                 latency: float = 0.0, jitter: float = 0.0, rate_limit_ratio: float = 0.0,
+                 retry_after: float = 0.01, quota: int = 900, seed: int = 7,
+                 paginate: bool = False, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            payloads: Base payload per endpoint (defaults to synthetic_payloads())
+            scale: Payload size multiplier
+            latency: Added delay per response in seconds
+            jitter: Uniform random extra delay up to this many seconds
+            rate_limit_ratio: Fraction of requests answered with 429
+            retry_after: Retry-After value sent with injected 429s
+            quota: Value reported in x-ratelimit-limit/remaining headers
+            seed: Random seed for jitter and 429 injection
+            paginate: Serve search results maxResults at a time with a next_cursor
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.payloads = payloads if payloads is not None else synthetic_payloads()
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.quota = quota
+        self.paginate = paginate
+        self.requests = 0
+        self.rate_limited = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies: Dict[str, bytes] = {}
+        self.set_scale(scale)
+
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def set_scale(self, scale: int):
+        """Switch the payload size multiplier."""
+        now = int(time.time())
+        self.scale = scale
+        self._search_tweets = _tweet_list(scale_payload(self.payloads.get("search"), scale, now)) or []
+        self._bodies = {
+            endpoint: json.dumps(scale_payload(payload, scale, now)).encode("utf-8")
+            for endpoint, payload in self.payloads.items()
+        }
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.rate_limited = 0
+
+    def _search_page(self, query: Dict[str, List[str]]) -> bytes:
+        """One page of search results starting at the request's cursor."""
+        try:
+            offset = int(query.get("cursor", ["0"])[0])
+            size = max(1, int(query.get("maxResults", ["20"])[0]))
+        except ValueError:
+            offset, size = 0, 20
+        end = offset + size
+        body = {"data": self._search_tweets[offset:end]}
+        if end < len(self._search_tweets):
+            body["next_cursor"] = str(end)
+        return json.dumps(body).encode("utf-8")
+
+    def _next_response(self, endpoint: Optional[str], query: Optional[Dict[str, List[str]]] = None):
+        """Decide delay and status for one request."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            limited = self.rate_limit_ratio and self._rng.random() < self.rate_limit_ratio
+            if limited:
+                self.rate_limited += 1
+            remaining = max(0, self.quota - self.requests)
+        if endpoint is None:
+            return delay, 404, b"", remaining
+        if limited:
+            return delay, 429, b"", remaining
+        if endpoint == "search" and self.paginate:
+            return delay, 200, self._search_page(query or {}), remaining
+        return delay, 200, self._bodies[endpoint], remaining
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                endpoint = next((e for e in ENDPOINTS if f"/{e}" in url.path), None)
+                delay, status, body, remaining = server._next_response(endpoint, parse_qs(url.query))
+                if delay:
+                    time.sleep(delay)
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("x-ratelimit-limit", str(server.quota))
+                self.send_header("x-ratelimit-remaining", str(remaining))
+                self.send_header("x-ratelimit-reset", str(int(time.time()) + 900))
+                if status == 429:
+                    self.send_header("Retry-After", str(server.retry_after))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,220 @@
+"""Offline benchmarks for the connector and analyzer hot paths.
+
+Runs XConnector.get_account_tweets, XConnector.search_trendy_tweets,
+TrendAnalyzer.get_trends, TrendAnalyzer.analyze_trend_volume,
+VectorScorer.score_batch and ScoringPipeline.score_texts against a local
+ReplayServer at several payload sizes and reports throughput, p50/p99
+latency and peak traced memory.
+
+Usage (from the CryptoBrain directory):
+    python -m socialpulse.benchmarks.run_benchmarks --scales 1 10 100 --latency 0.005 --rate-limit-ratio 0.02
+"""
+
+import argparse
+import gc
+import json
+import logging
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+from socialpulse.benchmarks.replay_server import ReplayServer, load_payloads, synthetic_payloads, synthetic_tweet
+from socialpulse.core.trend_stats import percentile
+from socialpulse.core.trend_analyzer import TrendAnalyzer
+from socialpulse.core.scoring_pipeline import ScoringPipeline
+from socialpulse.models.trend import TrendTopic
+from socialpulse.social_connectors.x_connector import XConnector
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_KEYWORDS = ["crypto", "bitcoin", "ethereum", "blockchain", "nft", "defi"]
+
+def measure(name: str, fn: Callable[[], int], iterations: int, scale: int,
+            warmup: int = 1, memory_iterations: int = 3, server: Optional[ReplayServer] = None) -> Dict:
+    """
+    Time fn over several iterations, then trace its peak memory separately.
+
+    Args:
+        name: Benchmark name
+        fn: Callable returning the number of items it processed
+        iterations: Timed iterations
+        scale: Payload scale (reported only)
+        warmup: Untimed iterations run first
+        memory_iterations: Iterations run under tracemalloc for peak memory
+        server: Replay server whose request and 429 counts are reported for the timed iterations
+
+    Returns:
+        Result dict with calls/s, items/s, p50/p99 latency in ms and peak memory in KiB
+    """
+    for _ in range(warmup):
+        fn()
+    if server is not None:
+        server.reset_counters()
+
+    latencies = []
+    items = 0
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        items += fn() or 0
+        latencies.append(time.perf_counter() - call_started)
+    total = time.perf_counter() - started
+    requests, rate_limited = (server.requests, server.rate_limited) if server is not None else (0, 0)
+
+    # tracemalloc slows allocation-heavy code, so memory is measured apart from timing
+    gc.collect()
+    tracemalloc.start()
+    for _ in range(memory_iterations):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "benchmark": name,
+        "scale": scale,
+        "iterations": iterations,
+        "calls_per_sec": iterations / total if total else 0.0,
+        "items_per_sec": items / total if total else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_kib": peak / 1024,
+        "requests": requests,
+        "rate_limited": rate_limited
+    }
+
+def synthetic_trends(count: int) -> List[TrendTopic]:
+    """Trend topics with spread-out volumes for analyze_trend_volume()."""
+    return [
+        TrendTopic(name=f"#trend{i}", volume=(i * 7919) % 100000 if i % 10 else None,
+                   platform="x" if i % 3 else "reddit")
+        for i in range(count)
+    ]
+
+def run_suite(scales: Sequence[int] = DEFAULT_SCALES, iterations: int = 30, latency: float = 0.0,
+              jitter: float = 0.0, rate_limit_ratio: float = 0.0, payload_dir: Optional[str] = None,
+              keywords: Sequence[str] = DEFAULT_KEYWORDS, base_size: int = 20) -> List[Dict]:
+    """
+    Run every benchmark at each scale.
+
+    Args:
+        scales: Payload size multipliers
+        iterations: Timed iterations per benchmark
+        latency: Server latency per response in seconds
+        jitter: Extra random server latency up to this many seconds
+        rate_limit_ratio: Fraction of requests answered with 429
+        payload_dir: Directory with recorded <endpoint>.json payloads (synthetic if omitted)
+        keywords: Keywords passed to TrendAnalyzer.get_trends
+        base_size: Tweets per synthetic payload at scale 1
+
+    Returns:
+        List of result dicts
+    """
+    payloads = load_payloads(payload_dir) if payload_dir else synthetic_payloads(base_size)
+    since = (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d')
+    results = []
+
+    with ReplayServer(payloads, latency=latency, jitter=jitter,
+                      rate_limit_ratio=rate_limit_ratio, quota=10 ** 9) as server:
+        connector = XConnector(
+            api_key="benchmark",
+            base_url=server.base_url,
+            max_retries=10,
+            quota_requests=10 ** 9,
+            quota_window=1.0
+        )
+        # Keep 429 waits short whatever the injected Retry-After says
+        connector.transport.max_rate_limit_wait = 1.0
+        analyzer = TrendAnalyzer([connector])
+        pipeline = ScoringPipeline(connector.profile, shard_size=1000)
+
+        try:
+            for scale in scales:
+                server.set_scale(scale)
+                count = base_size * scale
+
+                results.append(measure(
+                    "get_account_tweets",
+                    lambda: len(connector.get_account_tweets("replay", date_str=since)),
+                    iterations, scale, server=server
+                ))
+                results.append(measure(
+                    "search_trendy_tweets",
+                    lambda: len(connector.search_trendy_tweets("crypto", count=count, date_str=since)),
+                    iterations, scale, server=server
+                ))
+                results.append(measure(
+                    "TrendAnalyzer.get_trends",
+                    lambda: len(analyzer.get_trends(list(keywords))),
+                    max(1, iterations // len(keywords)), scale, server=server
+                ))
+                trends = synthetic_trends(count * 10)
+                results.append(measure(
+                    "TrendAnalyzer.analyze_trend_volume",
+                    lambda: (analyzer.analyze_trend_volume(trends), len(trends))[1],
+                    iterations, scale
+                ))
+                texts = [synthetic_tweet(i)["text"] for i in range(count * 10)]
+                scorer = connector.vector_scorer
+                results.append(measure(
+                    "VectorScorer.score_batch",
+                    lambda: len(scorer.score_batch(texts)),
+                    iterations, scale
+                ))
+                results.append(measure(
+                    f"ScoringPipeline.score_texts x{pipeline.workers}",
+                    lambda: len(pipeline.score_texts(texts)),
+                    iterations, scale
+                ))
+        finally:
+            pipeline.close()
+            connector.close()
+
+    return results
+
+def format_results(results: List[Dict]) -> str:
+    """Render results as an aligned text table."""
+    header = (f"{'benchmark':<36} {'scale':>5} {'calls/s':>10} {'items/s':>12} {'p50 ms':>9} "
+              f"{'p99 ms':>9} {'peak KiB':>10} {'HTTP':>6} {'429s':>5}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['benchmark']:<36} {r['scale']:>5} {r['calls_per_sec']:>10.1f} {r['items_per_sec']:>12.0f} "
+            f"{r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['peak_kib']:>10.1f} {r['requests']:>6} {r['rate_limited']:>5}"
+        )
+    return "\n".join(lines)
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Offline SocialPulse benchmarks against a local replay server")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Payload size multipliers")
+    parser.add_argument("--iterations", type=int, default=30, help="Timed iterations per benchmark")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency per response in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random server latency in seconds")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0,
+                        help="Fraction of requests answered with 429")
+    parser.add_argument("--payloads", help="Directory with recorded user-tweets.json, search.json, user-info.json")
+    parser.add_argument("--json", help="Also write results as JSON to this file")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    # Injected 429s would otherwise flood the output with retry warnings
+    logging.basicConfig(level=logging.ERROR)
+    results = run_suite(
+        scales=args.scales,
+        iterations=args.iterations,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit_ratio,
+        payload_dir=args.payloads
+    )
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Startup-time budget check for the socialpulse command.
+
+Launches ``python -m socialpulse ... --help`` for every subcommand in fresh
+interpreters, reports the median wall time and fails when it exceeds the
+budget. It also verifies that building the parser does not import the
+heavy dependencies (requests, LangChain) that subcommands load lazily.
+
+Usage (from the CryptoBrain directory):
+    python -m socialpulse.benchmarks.startup --budget-ms 250
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence
+
+COMMANDS = (
+    ["--help"],
+    ["trends", "--help"],
+    ["account", "--help"],
+    ["search", "--help"],
+    ["history", "--help"],
+    ["profile", "--help"],
+)
+
+# Modules only subcommand handlers may import
+HEAVY_MODULES = ("requests", "langchain", "langchain_core", "langchain_openai", "langchain_community")
+
+_IMPORT_PROBE = (
+    "import sys\n"
+    "from socialpulse.cli import build_parser\n"
+    "build_parser()\n"
+    f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+)
+
+def time_command(args: Sequence[str], runs: int) -> List[float]:
+    """Wall times in seconds of running python -m socialpulse with args in fresh interpreters."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "socialpulse", *args],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - started)
+    return times
+
+def interpreter_baseline(runs: int) -> float:
+    """Median startup time of a bare interpreter, for reference."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+def heavy_imports_at_startup() -> List[str]:
+    """Heavy modules imported just by building the CLI parser."""
+    result = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], capture_output=True, text=True, check=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+def check_startup(budget_ms: float = 250.0, runs: int = 5) -> Dict:
+    """
+    Measure CLI startup and compare it with the budget.
+
+    Args:
+        budget_ms: Maximum allowed median time per command in milliseconds
+        runs: Runs per command
+
+    Returns:
+        Report dict; 'ok' is False if any command is over budget or heavy modules load at startup
+    """
+    commands = []
+    for args in COMMANDS:
+        median_ms = statistics.median(time_command(args, runs)) * 1000
+        commands.append({
+            "command": " ".join(["socialpulse", *args]),
+            "median_ms": median_ms,
+            "ok": median_ms <= budget_ms
+        })
+    heavy = heavy_imports_at_startup()
+    return {
+        "budget_ms": budget_ms,
+        "interpreter_ms": interpreter_baseline(runs) * 1000,
+        "commands": commands,
+        "heavy_imports": heavy,
+        "ok": all(c["ok"] for c in commands) and not heavy
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Check socialpulse CLI startup time against a budget")
+    parser.add_argument("--budget-ms", type=float, default=250.0,
+                        help="Maximum median startup time per command in milliseconds (default: 250)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command (default: 5)")
+    parser.add_argument("--json", help="Also write the report as JSON to this file")
+    args = parser.parse_args()
+
+    report = check_startup(args.budget_ms, args.runs)
+    print(f"Interpreter baseline: {report['interpreter_ms']:.0f} ms, budget: {report['budget_ms']:.0f} ms")
+    for command in report["commands"]:
+        status = "ok" if command["ok"] else "OVER BUDGET"
+        print(f"{command['command']:<32} {command['median_ms']:>7.0f} ms  {status}")
+    if report["heavy_imports"]:
+        print(f"Heavy modules imported at startup: {', '.join(report['heavy_imports'])}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(0 if report["ok"] else 1)
+
+if __name__ == "__main__":
+    main()
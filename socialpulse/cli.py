@@ -0,0 +1,342 @@
+"""Unified ``socialpulse`` command line.
+
+Subcommands:
+    trends    Trending topics for keywords (same as main.py)
+    account   Recent tweets from an account
+    search    Popular tweets matching a query
+    history   Volume of a hashtag over time, from the local tweet store
+    profile   Generate profile.json from a document (same as profile/generate_profile.py)
+
+Only argparse is imported at startup. Connectors, analyzers and the
+LangChain stack are imported inside the subcommand that needs them, so
+``--help`` and argument errors return immediately.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+DEFAULT_KEYWORDS = ["crypto", "bitcoin", "ethereum", "blockchain", "nft", "defi"]
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Add the profile generator options (shared with profile/generate_profile.py)."""
+    parser.add_argument(
+        "-i", "--input",
+        required=True,
+        help="Path to input file (PDF or TXT)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="profile.json",
+        help="Path to output JSON file (default: profile.json)"
+    )
+    parser.add_argument(
+        "-k", "--api-key",
+        help="OpenAI API key (optional, can also use OPENAI_API_KEY env var)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=4,
+        help="Maximum number of chunks extracted concurrently (default: 4)"
+    )
+    parser.add_argument(
+        "--llm",
+        choices=["openai", "stub"],
+        default="openai",
+        help="Language model to use; 'stub' runs offline for testing and benchmarks (default: openai)"
+    )
+    parser.add_argument(
+        "--cache",
+        default=".profile_cache.db",
+        help="Path to the per-chunk extraction cache (default: .profile_cache.db)"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=5000,
+        help="Maximum number of cached chunk extractions (default: 5000)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always send every chunk to the LLM"
+    )
+    parser.add_argument(
+        "--metrics",
+        help="Write stage timings and counters to this file (Prometheus text for .prom or .txt, JSON otherwise)"
+    )
+
+def _connector_options() -> argparse.ArgumentParser:
+    """Options shared by the subcommands that call the X API."""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument(
+        "--api-key",
+        help="X API key (defaults to X_API_KEY from the environment or .env)"
+    )
+    parent.add_argument(
+        "--base-url",
+        help="API base URL (defaults to the production API)"
+    )
+    parent.add_argument(
+        "--metrics",
+        help="Write request metrics to this file (Prometheus text for .prom or .txt, JSON otherwise)"
+    )
+    parent.add_argument(
+        "--store",
+        help="Keep fetched tweets (and trend snapshots) in this SQLite tweet store"
+    )
+    parent.add_argument(
+        "--quota",
+        help="Share the API quota with other processes through this SQLite file"
+    )
+    return parent
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="socialpulse",
+        description="SocialPulse - Social media analysis for crypto trends"
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+    connector_options = _connector_options()
+
+    trends = subparsers.add_parser(
+        "trends", parents=[connector_options], help="Trending topics for keywords"
+    )
+    trends.add_argument(
+        "--keywords",
+        nargs="+",
+        default=DEFAULT_KEYWORDS,
+        help="Keywords to filter trending topics"
+    )
+    trends.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Query all connectors concurrently and return partial results on timeout"
+    )
+    trends.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Per-connector deadline in seconds when running with --concurrent"
+    )
+    trends.add_argument(
+        "--max-query-length",
+        type=int,
+        default=512,
+        help="Search query length limit when combining keywords into OR queries (default: 512)"
+    )
+    trends.set_defaults(handler=run_trends)
+
+    account = subparsers.add_parser(
+        "account", parents=[connector_options], help="Recent tweets from an account"
+    )
+    account.add_argument("handle", help="X account handle (with or without @)")
+    account.add_argument("--date", help="Only tweets since this date (yyyy-mm-dd, default today)")
+    account.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only tweets newer than the last run, tracked in --watermarks"
+    )
+    account.add_argument(
+        "--watermarks",
+        default="x_watermarks.db",
+        help="Watermark database used with --incremental (default: x_watermarks.db)"
+    )
+    account.add_argument("--json", action="store_true", help="Print tweets as JSON")
+    account.set_defaults(handler=run_account)
+
+    search = subparsers.add_parser(
+        "search", parents=[connector_options], help="Popular tweets matching a query"
+    )
+    search.add_argument("query", help="Search query")
+    search.add_argument("--count", type=int, default=10, help="Maximum number of tweets (default: 10)")
+    search.add_argument("--date", help="Only tweets since this date (yyyy-mm-dd)")
+    search.add_argument("--min-likes", type=int, default=10, help="Minimum likes (default: 10)")
+    search.add_argument("--min-retweets", type=int, default=10, help="Minimum retweets (default: 10)")
+    search.add_argument("--json", action="store_true", help="Print tweets as JSON")
+    search.set_defaults(handler=run_search)
+
+    history = subparsers.add_parser(
+        "history", help="Volume of a hashtag over time, from the local tweet store"
+    )
+    history.add_argument("hashtag", help="Hashtag (with or without #)")
+    history.add_argument("--days", type=float, default=7.0, help="How far back to look (default: 7)")
+    history.add_argument(
+        "--bucket",
+        choices=["hour", "day"],
+        default="day",
+        help="Width of each point of the series, in UTC (default: day)"
+    )
+    history.add_argument(
+        "--store",
+        default="socialpulse.db",
+        help="Tweet store written by --store on the other subcommands (default: socialpulse.db)"
+    )
+    history.add_argument("--json", action="store_true", help="Print the series as JSON")
+    history.set_defaults(handler=run_history)
+
+    profile = subparsers.add_parser("profile", help="Generate profile.json from a document")
+    add_profile_arguments(profile)
+    profile.set_defaults(handler=run_profile)
+
+    return parser
+
+def _create_connector(args, **kwargs):
+    """Create an XConnector from the command line options."""
+    from dotenv import load_dotenv
+    from socialpulse.social_connectors.x_connector import XConnector
+
+    load_dotenv()
+    api_key = args.api_key or os.getenv("X_API_KEY")
+    store = quota = None
+    if args.store:
+        from socialpulse.utils.tweet_store import TweetStore
+
+        store = TweetStore(args.store)
+    if args.quota and api_key:
+        from socialpulse.utils.quota import SharedQuota
+
+        quota = SharedQuota(args.quota, name=XConnector.quota_name(api_key))
+    return XConnector(
+        api_key=api_key,
+        base_url=args.base_url,
+        store=store,
+        quota=quota,
+        **kwargs
+    )
+
+def _write_metrics(args, connector):
+    if args.metrics:
+        connector.metrics.write(args.metrics)
+
+def _print_tweets(tweets: List[dict], as_json: bool):
+    if as_json:
+        import json
+
+        print(json.dumps(tweets, indent=2, ensure_ascii=False))
+        return
+    for tweet in tweets:
+        author = tweet.get("author") or tweet.get("username") or "unknown"
+        metrics = tweet.get("metrics") or tweet
+        text = " ".join((tweet.get("text") or "").split())
+        print(f"@{author} [{metrics.get('likes', 0)} likes, {metrics.get('retweets', 0)} retweets]: {text}")
+
+def run_trends(args) -> int:
+    """Fetch and analyze trends (the main.py flow)."""
+    from socialpulse.core.trend_analyzer import TrendAnalyzer
+
+    x_connector = _create_connector(args, max_query_length=args.max_query_length)
+    analyzer = TrendAnalyzer([x_connector])
+
+    print(f"Getting trends for keywords: {', '.join(args.keywords)}")
+    if args.concurrent:
+        result = analyzer.get_trends_concurrent(args.keywords, timeout=args.timeout)
+        for status in result.statuses.values():
+            if status.status != "ok":
+                print(f"{status.connector}: {status.status} ({status.error})")
+        trends = result.trends
+    else:
+        trends = analyzer.get_trends(args.keywords)
+
+    if x_connector.store is not None:
+        x_connector.store.save_trends(trends)
+
+    if trends:
+        print(f"\nFound {len(trends)} trending topics:")
+        for i, trend in enumerate(trends, 1):
+            volume = f"{trend.volume:,d} tweets" if trend.volume else "unknown volume"
+            print(f"{i}. {trend.name} ({volume}) [Platform: {trend.platform}]")
+
+        analysis = analyzer.analyze_trend_volume(trends)
+        print(f"\nTrend Analysis:")
+        print(f"Total Volume: {analysis['total_volume']:,d} tweets")
+        print(f"Average Volume: {analysis['average_volume']:,.2f} tweets per trend")
+        print(f"Median Volume: {analysis['median_volume']:,.2f} tweets per trend")
+    else:
+        print("No trends found matching the specified keywords.")
+
+    _write_metrics(args, x_connector)
+    return 0
+
+def run_account(args) -> int:
+    """Print recent tweets from one account."""
+    watermarks = None
+    if args.incremental:
+        from socialpulse.utils.watermarks import WatermarkStore
+
+        watermarks = WatermarkStore(args.watermarks)
+
+    connector = _create_connector(args, watermarks=watermarks)
+    tweets = connector.get_account_tweets(args.handle, date_str=args.date, incremental=args.incremental)
+    if isinstance(tweets, dict) and "error" in tweets:
+        print(f"Error: {tweets['error']}", file=sys.stderr)
+        return 1
+
+    _print_tweets(tweets, args.json)
+    _write_metrics(args, connector)
+    return 0
+
+def run_search(args) -> int:
+    """Print popular tweets matching a query."""
+    connector = _create_connector(args)
+    tweets = connector.search_trendy_tweets(
+        args.query,
+        count=args.count,
+        date_str=args.date,
+        min_likes=args.min_likes,
+        min_retweets=args.min_retweets
+    )
+    _print_tweets(tweets, args.json)
+    _write_metrics(args, connector)
+    return 0
+
+def run_history(args) -> int:
+    """Print a hashtag's volume series from the tweet store (no API calls)."""
+    import time
+    from datetime import datetime, timezone
+    from socialpulse.utils.tweet_store import TweetStore
+
+    if not os.path.exists(args.store):
+        print(f"Error: tweet store {args.store} not found (fetch with --store first)", file=sys.stderr)
+        return 1
+
+    store = TweetStore(args.store)
+    bucket = 3600 if args.bucket == "hour" else 86400
+    series = store.hashtag_volume(args.hashtag, since=time.time() - args.days * 86400, bucket=bucket)
+    store.close()
+
+    if args.json:
+        import json
+
+        print(json.dumps([{"start": start, "count": count} for start, count in series], indent=2))
+        return 0
+    print(f"#{args.hashtag.lstrip('#')}: {sum(count for _, count in series):,d} tweets in the last {args.days:g} days")
+    for start, count in series:
+        label = datetime.fromtimestamp(start, timezone.utc).strftime("%Y-%m-%d %H:%M" if bucket == 3600 else "%Y-%m-%d")
+        print(f"{label}  {count:>6,d}")
+    return 0
+
+def run_profile(args) -> int:
+    """Generate a profile (imports the LangChain stack)."""
+    from socialpulse.profile import generate_profile
+
+    return generate_profile.run(args)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the socialpulse command."""
+    args = build_parser().parse_args(argv)
+
+    from socialpulse.exceptions import SocialPulseException
+
+    try:
+        return args.handler(args)
+    except SocialPulseException as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""Near-duplicate suppression for post streams.
+
+Copy-pasted shill posts and retweet chains are collapsed into clusters with
+MinHash signatures and LSH banding, so downstream stages see each piece of
+content once together with how many times it was posted.
+"""
+
+import re
+import time
+import hashlib
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_ROW_BYTES = array("I").itemsize
+_MAX_HASH = (1 << (8 * _ROW_BYTES)) - 1
+
+_RETWEET_PREFIX_RE = re.compile(r"^rt @\w+:?\s*")
+_NOISE_RE = re.compile(r"https?://\S+|@\w+")
+_WORD_RE = re.compile(r"[\w$#]+")
+
+def shingle_text(text: Optional[str], size: int = 2) -> List[str]:
+    """
+    Normalize a post and split it into word shingles.
+
+    Case, retweet prefixes, URLs, mentions and punctuation are ignored, so
+    "RT @bob: Buy $XYZ now!! https://t.co/a" and "buy $xyz now" share shingles.
+
+    Args:
+        text: Post text
+        size: Words per shingle
+
+    Returns:
+        List of shingles (the whole normalized text if it is shorter than size words)
+    """
+    if not text:
+        return []
+    text = _NOISE_RE.sub(" ", _RETWEET_PREFIX_RE.sub("", text.casefold()))
+    words = _WORD_RE.findall(text)
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+class MinHasher:
+    """MinHash signatures from independent per-row hash functions.
+
+    One SHAKE-128 digest per shingle supplies all ``num_perm`` 32-bit hash
+    values at once, so a signature costs one hash call per shingle plus an
+    element-wise minimum, and is stable across processes and runs.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length
+            seed: Hash seed (same seed, same signatures)
+        """
+        self.num_perm = num_perm
+        self._salt = f"{seed}:".encode("utf-8")
+        self._digest_size = num_perm * _ROW_BYTES
+
+    def signature(self, shingles: Iterable[str]) -> Tuple[int, ...]:
+        """MinHash signature of a set of shingles."""
+        salt, size = self._salt, self._digest_size
+        rows = [
+            array("I", hashlib.shake_128(salt + s.encode("utf-8")).digest(size))
+            for s in set(shingles)
+        ]
+        if not rows:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(map(min, zip(*rows)))
+
+def estimate_similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+@dataclass
+class DuplicateCluster:
+    """A group of near-identical posts represented by the first one seen."""
+    cluster_id: int
+    representative: Dict
+    signature: Tuple[int, ...]
+    count: int = 1
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+    member_ids: List = field(default_factory=list)
+    band_keys: List[Tuple[int, int]] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation."""
+        return {
+            "cluster_id": self.cluster_id,
+            "representative": self.representative,
+            "count": self.count,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+            "member_ids": self.member_ids
+        }
+
+class NearDuplicateFilter:
+    """Rolling-window near-duplicate detector based on MinHash + LSH banding.
+
+    Each post's signature is split into ``bands`` bands; posts sharing any
+    band are candidates and are merged when their estimated similarity is at
+    least ``threshold``. Clusters unseen for ``window`` seconds, or beyond
+    ``max_clusters``, are evicted (least recently seen first), which bounds
+    memory regardless of stream length.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 2, window: float = 24 * 60 * 60, max_clusters: int = 50000,
+                 max_members: int = 100, seed: int = 1):
+        """
+        Args:
+            threshold: Minimum estimated Jaccard similarity for two posts to be duplicates
+            num_perm: MinHash signature length (must be divisible by bands)
+            bands: Number of LSH bands
+            shingle_size: Words per shingle
+            window: Seconds a cluster is kept after its last post
+            max_clusters: Maximum number of clusters kept
+            max_members: Maximum member ids recorded per cluster
+            seed: MinHash seed
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.window = window
+        self.max_clusters = max_clusters
+        self.max_members = max_members
+        self.hasher = MinHasher(num_perm, seed)
+
+        self._clusters: "OrderedDict[int, DuplicateCluster]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._next_id = 0
+
+        self.seen = 0
+        self.duplicates = 0
+        self.evicted = 0
+
+    @staticmethod
+    def _timestamp(post: Dict) -> float:
+        """Epoch timestamp of a raw (timestamp) or formatted (created_at) post."""
+        timestamp = post.get("timestamp")
+        if timestamp is not None:
+            return float(timestamp)
+        created_at = post.get("created_at")
+        if created_at:
+            return datetime.fromisoformat(created_at).timestamp()
+        return time.time()
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        rows = self.rows
+        return [(band, hash(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def _find(self, signature: Tuple[int, ...], band_keys: List[Tuple[int, int]]) -> Optional[DuplicateCluster]:
+        best, best_similarity = None, self.threshold
+        checked = set()
+        for key in band_keys:
+            for cluster_id in self._buckets.get(key, ()):
+                if cluster_id in checked:
+                    continue
+                checked.add(cluster_id)
+                cluster = self._clusters[cluster_id]
+                similarity = estimate_similarity(signature, cluster.signature)
+                if similarity >= best_similarity:
+                    best, best_similarity = cluster, similarity
+        return best
+
+    def _evict(self, now: float):
+        clusters = self._clusters
+        while clusters:
+            cluster_id, cluster = next(iter(clusters.items()))
+            if len(clusters) <= self.max_clusters and now - cluster.last_seen <= self.window:
+                break
+            del clusters[cluster_id]
+            for key in cluster.band_keys:
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.remove(cluster_id)
+                    if not bucket:
+                        del self._buckets[key]
+            self.evicted += 1
+
+    def add(self, post: Dict, text_key: str = "text") -> Tuple[bool, DuplicateCluster]:
+        """
+        Add a post to the stream.
+
+        Posts without any words left after normalization are never
+        duplicates; they get a cluster of their own that is not indexed.
+
+        Args:
+            post: Post dict
+            text_key: Key holding the post text
+
+        Returns:
+            (is_new, cluster): is_new is False when the post joined an existing cluster
+        """
+        now = self._timestamp(post)
+        self.seen += 1
+
+        shingles = shingle_text(post.get(text_key), self.shingle_size)
+        signature = self.hasher.signature(shingles)
+        if shingles:
+            band_keys = self._band_keys(signature)
+            cluster = self._find(signature, band_keys)
+        else:
+            # Nothing to compare (e.g. only links or mentions): every such post is new
+            band_keys, cluster = [], None
+
+        if cluster is not None:
+            self.duplicates += 1
+            cluster.count += 1
+            cluster.last_seen = max(cluster.last_seen, now)
+            if len(cluster.member_ids) < self.max_members:
+                cluster.member_ids.append(post.get("id"))
+            self._clusters.move_to_end(cluster.cluster_id)
+            self._evict(now)
+            return False, cluster
+
+        cluster = DuplicateCluster(
+            cluster_id=self._next_id,
+            representative=post,
+            signature=signature,
+            first_seen=now,
+            last_seen=now,
+            member_ids=[post.get("id")],
+            band_keys=band_keys
+        )
+        self._next_id += 1
+        self._clusters[cluster.cluster_id] = cluster
+        for key in band_keys:
+            self._buckets.setdefault(key, []).append(cluster.cluster_id)
+        self._evict(now)
+        return True, cluster
+
+    def filter(self, posts: Iterable[Dict], text_key: str = "text") -> List[Dict]:
+        """
+        Drop posts that duplicate something already seen in the window.
+
+        Args:
+            posts: Post dicts
+            text_key: Key holding the post text
+
+        Returns:
+            Posts that started a new cluster, in input order
+        """
+        return [post for post in posts if self.add(post, text_key)[0]]
+
+    def clusters(self, min_count: int = 1) -> List[DuplicateCluster]:
+        """Current clusters with at least min_count posts, largest first."""
+        return sorted(
+            (c for c in self._clusters.values() if c.count >= min_count),
+            key=lambda c: c.count, reverse=True
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: posts seen, duplicates suppressed, clusters held and evicted."""
+        return {
+            "seen": self.seen,
+            "duplicates": self.duplicates,
+            "clusters": len(self._clusters),
+            "evicted": self.evicted
+        }
+
+def collapse_near_duplicates(posts: Iterable[Dict], threshold: float = 0.8,
+                             text_key: str = "text") -> List[DuplicateCluster]:
+    """
+    Collapse a batch of posts into near-duplicate clusters.
+
+    Args:
+        posts: Post dicts
+        threshold: Minimum estimated Jaccard similarity
+        text_key: Key holding the post text
+
+    Returns:
+        Clusters, largest first
+    """
+    dedup = NearDuplicateFilter(threshold=threshold, window=float("inf"), max_clusters=1 << 62)
+    for post in posts:
+        dedup.add(post, text_key)
+    return dedup.clusters()
@@ -0,0 +1,340 @@
+"""Data Feed Listener: adaptive polling of tracked accounts and search queries.
+
+Every feed (an account timeline or a search query) is polled on its own
+interval. Intervals follow how often new tweets actually show up, so busy
+feeds are polled often and quiet ones rarely, and the pace of all polls is
+stretched to fit the quota left in the ``x-ratelimit-*`` headers.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import sys
+import os
+
+try:
+    from socialpulse.exceptions import RateLimitException
+except ImportError:
+    # If running directly from socialpulse directory
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from exceptions import RateLimitException
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PollTask:
+    """One polled feed and its adaptive interval."""
+    key: str
+    fetch: Callable[[], List[Dict]]
+    interval: float = 300.0
+    min_interval: float = 60.0
+    max_interval: float = 3600.0
+    next_due: float = 0.0
+    rate: Optional[float] = None  # smoothed new tweets per second
+    last_poll: Optional[float] = None
+    polls: int = 0
+    new_items: int = 0
+    errors: int = 0
+    seen_limit: int = 1000
+    _seen: Set = field(default_factory=set, repr=False)
+    _seen_order: Deque = field(default_factory=deque, repr=False)
+
+    def take_new(self, items: List[Dict]) -> List[Dict]:
+        """Items whose id has not been returned by this feed before."""
+        new = []
+        for item in items:
+            item_id = item.get("id")
+            if item_id is None:
+                new.append(item)
+                continue
+            if item_id in self._seen:
+                continue
+            self._seen.add(item_id)
+            self._seen_order.append(item_id)
+            if len(self._seen_order) > self.seen_limit:
+                self._seen.discard(self._seen_order.popleft())
+            new.append(item)
+        return new
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation."""
+        return {
+            "key": self.key,
+            "interval": self.interval,
+            "next_due": self.next_due,
+            "rate": self.rate,
+            "polls": self.polls,
+            "new_items": self.new_items,
+            "errors": self.errors
+        }
+
+class FeedListener:
+    """Long-running scheduler polling feeds through an XConnector.
+
+    After each poll the feed's rate of new tweets is smoothed with an
+    exponential moving average and its interval set so that about
+    ``target_items`` new tweets are expected per poll, within the feed's
+    bounds; a poll with nothing new or an error stretches the interval
+    instead. Independently, the remaining quota from the rate-limit headers
+    sets a minimum spacing between any two polls, and polling pauses until
+    the reset once only ``reserve`` requests are left.
+    """
+
+    def __init__(self, connector, on_items: Optional[Callable[[str, List[Dict]], None]] = None,
+                 target_items: float = 5.0, smoothing: float = 0.3, backoff: float = 1.5,
+                 reserve: int = 5, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            connector: XConnector used for polling (its transport supplies rate-limit headers)
+            on_items: Callback receiving (task key, new tweets) after each poll that found any
+            target_items: New tweets a poll should find on average
+            smoothing: Weight of the latest observation in the rate average (0-1)
+            backoff: Interval multiplier after an empty or failed poll
+            reserve: Requests left unused before the rate limit resets
+            clock: Time source in seconds since epoch
+        """
+        self.connector = connector
+        self.on_items = on_items
+        self.target_items = target_items
+        self.smoothing = smoothing
+        self.backoff = backoff
+        self.reserve = reserve
+        self.clock = clock
+
+        self.tasks: Dict[str, PollTask] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._not_before = 0.0
+        self._stop = threading.Event()
+        self.polls = 0
+        self.rate_limited = 0
+
+    # Task management
+
+    def add_task(self, key: str, fetch: Callable[[], List[Dict]], interval: float = 300.0,
+                 min_interval: float = 60.0, max_interval: float = 3600.0) -> PollTask:
+        """
+        Register a feed (replacing any task with the same key); it is due immediately.
+
+        Args:
+            key: Unique task name
+            fetch: Callable returning the feed's current tweets
+            interval: Starting interval in seconds
+            min_interval: Shortest interval allowed
+            max_interval: Longest interval allowed
+
+        Returns:
+            The PollTask
+        """
+        task = PollTask(key, fetch, interval=min(max(interval, min_interval), max_interval),
+                        min_interval=min_interval, max_interval=max_interval, next_due=self.clock())
+        self.tasks[key] = task
+        self._push(task)
+        return task
+
+    def add_account(self, handle: str, incremental: bool = False, **kwargs) -> PollTask:
+        """
+        Poll an account's timeline.
+
+        Args:
+            handle: X account handle (with or without @)
+            incremental: Use the connector's watermarks so only unseen tweets are fetched
+            **kwargs: Interval settings passed to add_task()
+        """
+        handle = handle.lstrip('@')
+
+        def fetch():
+            tweets = self.connector.get_account_tweets(handle, incremental=incremental)
+            if isinstance(tweets, dict) and "error" in tweets:
+                raise RuntimeError(tweets["error"])
+            return tweets
+
+        return self.add_task(f"account:{handle.lower()}", fetch, **kwargs)
+
+    def add_tracked_accounts(self, incremental: bool = False, **kwargs) -> List[PollTask]:
+        """Poll every account in the connector's track_x.json."""
+        return [
+            self.add_account(account["handle"], incremental=incremental, **kwargs)
+            for account in self.connector.track_accounts if account.get("handle")
+        ]
+
+    def add_query(self, query: str, count: int = 20, min_likes: int = 10, min_retweets: int = 10,
+                  **kwargs) -> PollTask:
+        """
+        Poll a search query.
+
+        Args:
+            query: Search query string
+            count: Maximum tweets per poll
+            min_likes: Minimum number of likes for tweets to include
+            min_retweets: Minimum number of retweets for tweets to include
+            **kwargs: Interval settings passed to add_task()
+        """
+        def fetch():
+            return self.connector.search_trendy_tweets(
+                query, count=count, min_likes=min_likes, min_retweets=min_retweets
+            )
+
+        return self.add_task(f"query:{query}", fetch, **kwargs)
+
+    def remove(self, key: str):
+        """Stop polling a task."""
+        self.tasks.pop(key, None)
+
+    def _push(self, task: PollTask):
+        self._seq += 1
+        heapq.heappush(self._heap, (task.next_due, self._seq, task.key))
+
+    def _peek(self) -> Optional[PollTask]:
+        """Next due task, dropping heap entries of removed or rescheduled tasks."""
+        while self._heap:
+            due, _, key = self._heap[0]
+            task = self.tasks.get(key)
+            if task is not None and task.next_due == due:
+                return task
+            heapq.heappop(self._heap)
+        return None
+
+    # Scheduling
+
+    def next_poll_time(self) -> Optional[float]:
+        """When the next poll may run, or None if there are no tasks."""
+        task = self._peek()
+        if task is None:
+            return None
+        return max(task.next_due, self._not_before)
+
+    def _adapt(self, task: PollTask, new_count: int, now: float):
+        """Update the task's rate estimate and derive its next interval."""
+        elapsed = now - task.last_poll if task.last_poll is not None else task.interval
+        observed = new_count / max(elapsed, 1e-9)
+        if task.rate is None:
+            task.rate = observed
+        else:
+            task.rate = self.smoothing * observed + (1 - self.smoothing) * task.rate
+
+        if new_count and task.rate > 0:
+            interval = self.target_items / task.rate
+        else:
+            interval = task.interval * self.backoff
+        task.interval = min(max(interval, task.min_interval), task.max_interval)
+
+    def _pace(self, now: float):
+        """Space out upcoming polls according to the quota left before the reset."""
+        info = getattr(self.connector.transport, "rate_limit", None) or {}
+        remaining, reset = info.get("remaining"), info.get("reset")
+        if remaining is None or reset is None or reset <= now:
+            return
+        if remaining <= self.reserve:
+            logger.info(f"Quota nearly used ({remaining} left), pausing polls for {reset - now:.0f}s")
+            self._not_before = max(self._not_before, float(reset))
+        else:
+            self._not_before = max(self._not_before, now + (reset - now) / (remaining - self.reserve))
+
+    def poll(self, task: PollTask) -> List[Dict]:
+        """
+        Poll one task now and reschedule it.
+
+        Returns:
+            New tweets found (also passed to on_items)
+        """
+        now = self.clock()
+        new = []
+        try:
+            items = task.fetch() or []
+        except RateLimitException as e:
+            self.rate_limited += 1
+            wait = e.retry_after if e.retry_after is not None else task.interval
+            logger.warning(f"Rate limited while polling {task.key}, pausing {wait:.0f}s")
+            self._not_before = max(self._not_before, now + wait)
+            self._pace(now)
+            task.next_due = self._not_before
+            self._push(task)
+            return new
+        except Exception as e:
+            task.errors += 1
+            task.interval = min(task.interval * self.backoff, task.max_interval)
+            logger.warning(f"Polling {task.key} failed: {e}")
+        else:
+            new = task.take_new(items)
+            self._adapt(task, len(new), now)
+            task.new_items += len(new)
+            task.last_poll = now
+        finally:
+            task.polls += 1
+            self.polls += 1
+
+        task.next_due = now + task.interval
+        self._push(task)
+        self._pace(now)
+
+        logger.debug(f"Polled {task.key}: {len(new)} new, next in {task.interval:.0f}s")
+        if new and self.on_items is not None:
+            self.on_items(task.key, new)
+        return new
+
+    def poll_due(self) -> Dict[str, List[Dict]]:
+        """
+        Poll every task that is due now, respecting the quota pacing.
+
+        Returns:
+            New tweets per polled task key
+        """
+        results = {}
+        while True:
+            task = self._peek()
+            now = self.clock()
+            if task is None or max(task.next_due, self._not_before) > now:
+                return results
+            results[task.key] = self.poll(task)
+
+    def run(self, duration: Optional[float] = None, max_polls: Optional[int] = None,
+            idle_wait: float = 60.0):
+        """
+        Poll until stop() is called, duration seconds pass or max_polls polls are made.
+
+        Args:
+            duration: Maximum run time in seconds
+            max_polls: Maximum number of polls
+            idle_wait: Longest single sleep between checks
+        """
+        self._stop.clear()
+        deadline = self.clock() + duration if duration is not None else None
+        polls = 0
+        while not self._stop.is_set():
+            now = self.clock()
+            if deadline is not None and now >= deadline:
+                break
+            if max_polls is not None and polls >= max_polls:
+                break
+
+            task = self._peek()
+            if task is None:
+                wait = idle_wait
+            else:
+                wait = max(task.next_due, self._not_before) - now
+                if wait <= 0:
+                    self.poll(task)
+                    polls += 1
+                    continue
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            self._stop.wait(min(wait, idle_wait))
+
+    def stop(self):
+        """Make run() return after the current poll."""
+        self._stop.set()
+
+    def stats(self) -> Dict:
+        """Listener counters and per-task state."""
+        return {
+            "polls": self.polls,
+            "rate_limited": self.rate_limited,
+            "paused_until": self._not_before,
+            "tasks": [task.to_dict() for task in sorted(self.tasks.values(), key=lambda t: t.next_due)]
+        }
@@ -0,0 +1,127 @@
+"""Packing keyword lists into as few combined search queries as possible.
+
+One search per keyword spends one request per keyword. ``plan_queries``
+bin-packs the keywords into ``(a OR b OR "c d")`` queries that still fit
+the provider's query-length limit once the since:/min_faves:/min_retweets:
+filters are appended. ``QueryPlan.attribute`` then works out locally which
+keywords each returned tweet matched.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import sys
+import os
+
+try:
+    from socialpulse.core.relevance import RelevanceMatcher, normalize_text
+except ImportError:
+    # If running directly from socialpulse directory
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.relevance import RelevanceMatcher, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Query length limit of the X search API
+DEFAULT_MAX_QUERY_LENGTH = 512
+
+_OR = " OR "
+
+def search_term(keyword: str) -> str:
+    """Keyword as a search term: phrases are quoted, single words are kept as they are."""
+    keyword = " ".join(keyword.split())
+    if " " in keyword and not (keyword.startswith('"') and keyword.endswith('"')):
+        return f'"{keyword}"'
+    return keyword
+
+@dataclass
+class QueryPlan:
+    """One combined search query and the keywords it covers."""
+    keywords: List[str]
+    terms: List[str]
+    _matcher: Optional[RelevanceMatcher] = field(default=None, repr=False, compare=False)
+
+    @property
+    def query(self) -> str:
+        """The combined query, parenthesized so filters appended after it apply to every term."""
+        if len(self.terms) == 1:
+            return self.terms[0]
+        return f"({_OR.join(self.terms)})"
+
+    @property
+    def matcher(self) -> RelevanceMatcher:
+        """Word-boundary matcher of this plan's keywords, built on first use."""
+        if self._matcher is None:
+            self._matcher = RelevanceMatcher((keyword.strip('"'), keyword, 1.0) for keyword in self.keywords)
+        return self._matcher
+
+    def attribute(self, tweets: Sequence[Dict], text_key: str = "text") -> List[List[str]]:
+        """
+        Keywords of this plan that each tweet mentions.
+
+        A tweet the API matched through something other than its text
+        (e.g. the author's name or a link) gets no keywords, except that a
+        single-keyword plan attributes every result to its keyword.
+
+        Args:
+            tweets: Tweets returned for this plan's query
+            text_key: Key holding the tweet text
+
+        Returns:
+            One list of keywords per tweet, in plan order
+        """
+        if len(self.keywords) == 1:
+            return [list(self.keywords) for _ in tweets]
+        order = {keyword: i for i, keyword in enumerate(self.keywords)}
+        return [
+            sorted(match.terms, key=order.get)
+            for match in self.matcher.match_batch([tweet.get(text_key) for tweet in tweets])
+        ]
+
+def plan_queries(keywords: Iterable[str], max_length: int = DEFAULT_MAX_QUERY_LENGTH,
+                 reserved: int = 0) -> List[QueryPlan]:
+    """
+    Pack keywords into the fewest OR queries that fit the length limit.
+
+    Keywords are de-duplicated case-insensitively and packed first-fit in
+    order of decreasing length. A keyword too long to share a query gets
+    a query of its own.
+
+    Args:
+        keywords: Keywords, hashtags or phrases
+        max_length: Maximum length of a full query, filters included
+        reserved: Characters taken by the filters appended to each query
+
+    Returns:
+        Query plans, ordered by the first keyword each covers
+    """
+    unique: Dict[str, str] = {}
+    for keyword in keywords:
+        keyword = " ".join(keyword.split())
+        if keyword:
+            unique.setdefault(normalize_text(keyword.strip('"')), keyword)
+    position = {keyword: i for i, keyword in enumerate(unique.values())}
+
+    budget = max_length - reserved - 2  # parentheses
+    bins: List[List[str]] = []
+    sizes: List[int] = []
+    for keyword in sorted(unique.values(), key=lambda k: (-len(search_term(k)), position[k])):
+        size = len(search_term(keyword))
+        if size > budget:
+            logger.warning(f"Keyword longer than the query limit, searched on its own: {keyword}")
+        for i, used in enumerate(sizes):
+            if used + len(_OR) + size <= budget:
+                bins[i].append(keyword)
+                sizes[i] += len(_OR) + size
+                break
+        else:
+            bins.append([keyword])
+            sizes.append(size)
+
+    plans = []
+    for keywords_in_bin in bins:
+        keywords_in_bin.sort(key=position.get)
+        plans.append(QueryPlan(keywords_in_bin, [search_term(k) for k in keywords_in_bin]))
+    plans.sort(key=lambda plan: position[plan.keywords[0]])
+    return plans
@@ -0,0 +1,232 @@
+"""Profile relevance matching for incoming posts.
+
+``RelevanceMatcher`` compiles the profile's keywords, hashtags and unique
+components into a single Aho-Corasick automaton, so a post is scanned once
+no matter how many terms the profile contains.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Separates texts in a batch scan; never part of a pattern, so matching restarts at it
+_SEPARATOR = "\x00"
+
+def normalize_text(text: str) -> str:
+    """Case-fold text and collapse runs of whitespace to single spaces."""
+    return " ".join(text.casefold().split())
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+@dataclass
+class RelevanceMatch:
+    """Result of scanning one text."""
+    score: float = 0.0
+    terms: Dict[str, int] = field(default_factory=dict)  # matched term -> occurrences
+
+    @property
+    def matched(self) -> bool:
+        return bool(self.terms)
+
+class RelevanceMatcher:
+    """Aho-Corasick multi-pattern matcher with weighted scoring.
+
+    Patterns are case-folded and whitespace-normalized, so multi-word
+    phrases match regardless of case or spacing. Matches must fall on word
+    boundaries ("defi" does not match inside "undefined"). The score of a
+    text is the sum of the weights of the distinct terms it contains.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, str, float]]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: (pattern, term, weight) triples; several patterns may
+                report the same term (e.g. "#defi" and "defi")
+        """
+        self.weights: Dict[str, float] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Per state: (term, pattern length) pairs ending there, including via fail links
+        self._out: List[List[Tuple[str, int]]] = [[]]
+
+        for pattern, term, weight in patterns:
+            pattern = normalize_text(pattern)
+            if not pattern:
+                continue
+            self.weights[term] = max(weight, self.weights.get(term, 0.0))
+            self._add(pattern, term)
+        self._build()
+
+    @classmethod
+    def from_profile(cls, profile: Dict, keyword_weight: float = 1.0, hashtag_weight: float = 1.5,
+                     component_weight: float = 2.0) -> "RelevanceMatcher":
+        """
+        Build a matcher from a profile.json dict.
+
+        Keywords and unique components are matched as phrases; hashtags match
+        both with and without the leading '#' and are reported as "#tag".
+
+        Args:
+            profile: Profile dict with keywords, hashtags and unique_components
+            keyword_weight: Weight of a keyword match
+            hashtag_weight: Weight of a hashtag match
+            component_weight: Weight of a unique component match
+
+        Returns:
+            RelevanceMatcher
+        """
+        patterns = []
+        for keyword in profile.get("keywords", []):
+            patterns.append((keyword, normalize_text(keyword), keyword_weight))
+        for hashtag in profile.get("hashtags", []):
+            tag = normalize_text(hashtag).lstrip("#")
+            if tag:
+                # '#' is not a word character, so the bare tag also matches "#tag"
+                patterns.append((tag, f"#{tag}", hashtag_weight))
+        for component in profile.get("unique_components", []):
+            patterns.append((component, normalize_text(component), component_weight))
+        return cls(patterns)
+
+    def _add(self, pattern: str, term: str):
+        state = 0
+        for c in pattern:
+            nxt = self._goto[state].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][c] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((term, len(pattern)))
+
+    def _build(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for c, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(c, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _scan(self, text: str, on_match):
+        """Run the automaton over normalized text, calling on_match(end, term) per bounded match."""
+        goto, fail, out = self._goto, self._fail, self._out
+        n = len(text)
+        state = 0
+        for i, c in enumerate(text):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if out[state]:
+                after_ok = i + 1 == n or not _is_word_char(text[i + 1])
+                for term, length in out[state]:
+                    start = i - length + 1
+                    # Require word boundaries around patterns that begin/end with word characters
+                    if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if _is_word_char(c) and not after_ok:
+                        continue
+                    on_match(i, term)
+
+    def match(self, text: Optional[str]) -> RelevanceMatch:
+        """
+        Scan one text.
+
+        Args:
+            text: Post text
+
+        Returns:
+            RelevanceMatch with matched terms and weighted score
+        """
+        result = RelevanceMatch()
+        if not text:
+            return result
+        terms = result.terms
+
+        def on_match(_, term):
+            terms[term] = terms.get(term, 0) + 1
+
+        self._scan(normalize_text(text), on_match)
+        result.score = sum((self.weights[t] for t in terms), 0.0)
+        return result
+
+    def score(self, text: Optional[str]) -> float:
+        """Weighted relevance score of one text."""
+        return self.match(text).score
+
+    def match_batch(self, texts: Sequence[Optional[str]]) -> List[RelevanceMatch]:
+        """
+        Scan many texts in one pass.
+
+        The texts are normalized and joined with a separator that resets the
+        automaton, then scanned as a single string; matches are attributed
+        back to their text by position.
+
+        Args:
+            texts: Post texts (None is treated as empty)
+
+        Returns:
+            One RelevanceMatch per text, in order
+        """
+        results = [RelevanceMatch() for _ in texts]
+        if not results:
+            return results
+
+        normalized = [normalize_text(t) if t else "" for t in texts]
+        ends = []
+        position = 0
+        for t in normalized:
+            position += len(t)
+            ends.append(position)
+            position += 1  # separator
+
+        current = [0]
+
+        def on_match(i, term):
+            index = current[0]
+            while ends[index] <= i:
+                index += 1
+            current[0] = index
+            terms = results[index].terms
+            terms[term] = terms.get(term, 0) + 1
+
+        self._scan(_SEPARATOR.join(normalized), on_match)
+
+        weights = self.weights
+        for result in results:
+            if result.terms:
+                result.score = sum((weights[t] for t in result.terms), 0.0)
+        return results
+
+    def filter_relevant(self, posts: Iterable[Dict], min_score: float = 1.0,
+                        text_key: str = "text") -> List[Dict]:
+        """
+        Keep the posts whose text scores at least min_score.
+
+        Each kept post is returned as a copy with 'relevance' (score) and
+        'matched_terms' added.
+
+        Args:
+            posts: Post dicts
+            min_score: Minimum relevance score
+            text_key: Key holding the post text
+
+        Returns:
+            Relevant posts, in input order
+        """
+        posts = list(posts)
+        relevant = []
+        for post, result in zip(posts, self.match_batch([p.get(text_key) for p in posts])):
+            if result.score >= min_score:
+                relevant.append({**post, "relevance": result.score, "matched_terms": result.terms})
+        return relevant
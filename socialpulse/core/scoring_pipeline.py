@@ -0,0 +1,283 @@
+"""Multi-process entity extraction and relevance scoring for large tweet backlogs.
+
+``ScoringPipeline`` splits tweet texts into shards and runs entity
+extraction, keyword matching (RelevanceMatcher) and profile similarity
+(VectorScorer) for each shard in a process pool. Each worker builds the
+matchers once from the profile when it starts. Only a shard's text
+buffer and offsets are sent to the worker, and the results come back as
+typed arrays and interned vocabularies instead of lists of dicts.
+Shards are merged in input order, so the result is the same for any
+number of workers.
+"""
+
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from socialpulse.core.relevance import RelevanceMatcher
+    from socialpulse.core.vector_relevance import VectorScorer
+    from socialpulse.models.tweet_batch import StringColumn, TweetBatch
+    from socialpulse.utils.entities import Entities, extract_entities_batch
+except ImportError:
+    # If running directly from socialpulse directory
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.relevance import RelevanceMatcher
+    from core.vector_relevance import VectorScorer
+    from models.tweet_batch import StringColumn, TweetBatch
+    from utils.entities import Entities, extract_entities_batch
+
+_ENTITY_KINDS = ("hashtags", "cashtags", "mentions")
+
+# Matchers of the current worker process, set by _init_worker()
+_worker_matcher: Optional[RelevanceMatcher] = None
+_worker_scorer: Optional[VectorScorer] = None
+
+class PackedStrings:
+    """Per-row lists of strings as one interned vocabulary plus flat id/offset arrays."""
+
+    __slots__ = ("vocab", "ids", "offsets", "_index")
+
+    def __init__(self):
+        self.vocab: List[str] = []
+        self.ids = array("I")
+        self.offsets = array("I", [0])
+        self._index: Dict[str, int] = {}
+
+    def __getstate__(self):
+        return self.vocab, self.ids, self.offsets
+
+    def __setstate__(self, state):
+        self.vocab, self.ids, self.offsets = state
+        self._index = {value: i for i, value in enumerate(self.vocab)}
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, values: Iterable[str]):
+        """Add one row."""
+        index = self._index
+        for value in values:
+            i = index.get(value)
+            if i is None:
+                i = index[value] = len(self.vocab)
+                self.vocab.append(value)
+            self.ids.append(i)
+        self.offsets.append(len(self.ids))
+
+    def row(self, i: int) -> List[str]:
+        """Strings of row i."""
+        vocab = self.vocab
+        return [vocab[v] for v in self.ids[self.offsets[i]:self.offsets[i + 1]]]
+
+    def extend(self, other: "PackedStrings"):
+        """Append all rows of another instance, remapping its vocabulary."""
+        index = self._index
+        mapping = array("I")
+        for value in other.vocab:
+            i = index.get(value)
+            if i is None:
+                i = index[value] = len(self.vocab)
+                self.vocab.append(value)
+            mapping.append(i)
+        shift = len(self.ids)
+        self.ids.extend(mapping[v] for v in other.ids)
+        self.offsets.extend(o + shift for o in other.offsets[1:])
+
+@dataclass
+class ScoredBatch:
+    """Scores and entities for a sequence of tweets, one row per input tweet.
+
+    ``terms``/``term_counts`` hold the RelevanceMatcher terms of each row
+    (counts are aligned with ``terms.ids``).
+    """
+    relevance: array = field(default_factory=lambda: array("d"))
+    similarity: array = field(default_factory=lambda: array("d"))
+    terms: PackedStrings = field(default_factory=PackedStrings)
+    term_counts: array = field(default_factory=lambda: array("I"))
+    hashtags: PackedStrings = field(default_factory=PackedStrings)
+    cashtags: PackedStrings = field(default_factory=PackedStrings)
+    mentions: PackedStrings = field(default_factory=PackedStrings)
+
+    def __len__(self) -> int:
+        return len(self.relevance)
+
+    def extend(self, other: "ScoredBatch"):
+        """Append the rows of another batch."""
+        self.relevance.extend(other.relevance)
+        self.similarity.extend(other.similarity)
+        self.terms.extend(other.terms)
+        self.term_counts.extend(other.term_counts)
+        for kind in _ENTITY_KINDS:
+            getattr(self, kind).extend(getattr(other, kind))
+
+    def matched_terms(self, i: int) -> Dict[str, int]:
+        """Keyword matches of row i as {term: occurrences}."""
+        start, stop = self.terms.offsets[i], self.terms.offsets[i + 1]
+        return dict(zip(self.terms.row(i), self.term_counts[start:stop]))
+
+    def entities(self, i: int) -> Entities:
+        """Normalized hashtags, cashtags and mentions of row i."""
+        return Entities(**{kind: getattr(self, kind).row(i) for kind in _ENTITY_KINDS})
+
+    def select(self, min_relevance: float = 0.0, min_similarity: float = 0.0) -> List[int]:
+        """Indices of rows reaching either threshold (a threshold of 0 is ignored)."""
+        return [
+            i for i, (relevance, similarity) in enumerate(zip(self.relevance, self.similarity))
+            if (min_relevance and relevance >= min_relevance) or (min_similarity and similarity >= min_similarity)
+        ]
+
+    def annotate(self, posts: Sequence[Dict], indices: Optional[Iterable[int]] = None) -> List[Dict]:
+        """
+        Copies of posts with 'relevance', 'similarity', 'matched_terms' and 'entities' added.
+
+        Args:
+            posts: The posts this batch was computed from, in the same order
+            indices: Rows to return (all rows if None)
+
+        Returns:
+            Annotated post dicts
+        """
+        indices = range(len(self)) if indices is None else indices
+        return [
+            {
+                **posts[i],
+                "relevance": self.relevance[i],
+                "similarity": self.similarity[i],
+                "matched_terms": self.matched_terms(i),
+                "entities": self.entities(i).to_dict()
+            }
+            for i in indices
+        ]
+
+def _init_worker(profile: Dict, scorer: Optional[VectorScorer]):
+    """Process pool initializer: build the profile matchers once per worker."""
+    global _worker_matcher, _worker_scorer
+    _worker_matcher = RelevanceMatcher.from_profile(profile)
+    _worker_scorer = scorer if scorer is not None else VectorScorer.from_profile(profile)
+
+def _score_texts(texts: Sequence[str], matcher: RelevanceMatcher, scorer: VectorScorer) -> ScoredBatch:
+    result = ScoredBatch()
+    for match in matcher.match_batch(texts):
+        result.relevance.append(match.score)
+        result.terms.append(match.terms)
+        result.term_counts.extend(match.terms.values())
+    result.similarity.extend(scorer.score_batch(texts))
+    for entities in extract_entities_batch(texts):
+        for kind in _ENTITY_KINDS:
+            getattr(result, kind).append(getattr(entities, kind))
+    return result
+
+def _score_shard(shard: Tuple[str, array]) -> ScoredBatch:
+    """Worker task: score one shard shipped as (text buffer, offsets)."""
+    buffer, offsets = shard
+    return _score_texts(list(StringColumn(buffer, offsets)), _worker_matcher, _worker_scorer)
+
+class ScoringPipeline:
+    """Shards texts across a process pool and merges the scored shards in order."""
+
+    def __init__(self, profile: Dict, workers: Optional[int] = None, shard_size: int = 2000,
+                 scorer: Optional[VectorScorer] = None):
+        """
+        Create the pipeline (the pool starts on first use).
+
+        Args:
+            profile: Profile dict the matchers are built from
+            workers: Worker processes (defaults to the CPU count; 1 scores in-process)
+            shard_size: Texts per shard sent to a worker
+            scorer: Optional pre-fitted VectorScorer to use instead of a fresh one from the profile
+        """
+        self.profile = profile
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.scorer = scorer
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._matcher: Optional[RelevanceMatcher] = None
+
+    def __enter__(self) -> "ScoringPipeline":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _local_score(self, texts: Sequence[str]) -> ScoredBatch:
+        if self._matcher is None:
+            self._matcher = RelevanceMatcher.from_profile(self.profile)
+            if self.scorer is None:
+                self.scorer = VectorScorer.from_profile(self.profile)
+        return _score_texts(texts, self._matcher, self.scorer)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.profile, self.scorer)
+            )
+        return self._pool
+
+    def score_texts(self, texts: Union[Sequence[Optional[str]], StringColumn]) -> ScoredBatch:
+        """
+        Score texts, in parallel when there is more than one shard.
+
+        Args:
+            texts: Post texts (None is treated as empty) or a TweetBatch text column
+
+        Returns:
+            ScoredBatch with one row per text, in input order
+        """
+        column = texts if isinstance(texts, StringColumn) else StringColumn.from_strings(texts)
+        n = len(column)
+        if self.workers <= 1 or n <= self.shard_size:
+            return self._local_score(list(column))
+
+        shards = []
+        for start in range(0, n, self.shard_size):
+            part = column.slice(start, min(n, start + self.shard_size))
+            shards.append((part.buffer, part.offsets))
+
+        result = ScoredBatch()
+        # map() yields in submission order, which makes the merge deterministic
+        for scored in self._get_pool().map(_score_shard, shards):
+            result.extend(scored)
+        return result
+
+    def score(self, tweets: Union[Sequence[Dict], TweetBatch], text_key: str = "text") -> ScoredBatch:
+        """
+        Score tweets given as dicts (raw or formatted) or as a TweetBatch.
+
+        Args:
+            tweets: Tweets to score
+            text_key: Key holding the text of dict tweets
+
+        Returns:
+            ScoredBatch with one row per tweet, in input order
+        """
+        if isinstance(tweets, TweetBatch):
+            return self.score_texts(tweets.texts)
+        return self.score_texts([tweet.get(text_key) for tweet in tweets])
+
+    def filter_relevant(self, tweets: Sequence[Dict], min_relevance: float = 1.0,
+                        min_similarity: float = 0.0) -> List[Dict]:
+        """
+        Score tweets and keep those reaching either threshold.
+
+        Args:
+            tweets: Tweet dicts
+            min_relevance: Minimum keyword relevance score (0 to ignore)
+            min_similarity: Minimum profile similarity (0 to ignore)
+
+        Returns:
+            Annotated copies of the kept tweets, in input order
+        """
+        scored = self.score(tweets)
+        return scored.annotate(tweets, scored.select(min_relevance, min_similarity))
@@ -1,10 +1,12 @@
 """Core trend analysis functionality."""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import sys
 import os
+import time
 
 # Add parent directory to sys.path
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -12,19 +14,35 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from social_connectors import BaseSocialConnector
-from models.trend import TrendTopic
+from models.trend import TrendTopic, ConnectorStatus, TrendFetchResult
+
+# Import through the package when available, so these modules are not loaded a second time
+try:
+    from socialpulse.core.trend_detector import TrendDetector
+    from socialpulse.core.trend_stats import compute_trend_stats, DEFAULT_PERCENTILES
+    from socialpulse.core.dedup import NearDuplicateFilter
+except ImportError:
+    # Bare names: the package directory is on sys.path (see above)
+    from core.trend_detector import TrendDetector
+    from core.trend_stats import compute_trend_stats, DEFAULT_PERCENTILES
+    from core.dedup import NearDuplicateFilter
 
 class TrendAnalyzer:
     """Analyzes trend data from various social platforms."""
     
-    def __init__(self, connectors: List[BaseSocialConnector]):
+    def __init__(self, connectors: List[BaseSocialConnector], detector: Optional[TrendDetector] = None,
+                 dedup: Optional[NearDuplicateFilter] = None):
         """
         Initialize trend analyzer with social connectors.
         
         Args:
             connectors: List of social media connectors
+            detector: Streaming trend detector fed by detect_trends() (created on first use)
+            dedup: Near-duplicate filter applied to tweets before detect_trends() counts them
         """
         self.connectors = connectors
+        self.detector = detector
+        self.dedup = dedup
     
     def get_trends(self, keywords: List[str]) -> List[TrendTopic]:
         """
@@ -40,64 +58,170 @@ class TrendAnalyzer:
         
         for connector in self.connectors:
             try:
-                # Get platform name from connector class
-                platform_name = connector.__class__.__name__.replace("Connector", "").lower()
-                
-                # Get trending topics
-                raw_trends = connector.get_trending_topics(keywords=keywords)
-                
-                # Convert to TrendTopic objects
-                for trend in raw_trends:
-                    if platform_name == "x":
-                        trend_topic = TrendTopic.from_x_data(trend)
-                    else:
-                        # Generic conversion for other platforms
-                        trend_topic = TrendTopic(
-                            name=trend.get("name", "Unknown trend"),
-                            volume=trend.get("volume"),
-                            platform=platform_name,
-                            metadata=trend
-                        )
-                    all_trends.append(trend_topic)
-                    
+                all_trends.extend(self._fetch_connector_trends(connector, keywords))
             except Exception as e:
                 print(f"Error getting trends from {connector.__class__.__name__}: {str(e)}")
                 
         return all_trends
     
-    def analyze_trend_volume(self, trends: List[TrendTopic]) -> Dict:
+    def get_trends_concurrent(self, keywords: List[str], timeout: float = 30.0,
+                              deadlines: Optional[Dict[str, float]] = None,
+                              max_workers: Optional[int] = None) -> TrendFetchResult:
+        """
+        Get trending topics from all connected platforms concurrently.
+        
+        Every connector is queried at once on a thread pool. Each one gets its
+        own deadline; whatever arrived in time is returned and connectors that
+        failed or are still running are reported in the per-connector statuses.
+        
+        Args:
+            keywords: List of keywords to filter trending topics
+            timeout: Default deadline in seconds for each connector
+            deadlines: Optional per-connector deadlines in seconds, keyed by
+                connector class name (e.g. {"XConnector": 5.0})
+            max_workers: Thread pool size (defaults to one thread per connector)
+            
+        Returns:
+            TrendFetchResult with the collected trends and per-connector status
+        """
+        result = TrendFetchResult()
+        if not self.connectors:
+            return result
+        
+        deadlines = deadlines or {}
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(self.connectors))
+        
+        pending = {}
+        for connector in self.connectors:
+            name = connector.__class__.__name__
+            key = name
+            suffix = 2
+            while key in result.statuses:
+                key = f"{name}#{suffix}"
+                suffix += 1
+            
+            result.statuses[key] = ConnectorStatus(connector=key)
+            future = executor.submit(self._timed_fetch, connector, keywords)
+            pending[future] = (key, started + deadlines.get(name, timeout))
+        
+        try:
+            while pending:
+                now = time.monotonic()
+                
+                # Give up on connectors whose deadline has passed
+                for future, (key, deadline) in list(pending.items()):
+                    if deadline <= now:
+                        future.cancel()
+                        status = result.statuses[key]
+                        status.status = "timeout"
+                        status.elapsed = now - started
+                        status.error = f"No response within {deadline - started:.2f}s"
+                        del pending[future]
+                
+                if not pending:
+                    break
+                
+                next_deadline = min(deadline for _, deadline in pending.values())
+                done, _ = wait(list(pending), timeout=max(0.0, next_deadline - now),
+                               return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    key, _ = pending.pop(future)
+                    status = result.statuses[key]
+                    try:
+                        trends, elapsed = future.result()
+                    except Exception as e:
+                        status.status = "error"
+                        status.elapsed = time.monotonic() - started
+                        status.error = str(e)
+                        continue
+                    status.status = "ok"
+                    status.elapsed = elapsed
+                    status.count = len(trends)
+                    result.trends.extend(trends)
+        finally:
+            # Don't block on stragglers; their results are simply discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        result.elapsed = time.monotonic() - started
+        return result
+    
+    def detect_trends(self, tweets: Optional[List[Dict]] = None, window: Optional[float] = None,
+                      top_k: int = 20, min_volume: int = 2) -> List[TrendTopic]:
+        """
+        Derive trending terms from tweets instead of relying on connector trend endpoints.
+        
+        Tweets are added to the analyzer's streaming detector, which keeps
+        counts across calls, and the current top terms of the window are returned.
+        If the analyzer has a dedup filter, near-duplicates of tweets already
+        seen (copy-paste spam, retweet chains) are dropped first.
+        
+        Args:
+            tweets: New raw or formatted tweets to consume (optional)
+            window: Window length in seconds (defaults to the detector's shortest window)
+            top_k: Maximum number of trends returned
+            min_volume: Minimum estimated count to report
+            
+        Returns:
+            List of TrendTopic objects with volume and acceleration metadata
+        """
+        if self.detector is None:
+            self.detector = TrendDetector()
+        if tweets and self.dedup is not None:
+            tweets = self.dedup.filter(tweets)
+        if tweets:
+            self.detector.add_batch(tweets)
+        return self.detector.trending(window=window, top_k=top_k, min_volume=min_volume)
+    
+    def _timed_fetch(self, connector: BaseSocialConnector, keywords: List[str]):
+        """Fetch trends from one connector and return them with the time taken."""
+        started = time.monotonic()
+        trends = self._fetch_connector_trends(connector, keywords)
+        return trends, time.monotonic() - started
+    
+    def _fetch_connector_trends(self, connector: BaseSocialConnector, keywords: List[str]) -> List[TrendTopic]:
+        """Get trending topics from a single connector as TrendTopic objects."""
+        # Get platform name from connector class
+        platform_name = connector.__class__.__name__.replace("Connector", "").lower()
+        
+        # Get trending topics
+        raw_trends = connector.get_trending_topics(keywords=keywords)
+        
+        # Convert to TrendTopic objects
+        trends = []
+        for trend in raw_trends:
+            if platform_name == "x":
+                trend_topic = TrendTopic.from_x_data(trend)
+            else:
+                # Generic conversion for other platforms
+                trend_topic = TrendTopic(
+                    name=trend.get("name", "Unknown trend"),
+                    volume=trend.get("volume"),
+                    platform=platform_name,
+                    metadata=trend
+                )
+            trends.append(trend_topic)
+        
+        return trends
+    
+    def analyze_trend_volume(self, trends: List[TrendTopic], top_k: int = 5,
+                             percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict:
         """
         Analyze trend volume data.
         
         Args:
             trends: List of TrendTopic objects
+            top_k: Number of highest-volume trends to include
+            percentiles: Volume percentiles (0-100) to report
             
         Returns:
-            Dictionary with trend volume analysis
+            Dictionary with trend volume analysis: totals, average, median,
+            percentiles, per-platform breakdown and the top trends
         """
         if not trends:
             return {"error": "No trends to analyze"}
         
-        # Sort trends by volume (descending)
-        sorted_trends = sorted(
-            [t for t in trends if t.volume is not None], 
-            key=lambda x: x.volume, 
-            reverse=True
-        )
-        
-        # Get top trends
-        top_trends = sorted_trends[:5] if len(sorted_trends) >= 5 else sorted_trends
-        
-        # Calculate total volume
-        total_volume = sum(t.volume for t in trends if t.volume is not None)
-        
-        # Calculate average volume
-        avg_volume = total_volume / len([t for t in trends if t.volume is not None]) if total_volume > 0 else 0
-        
-        return {
-            "total_trends": len(trends),
-            "total_volume": total_volume,
-            "average_volume": avg_volume,
-            "top_trends": [t.to_dict() for t in top_trends],
-            "timestamp": datetime.now().isoformat()
-        }
+        analysis = compute_trend_stats(trends, top_k=top_k, percentiles=percentiles).to_dict()
+        analysis["timestamp"] = datetime.now().isoformat()
+        return analysis
@@ -0,0 +1,252 @@
+"""Streaming trend detection over sliding time windows.
+
+Term counts are kept in Space-Saving summaries (Metwally et al.), one per
+time bucket, so memory is bounded by ``capacity`` entries per bucket no
+matter how many distinct hashtags, cashtags or keywords pass through.
+"""
+
+import heapq
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import sys
+import os
+
+try:
+    from socialpulse.models.trend import TrendTopic
+    from socialpulse.utils.entities import extract_entities_batch
+except ImportError:
+    # If running directly from socialpulse directory
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from models.trend import TrendTopic
+    from utils.entities import extract_entities_batch
+
+DEFAULT_WINDOWS = (5 * 60, 60 * 60, 24 * 60 * 60)
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter summary with a fixed number of counters.
+
+    When a new term arrives and all counters are taken, the term with the
+    smallest count is replaced and the new term inherits that count as its
+    error bound. Counts are therefore overestimates by at most ``error``.
+    """
+
+    __slots__ = ("capacity", "counts", "errors", "_heap")
+
+    def __init__(self, capacity: int = 200):
+        """
+        Args:
+            capacity: Maximum number of terms tracked
+        """
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # Lazy min-heap of (count, term); stale entries are skipped on pop
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, term: str, weight: int = 1):
+        """Count an occurrence of term."""
+        counts = self.counts
+        if term in counts:
+            counts[term] += weight
+        elif len(counts) < self.capacity:
+            counts[term] = weight
+            self.errors[term] = 0
+        else:
+            # Evict the current minimum
+            while True:
+                count, victim = heapq.heappop(self._heap)
+                if counts.get(victim) == count:
+                    break
+            del counts[victim]
+            del self.errors[victim]
+            counts[term] = count + weight
+            self.errors[term] = count
+        heapq.heappush(self._heap, (counts[term], term))
+
+        # Keep the lazy heap from growing without bound
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, t) for t, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+class SlidingWindowCounter:
+    """Approximate term counts over a sliding time window.
+
+    The window is split into ``buckets`` time buckets, each with its own
+    Space-Saving summary; two windows' worth of buckets are retained so the
+    previous window can be compared with the current one.
+    """
+
+    def __init__(self, window: float, buckets: int = 12, capacity: int = 200):
+        """
+        Args:
+            window: Window length in seconds
+            buckets: Number of buckets per window (time resolution)
+            capacity: Terms tracked per bucket
+        """
+        self.window = window
+        self.width = window / buckets
+        self.buckets = buckets
+        self.capacity = capacity
+        self._summaries: Dict[int, SpaceSaving] = {}
+
+    def add(self, term: str, timestamp: float, weight: int = 1):
+        """Count term at timestamp."""
+        index = int(timestamp // self.width)
+        summary = self._summaries.get(index)
+        if summary is None:
+            summary = self._summaries[index] = SpaceSaving(self.capacity)
+        summary.add(term, weight)
+
+    def expire(self, now: float):
+        """Drop buckets older than two windows."""
+        oldest = int(now // self.width) - 2 * self.buckets + 1
+        for index in [i for i in self._summaries if i < oldest]:
+            del self._summaries[index]
+
+    def counts(self, now: float, previous: bool = False) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Merged counts and error bounds for the window ending at now.
+
+        Args:
+            now: End of the window in seconds since epoch
+            previous: Return the window just before instead
+
+        Returns:
+            (counts, errors) dicts keyed by term
+        """
+        last = int(now // self.width) - (self.buckets if previous else 0)
+        first = last - self.buckets + 1
+        counts: Dict[str, int] = {}
+        errors: Dict[str, int] = {}
+        for index, summary in self._summaries.items():
+            if first <= index <= last:
+                for term, count in summary.counts.items():
+                    counts[term] = counts.get(term, 0) + count
+                    errors[term] = errors.get(term, 0) + summary.errors[term]
+        return counts, errors
+
+    @property
+    def size(self) -> int:
+        """Number of counters currently held."""
+        return sum(len(s) for s in self._summaries.values())
+
+class TrendDetector:
+    """Detects trending hashtags, cashtags and keywords from a tweet stream.
+
+    Tweets are reduced to terms ("#tag", "$tag" and, if a keyword matcher is
+    given, profile keywords) and counted in one SlidingWindowCounter per
+    window. trending() reports the top terms of a window as TrendTopic
+    objects with their volume and acceleration against the previous window.
+    """
+
+    def __init__(self, windows: Sequence[float] = DEFAULT_WINDOWS, capacity: int = 200,
+                 buckets: int = 12, keyword_matcher=None, platform: str = "x"):
+        """
+        Args:
+            windows: Window lengths in seconds (default 5 minutes, 1 hour, 24 hours)
+            capacity: Terms tracked per bucket; bounds memory per window
+            buckets: Buckets per window
+            keyword_matcher: Optional RelevanceMatcher whose matched terms are counted as keywords
+            platform: Platform name reported on emitted TrendTopics
+        """
+        self.counters = {window: SlidingWindowCounter(window, buckets, capacity) for window in windows}
+        self.keyword_matcher = keyword_matcher
+        self.platform = platform
+        self.tweets_seen = 0
+
+    @staticmethod
+    def _timestamp(tweet: Dict) -> float:
+        """Epoch timestamp of a raw (timestamp) or formatted (created_at) tweet."""
+        timestamp = tweet.get("timestamp")
+        if timestamp is not None:
+            return float(timestamp)
+        created_at = tweet.get("created_at")
+        if created_at:
+            return datetime.fromisoformat(created_at).timestamp()
+        return time.time()
+
+    def add_terms(self, terms: Iterable[str], timestamp: float, weight: int = 1):
+        """Count already extracted terms at timestamp in every window."""
+        terms = tuple(terms)
+        for counter in self.counters.values():
+            for term in terms:
+                counter.add(term, timestamp, weight)
+
+    def add(self, tweet: Dict):
+        """Consume one tweet."""
+        self.add_batch([tweet])
+
+    def add_batch(self, tweets: Sequence[Dict]):
+        """
+        Consume a batch of raw or formatted tweets.
+
+        Each term is counted at most once per tweet.
+
+        Args:
+            tweets: Tweet dicts with 'text' and 'timestamp' or 'created_at'
+        """
+        texts = [tweet.get("text") for tweet in tweets]
+        entities = extract_entities_batch(texts)
+        keywords = self.keyword_matcher.match_batch(texts) if self.keyword_matcher else [None] * len(tweets)
+
+        latest = 0.0
+        for tweet, tweet_entities, keyword_match in zip(tweets, entities, keywords):
+            terms = {f"#{tag}" for tag in tweet_entities.hashtags}
+            terms.update(f"#{tag.lstrip('#').casefold()}" for tag in tweet.get("hashtags") or ())
+            terms.update(f"${tag}" for tag in tweet_entities.cashtags)
+            if keyword_match is not None:
+                terms.update(keyword_match.terms)
+            timestamp = self._timestamp(tweet)
+            latest = max(latest, timestamp)
+            self.add_terms(terms, timestamp)
+        self.tweets_seen += len(tweets)
+
+        if latest:
+            for counter in self.counters.values():
+                counter.expire(latest)
+
+    def trending(self, window: Optional[float] = None, top_k: int = 20, now: Optional[float] = None,
+                 min_volume: int = 2) -> List[TrendTopic]:
+        """
+        Top terms of a window, highest volume first.
+
+        Args:
+            window: Window length in seconds (defaults to the shortest configured window)
+            top_k: Maximum number of trends returned
+            now: End of the window in seconds since epoch (defaults to now)
+            min_volume: Minimum estimated count to report
+
+        Returns:
+            TrendTopic list; metadata holds window, previous_volume,
+            acceleration (volume change per window), kind and error bound
+        """
+        window = window if window is not None else min(self.counters)
+        counter = self.counters[window]
+        now = time.time() if now is None else now
+
+        counts, errors = counter.counts(now)
+        previous, _ = counter.counts(now, previous=True)
+        top = heapq.nlargest(top_k, ((c, t) for t, c in counts.items() if c >= min_volume))
+
+        trends = []
+        for volume, term in top:
+            previous_volume = previous.get(term, 0)
+            trends.append(TrendTopic(
+                name=term,
+                volume=volume,
+                platform=self.platform,
+                timestamp=datetime.fromtimestamp(now),
+                metadata={
+                    "window": window,
+                    "previous_volume": previous_volume,
+                    "acceleration": volume - previous_volume,
+                    "kind": {"#": "hashtag", "$": "cashtag"}.get(term[:1], "keyword"),
+                    "error": errors.get(term, 0)
+                }
+            ))
+        return trends
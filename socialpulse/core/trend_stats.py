@@ -0,0 +1,141 @@
+"""Single-pass trend volume statistics."""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import sys
+import os
+
+try:
+    from socialpulse.models.trend import TrendTopic
+except ImportError:
+    # If running directly from socialpulse directory
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from models.trend import TrendTopic
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Percentile of already sorted values using linear interpolation.
+
+    Args:
+        sorted_values: Values in ascending order
+        q: Percentile between 0 and 100
+
+    Returns:
+        Interpolated percentile (0.0 for no values)
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+@dataclass
+class PlatformStats:
+    """Volume totals for one platform."""
+    trends: int = 0
+    with_volume: int = 0
+    total_volume: int = 0
+
+    @property
+    def average_volume(self) -> float:
+        return self.total_volume / self.with_volume if self.with_volume else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation."""
+        return {
+            "trends": self.trends,
+            "with_volume": self.with_volume,
+            "total_volume": self.total_volume,
+            "average_volume": self.average_volume
+        }
+
+@dataclass
+class TrendStats:
+    """Summary statistics over a set of trends."""
+    total_trends: int = 0
+    with_volume: int = 0
+    total_volume: int = 0
+    average_volume: float = 0.0
+    median_volume: float = 0.0
+    percentiles: Dict[str, float] = field(default_factory=dict)
+    platforms: Dict[str, PlatformStats] = field(default_factory=dict)
+    top_trends: List[TrendTopic] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation."""
+        return {
+            "total_trends": self.total_trends,
+            "with_volume": self.with_volume,
+            "total_volume": self.total_volume,
+            "average_volume": self.average_volume,
+            "median_volume": self.median_volume,
+            "percentiles": self.percentiles,
+            "platforms": {name: p.to_dict() for name, p in self.platforms.items()},
+            "top_trends": [t.to_dict() for t in self.top_trends]
+        }
+
+def compute_trend_stats(trends: Iterable[TrendTopic], top_k: int = 5,
+                        percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> TrendStats:
+    """
+    Compute volume statistics for trends in a single pass.
+
+    Totals, per-platform breakdowns and the top-k (kept in a bounded heap,
+    so no full sort of the trends) are gathered in one plain Python loop.
+    Volumes are collected in a list that is sorted once, in place, for
+    median and percentiles. Trends without a volume count towards totals
+    only.
+
+    Args:
+        trends: TrendTopic objects (any iterable, consumed once)
+        top_k: Number of highest-volume trends to return
+        percentiles: Percentiles (0-100) to report
+
+    Returns:
+        TrendStats
+    """
+    stats = TrendStats()
+    volumes: List[int] = []
+    heap: List[Tuple[int, int, TrendTopic]] = []
+    platforms = stats.platforms
+
+    for index, trend in enumerate(trends):
+        platform = platforms.get(trend.platform)
+        if platform is None:
+            platform = platforms[trend.platform] = PlatformStats()
+        platform.trends += 1
+        stats.total_trends += 1
+
+        volume = trend.volume
+        if volume is None:
+            continue
+        volumes.append(volume)
+        platform.with_volume += 1
+        platform.total_volume += volume
+
+        # Ties keep input order: earlier trends win (larger negated index)
+        if top_k > 0:
+            entry = (volume, -index, trend)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    stats.with_volume = len(volumes)
+    stats.total_volume = sum(volumes)
+    stats.average_volume = stats.total_volume / stats.with_volume if stats.total_volume > 0 else 0
+
+    if volumes:
+        # One C-level sort serves every percentile; selecting each rank separately
+        # (heapq.nsmallest, statistics.quantiles) would not be cheaper
+        volumes.sort()
+        stats.median_volume = percentile(volumes, 50)
+        stats.percentiles = {f"p{q:g}": percentile(volumes, q) for q in percentiles}
+
+    stats.top_trends = [entry[2] for entry in sorted(heap, key=lambda e: e[:2], reverse=True)]
+    return stats
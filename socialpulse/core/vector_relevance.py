@@ -0,0 +1,282 @@
+"""Offline semantic relevance scoring against the project profile.
+
+``VectorScorer`` embeds the profile's description, core value, unique
+components and keywords into a hashed TF-IDF vector and scores posts by
+cosine similarity. Besides whole words, features include character n-grams
+of each word and exact word pairs, so "traceable code" still scores against
+"code traceability" without an exact keyword hit. Nothing leaves the process.
+"""
+
+import math
+import re
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_TOKEN_RE = re.compile(r"\w+")
+
+STOPWORDS = frozenset((
+    "a", "about", "all", "also", "an", "and", "any", "are", "as", "at", "be", "been", "but", "by",
+    "can", "do", "does", "for", "from", "get", "has", "have", "how", "i", "if", "in", "into", "is",
+    "it", "its", "just", "more", "my", "no", "not", "now", "of", "on", "or", "our", "out", "so",
+    "than", "that", "the", "their", "them", "then", "there", "these", "they", "this", "to", "up",
+    "us", "was", "we", "what", "when", "which", "who", "will", "with", "you", "your",
+    "rt", "amp", "https", "http", "co", "t",
+))
+
+# Profile fields embedded by from_profile() and their default weights
+PROFILE_FIELDS = (
+    ("short_description", 1.0),
+    ("core_value", 1.0),
+    ("unique_components", 1.5),
+    ("keywords", 2.0),
+)
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Case-folded word tokens of a text, without stopwords, numbers and single characters."""
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_RE.findall(text.casefold())
+        if len(token) > 1 and token not in STOPWORDS and not token.isdigit()
+    ]
+
+class VectorScorer:
+    """Hashed TF-IDF cosine similarity between posts and a fixed set of reference texts.
+
+    Word and character n-gram features are hashed (CRC-32) into
+    ``n_features`` buckets, so memory does not grow with the vocabulary.
+    The reference vector is built once. Each distinct token's dot product
+    with it and its weighted features are cached, so scoring a post is a
+    sparse dot product over its tokens plus one pass over their features
+    for the exact post norm (tokens can share n-gram or hash buckets).
+    """
+
+    def __init__(self, documents: Iterable[Tuple[str, float]], n_features: int = 1 << 18,
+                 ngram: int = 4, ngram_weight: float = 0.5, bigram_weight: float = 1.0,
+                 cache_size: int = 200000):
+        """
+        Build the scorer.
+
+        Args:
+            documents: (text, weight) pairs describing what is relevant
+            n_features: Number of hash buckets
+            ngram: Character n-gram length (0 disables n-gram features)
+            ngram_weight: Total weight of a word's n-grams relative to the word itself
+            bigram_weight: Weight of an adjacent word pair
+            cache_size: Maximum number of cached token contributions
+        """
+        self.documents = [(text, weight) for text, weight in documents if text]
+        self.n_features = n_features
+        self.ngram = ngram
+        self.ngram_weight = ngram_weight
+        self.bigram_weight = bigram_weight
+        self.cache_size = cache_size
+        # Hashed document frequencies, filled by fit()
+        self.num_documents = 0
+        self._df = array("I", bytes(4 * n_features))
+        self._reset()
+
+    @classmethod
+    def from_profile(cls, profile: Dict, fields: Sequence[Tuple[str, float]] = PROFILE_FIELDS,
+                     **kwargs) -> "VectorScorer":
+        """
+        Build a scorer from a profile.json dict.
+
+        Args:
+            profile: Profile dict
+            fields: (field, weight) pairs to embed; list fields contribute each entry
+            **kwargs: Passed to the constructor
+
+        Returns:
+            VectorScorer
+        """
+        documents = []
+        for name, weight in fields:
+            value = profile.get(name)
+            if isinstance(value, str):
+                documents.append((value, weight))
+            elif value:
+                documents.extend((item, weight) for item in value if isinstance(item, str))
+        return cls(documents, **kwargs)
+
+    def _reset(self):
+        """Drop everything derived from the document frequencies."""
+        self._idf_cache: Dict[int, float] = {}
+        self._token_cache: Dict[str, Tuple[float, array, array]] = {}
+        self._profile: Optional[Dict[int, float]] = None
+        self._profile_bigrams: Optional[Dict[Tuple[str, str], float]] = None
+
+    def __getstate__(self) -> Dict:
+        # Caches are rebuilt on demand, so they are not shipped to worker processes
+        state = self.__dict__.copy()
+        for name in ("_idf_cache", "_token_cache", "_profile", "_profile_bigrams"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._reset()
+
+    def _hash(self, feature: str) -> int:
+        return zlib.crc32(feature.encode("utf-8")) % self.n_features
+
+    def _idf(self, index: int) -> float:
+        idf = self._idf_cache.get(index)
+        if idf is None:
+            idf = math.log((1 + self.num_documents) / (1 + self._df[index])) + 1.0
+            self._idf_cache[index] = idf
+        return idf
+
+    def _raw_features(self, token: str) -> Dict[int, float]:
+        """Hashed features of one token before IDF: the word plus its character n-grams."""
+        features = {self._hash(token): 1.0}
+        n = self.ngram
+        if n and len(token) > n:
+            padded = f"<{token}>"
+            grams = [padded[i:i + n] for i in range(len(padded) - n + 1)]
+            weight = self.ngram_weight / len(grams)
+            for gram in grams:
+                index = self._hash(gram)
+                features[index] = features.get(index, 0.0) + weight
+        return features
+
+    def _weighted_features(self, token: str) -> Dict[int, float]:
+        idf = self._idf
+        return {index: value * idf(index) for index, value in self._raw_features(token).items()}
+
+    def fit(self, texts: Iterable[Optional[str]]) -> "VectorScorer":
+        """
+        Learn document frequencies from a background corpus (e.g. a day of tweets).
+
+        Can be called repeatedly to accumulate more text. Before any fit,
+        every feature has the same IDF.
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            self
+        """
+        df = self._df
+        for text in texts:
+            seen = set()
+            for token in set(tokenize(text)):
+                seen.update(self._raw_features(token))
+            for index in seen:
+                df[index] += 1
+            self.num_documents += 1
+        self._reset()
+        return self
+
+    def _build_profile(self):
+        vector: Dict[int, float] = {}
+        bigrams: Dict[Tuple[str, str], float] = {}
+        for text, weight in self.documents:
+            tokens = tokenize(text)
+            for token in tokens:
+                for index, value in self._weighted_features(token).items():
+                    vector[index] = vector.get(index, 0.0) + weight * value
+            for pair in zip(tokens, tokens[1:]):
+                bigrams[pair] = bigrams.get(pair, 0.0) + weight * self.bigram_weight
+        norm = math.sqrt(sum(v * v for v in vector.values()) + sum(v * v for v in bigrams.values())) or 1.0
+        self._profile = {index: value / norm for index, value in vector.items()}
+        self._profile_bigrams = {pair: value / norm for pair, value in bigrams.items()}
+
+    @property
+    def profile_vector(self) -> Dict[int, float]:
+        """Unit-length hashed reference vector (feature index -> weight), built on first use."""
+        if self._profile is None:
+            self._build_profile()
+        return self._profile
+
+    def _token_entry(self, token: str) -> Tuple[float, array, array]:
+        """(dot product with the profile, feature indices, feature values) of one token."""
+        profile = self.profile_vector
+        features = self._weighted_features(token)
+        dot = sum(value * profile.get(index, 0.0) for index, value in features.items())
+        if len(self._token_cache) >= self.cache_size:
+            self._token_cache.clear()
+        entry = self._token_cache[token] = (dot, array("I", features), array("d", features.values()))
+        return entry
+
+    def score(self, text: Optional[str]) -> float:
+        """Cosine similarity (0-1) of one text to the profile."""
+        return self.score_batch([text])[0]
+
+    def score_batch(self, texts: Sequence[Optional[str]]) -> List[float]:
+        """
+        Score many texts.
+
+        Args:
+            texts: Post texts (None scores 0)
+
+        Returns:
+            One cosine similarity (0-1) per text, in order
+        """
+        if self._profile is None:
+            self._build_profile()
+        cache = self._token_cache
+        token_entry = self._token_entry
+        bigrams = self._profile_bigrams
+        bigram_weight = self.bigram_weight
+        bigram_sq = bigram_weight * bigram_weight
+        sqrt = math.sqrt
+
+        scores = []
+        for text in texts:
+            tokens = tokenize(text)
+            if not tokens:
+                scores.append(0.0)
+                continue
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+
+            dot = 0.0
+            vector: Dict[int, float] = {}
+            get = vector.get
+            for token, count in counts.items():
+                entry = cache.get(token) or token_entry(token)
+                # Sublinear term frequency
+                tf = 1.0 + math.log(count) if count > 1 else 1.0
+                dot += tf * entry[0]
+                for index, value in zip(entry[1], entry[2]):
+                    vector[index] = get(index, 0.0) + tf * value
+            sq = sum(value * value for value in vector.values())
+            if bigram_weight:
+                pairs: Dict[Tuple[str, str], int] = {}
+                for pair in zip(tokens, tokens[1:]):
+                    pairs[pair] = pairs.get(pair, 0) + 1
+                    weight = bigrams.get(pair)
+                    if weight is not None:
+                        dot += bigram_weight * weight
+                sq += bigram_sq * sum(count * count for count in pairs.values())
+            scores.append(dot / sqrt(sq) if dot > 0.0 else 0.0)
+        return scores
+
+    def rank(self, posts: Iterable[Dict], min_score: float = 0.0, top_k: Optional[int] = None,
+             text_key: str = "text") -> List[Dict]:
+        """
+        Rank posts by similarity to the profile.
+
+        Each returned post is a copy with 'similarity' added.
+
+        Args:
+            posts: Post dicts
+            min_score: Minimum similarity to keep a post
+            top_k: Maximum number of posts returned
+            text_key: Key holding the post text
+
+        Returns:
+            Posts sorted by descending similarity (ties keep input order)
+        """
+        posts = list(posts)
+        scored = [
+            (score, i) for i, score in enumerate(self.score_batch([p.get(text_key) for p in posts]))
+            if score >= min_score
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        if top_k is not None:
+            scored = scored[:top_k]
+        return [{**posts[i], "similarity": score} for score, i in scored]
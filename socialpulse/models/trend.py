@@ -1,6 +1,6 @@
 """Trend model for social media topics."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -37,3 +37,43 @@ class TrendTopic:
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata
         }
+
+@dataclass
+class ConnectorStatus:
+    """Outcome of querying a single connector during a trend fan-out."""
+    connector: str
+    status: str = "pending"  # "ok", "error" or "timeout"
+    elapsed: Optional[float] = None
+    count: int = 0
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation."""
+        return {
+            "connector": self.connector,
+            "status": self.status,
+            "elapsed": self.elapsed,
+            "count": self.count,
+            "error": self.error
+        }
+
+@dataclass
+class TrendFetchResult:
+    """Trends collected from a concurrent fan-out plus per-connector status."""
+    trends: List[TrendTopic] = field(default_factory=list)
+    statuses: Dict[str, ConnectorStatus] = field(default_factory=dict)
+    elapsed: float = 0.0
+    
+    @property
+    def complete(self) -> bool:
+        """True if every connector answered successfully before its deadline."""
+        return all(s.status == "ok" for s in self.statuses.values())
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary representation."""
+        return {
+            "trends": [t.to_dict() for t in self.trends],
+            "statuses": {name: s.to_dict() for name, s in self.statuses.items()},
+            "elapsed": self.elapsed,
+            "complete": self.complete
+        }
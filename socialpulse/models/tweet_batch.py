@@ -0,0 +1,340 @@
+"""Columnar tweet batch model.
+
+A ``TweetBatch`` holds many tweets as parallel typed arrays instead of one
+dict per tweet. Numeric fields live in ``array.array`` columns, text and
+URLs are stored in a single string buffer indexed by offsets, and authors
+and hashtags are interned into per-batch vocabularies.
+"""
+
+import sys
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    from socialpulse.utils.entities import extract_entities_batch
+except ImportError:
+    from utils.entities import extract_entities_batch
+
+class StringColumn:
+    """Offset-indexed string column: one buffer plus n+1 offsets."""
+
+    __slots__ = ("buffer", "offsets")
+
+    def __init__(self, buffer: str = "", offsets: Optional[array] = None):
+        self.buffer = buffer
+        self.offsets = offsets if offsets is not None else array("Q", [0])
+
+    @classmethod
+    def from_strings(cls, values: Iterable[Optional[str]]) -> "StringColumn":
+        """Build a column from an iterable of strings (None is stored as empty)."""
+        parts = []
+        offsets = array("Q", [0])
+        position = 0
+        for value in values:
+            value = value or ""
+            parts.append(value)
+            position += len(value)
+            offsets.append(position)
+        return cls("".join(parts), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.buffer[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        buffer, offsets = self.buffer, self.offsets
+        for i in range(len(offsets) - 1):
+            yield buffer[offsets[i]:offsets[i + 1]]
+
+    def slice(self, start: int, stop: int) -> "StringColumn":
+        """Contiguous rows [start, stop) as a new column."""
+        base = self.offsets[start]
+        offsets = array("Q", (o - base for o in self.offsets[start:stop + 1]))
+        return StringColumn(self.buffer[base:self.offsets[stop]], offsets)
+
+    def take(self, indices: Sequence[int]) -> "StringColumn":
+        """Rows at the given indices as a new column."""
+        return StringColumn.from_strings(self[i] for i in indices)
+
+    @classmethod
+    def concat(cls, columns: Sequence["StringColumn"]) -> "StringColumn":
+        """Concatenate columns end to end."""
+        offsets = array("Q", [0])
+        shift = 0
+        for column in columns:
+            offsets.extend(o + shift for o in column.offsets[1:])
+            shift += len(column.buffer)
+        return cls("".join(c.buffer for c in columns), offsets)
+
+class TweetBatch:
+    """Array-backed batch of tweets.
+
+    Columns:
+    - ids, timestamps (epoch seconds), likes, retweets, replies, views: typed arrays
+    - author_ids: indices into ``authors``, the interned author vocabulary
+    - texts, urls: offset-indexed string columns
+    - hashtag_ids/hashtag_offsets: flattened indices into ``hashtags`` per tweet
+
+    Tweet ids that are not numeric are stored as 0.
+    """
+
+    NUMERIC_COLUMNS = ("ids", "timestamps", "likes", "retweets", "replies", "views", "author_ids")
+
+    def __init__(self):
+        """Create an empty batch."""
+        self.ids = array("Q")
+        self.timestamps = array("q")
+        self.author_ids = array("I")
+        self.likes = array("Q")
+        self.retweets = array("Q")
+        self.replies = array("Q")
+        self.views = array("Q")
+        self.texts = StringColumn()
+        self.urls = StringColumn()
+        self.hashtag_ids = array("I")
+        self.hashtag_offsets = array("Q", [0])
+        self.authors: List[str] = []
+        self.hashtags: List[str] = []
+        self._author_index: Dict[str, int] = {}
+        self._hashtag_index: Dict[str, int] = {}
+
+    @staticmethod
+    def _int(value) -> int:
+        try:
+            return max(0, int(value or 0))
+        except (TypeError, ValueError):
+            return 0
+
+    def _intern_author(self, author: str) -> int:
+        index = self._author_index.get(author)
+        if index is None:
+            index = self._author_index[author] = len(self.authors)
+            self.authors.append(sys.intern(author))
+        return index
+
+    def _intern_hashtag(self, tag: str) -> int:
+        index = self._hashtag_index.get(tag)
+        if index is None:
+            index = self._hashtag_index[tag] = len(self.hashtags)
+            self.hashtags.append(sys.intern(tag))
+        return index
+
+    @classmethod
+    def from_raw(cls, tweets: Iterable[Dict]) -> "TweetBatch":
+        """
+        Build a batch from raw API tweets (the ``user-tweets``/``search`` payload format).
+
+        Args:
+            tweets: Raw tweet dicts with id, text, timestamp, username, likes, ... fields
+
+        Returns:
+            TweetBatch holding the tweets in input order
+        """
+        tweets = list(tweets)
+        texts = [tweet.get("text") or "" for tweet in tweets]
+        entities = extract_entities_batch(texts, normalize=False)
+        
+        batch = cls()
+        urls = []
+        for tweet, tweet_entities in zip(tweets, entities):
+            hashtags = tweet.get("hashtags") or tweet_entities.hashtags
+            batch._append(
+                tweet.get("id"), tweet.get("timestamp"), tweet.get("username"),
+                tweet.get("likes"), tweet.get("retweets"), tweet.get("replies"), tweet.get("views"),
+                hashtags
+            )
+            urls.append(tweet.get("permanentUrl"))
+        batch.texts = StringColumn.from_strings(texts)
+        batch.urls = StringColumn.from_strings(urls)
+        return batch
+
+    @classmethod
+    def from_dicts(cls, tweets: Iterable[Dict]) -> "TweetBatch":
+        """
+        Build a batch from tweets in the formatted dict structure returned by
+        XConnector.get_account_tweets().
+
+        Args:
+            tweets: Formatted tweet dicts (id, text, created_at, author, metrics, hashtags, url)
+
+        Returns:
+            TweetBatch holding the tweets in input order
+        """
+        batch = cls()
+        texts, urls = [], []
+        for tweet in tweets:
+            metrics = tweet.get("metrics") or {}
+            created_at = tweet.get("created_at")
+            timestamp = int(datetime.fromisoformat(created_at).timestamp()) if created_at else 0
+            batch._append(
+                tweet.get("id"), timestamp, tweet.get("author"),
+                metrics.get("likes"), metrics.get("retweets"), metrics.get("replies"), metrics.get("views"),
+                tweet.get("hashtags") or []
+            )
+            texts.append(tweet.get("text"))
+            urls.append(tweet.get("url"))
+        batch.texts = StringColumn.from_strings(texts)
+        batch.urls = StringColumn.from_strings(urls)
+        return batch
+
+    def _append(self, tweet_id, timestamp, author, likes, retweets, replies, views, hashtags):
+        """Append the non-string columns of one tweet (texts/urls are built by the caller)."""
+        self.ids.append(self._int(tweet_id))
+        self.timestamps.append(self._int(timestamp))
+        self.author_ids.append(self._intern_author(author or ""))
+        self.likes.append(self._int(likes))
+        self.retweets.append(self._int(retweets))
+        self.replies.append(self._int(replies))
+        self.views.append(self._int(views))
+        for tag in hashtags:
+            self.hashtag_ids.append(self._intern_hashtag(tag))
+        self.hashtag_offsets.append(len(self.hashtag_ids))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Dict, "TweetBatch"]:
+        """Index returns one tweet as a dict; a slice returns a new TweetBatch."""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return self.take(range(start, stop, step))
+            return self._slice(start, max(start, stop))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("TweetBatch index out of range")
+        return self.to_dict(key)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self.to_dict(i)
+
+    def author(self, i: int) -> str:
+        """Author username of tweet i."""
+        return self.authors[self.author_ids[i]]
+
+    def hashtags_of(self, i: int) -> List[str]:
+        """Hashtags of tweet i."""
+        vocab = self.hashtags
+        return [vocab[h] for h in self.hashtag_ids[self.hashtag_offsets[i]:self.hashtag_offsets[i + 1]]]
+
+    def _empty_like(self) -> "TweetBatch":
+        """New empty batch sharing this batch's author and hashtag vocabularies."""
+        batch = TweetBatch()
+        batch.authors, batch._author_index = self.authors, self._author_index
+        batch.hashtags, batch._hashtag_index = self.hashtags, self._hashtag_index
+        return batch
+
+    def _slice(self, start: int, stop: int) -> "TweetBatch":
+        batch = self._empty_like()
+        for name in self.NUMERIC_COLUMNS:
+            setattr(batch, name, getattr(self, name)[start:stop])
+        batch.texts = self.texts.slice(start, stop)
+        batch.urls = self.urls.slice(start, stop)
+        first, last = self.hashtag_offsets[start], self.hashtag_offsets[stop]
+        batch.hashtag_ids = self.hashtag_ids[first:last]
+        batch.hashtag_offsets = array("Q", (o - first for o in self.hashtag_offsets[start:stop + 1]))
+        return batch
+
+    def take(self, indices: Iterable[int]) -> "TweetBatch":
+        """
+        Rows at the given indices, in that order, as a new batch.
+
+        Args:
+            indices: Row indices
+
+        Returns:
+            New TweetBatch sharing this batch's vocabularies
+        """
+        indices = list(indices)
+        batch = self._empty_like()
+        for name in self.NUMERIC_COLUMNS:
+            column = getattr(self, name)
+            setattr(batch, name, array(column.typecode, (column[i] for i in indices)))
+        batch.texts = self.texts.take(indices)
+        batch.urls = self.urls.take(indices)
+        offsets = self.hashtag_offsets
+        for i in indices:
+            batch.hashtag_ids.extend(self.hashtag_ids[offsets[i]:offsets[i + 1]])
+            batch.hashtag_offsets.append(len(batch.hashtag_ids))
+        return batch
+
+    def filter(self, mask: Iterable[bool]) -> "TweetBatch":
+        """
+        Rows where mask is true, as a new batch.
+
+        Args:
+            mask: One boolean per row, e.g. ``(t >= since for t in batch.timestamps)``
+
+        Returns:
+            New TweetBatch with the selected rows
+        """
+        return self.take(i for i, keep in enumerate(mask) if keep)
+
+    def since(self, timestamp: int) -> "TweetBatch":
+        """Tweets at or after the given epoch timestamp."""
+        return self.filter(t >= timestamp for t in self.timestamps)
+
+    @classmethod
+    def concat(cls, batches: Sequence["TweetBatch"]) -> "TweetBatch":
+        """
+        Concatenate batches end to end, merging their vocabularies.
+
+        Args:
+            batches: Batches to concatenate
+
+        Returns:
+            New TweetBatch
+        """
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return cls()
+
+        batch = cls()
+        for part in batches:
+            author_map = array("I", (batch._intern_author(a) for a in part.authors))
+            hashtag_map = array("I", (batch._intern_hashtag(h) for h in part.hashtags))
+            for name in ("ids", "timestamps", "likes", "retweets", "replies", "views"):
+                getattr(batch, name).extend(getattr(part, name))
+            batch.author_ids.extend(author_map[a] for a in part.author_ids)
+            shift = len(batch.hashtag_ids)
+            batch.hashtag_ids.extend(hashtag_map[h] for h in part.hashtag_ids)
+            batch.hashtag_offsets.extend(o + shift for o in part.hashtag_offsets[1:])
+        batch.texts = StringColumn.concat([b.texts for b in batches])
+        batch.urls = StringColumn.concat([b.urls for b in batches])
+        return batch
+
+    def to_dict(self, i: int) -> Dict:
+        """Tweet i in the formatted dict structure used by XConnector.get_account_tweets()."""
+        return {
+            "id": str(self.ids[i]),
+            "text": self.texts[i],
+            "created_at": datetime.fromtimestamp(self.timestamps[i]).isoformat(),
+            "author": self.author(i),
+            "metrics": {
+                "likes": self.likes[i],
+                "retweets": self.retweets[i],
+                "replies": self.replies[i],
+                "views": self.views[i]
+            },
+            "hashtags": self.hashtags_of(i),
+            "url": self.urls[i] or None
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """All tweets in the formatted dict structure."""
+        return [self.to_dict(i) for i in range(len(self))]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the column data (excluding vocabularies)."""
+        arrays = [getattr(self, name) for name in self.NUMERIC_COLUMNS]
+        arrays += [self.hashtag_ids, self.hashtag_offsets, self.texts.offsets, self.urls.offsets]
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + sys.getsizeof(self.texts.buffer) + sys.getsizeof(self.urls.buffer)
+        )
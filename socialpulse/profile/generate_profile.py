@@ -7,24 +7,49 @@ a structured profile.json file containing key information about the entity.
 """
 
 import os
+import re
+import sys
 import json
+import time
+import hashlib
+import random
 import argparse
-from typing import Dict, List, Any, Optional
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain
+from pathlib import Path
+from typing import Deque, Dict, List, Any, Optional, Iterable, Iterator
 import logging
 
-# LangChain imports
+# LangChain imports; the OpenAI client, chains, output parsers, splitters and
+# document loaders are imported where they are used to keep startup fast
 from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain.chains import LLMChain
-from langchain.output_parsers import PydanticOutputParser
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.language_models.llms import LLM
 from langchain_core.pydantic_v1 import BaseModel, Field, validator
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import TextLoader, PyPDFLoader
+
+try:
+    from socialpulse.utils.cache import ResponseCache
+    from socialpulse.utils.metrics import REGISTRY, Stopwatch, timed_iter
+    from socialpulse.cli import add_profile_arguments
+except ImportError:
+    # If running directly from the profile directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from utils.cache import ResponseCache
+    from utils.metrics import REGISTRY, Stopwatch, timed_iter
+    from cli import add_profile_arguments
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Whole-run stage durations reach minutes for long documents
+STAGE_BUCKETS = (0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Chunking: paragraphs first, then lines, words and characters
+CHUNK_SEPARATORS = ["\n\n", "\n", " ", ""]
+CHUNK_OVERLAP = 200
+
 # Define the profile schema using Pydantic
 class ProjectProfile(BaseModel):
     """Schema for a project profile extracted from text."""
@@ -64,6 +89,8 @@ class ProjectProfile(BaseModel):
 
 def load_document(file_path: str) -> str:
     """Load a document from a file path."""
+    from langchain_community.document_loaders import TextLoader, PyPDFLoader
+    
     logger.info(f"Loading document from {file_path}")
     
     file_extension = os.path.splitext(file_path)[1].lower()
@@ -83,18 +110,224 @@ def load_document(file_path: str) -> str:
 
 def chunk_text(text: str, chunk_size: int = 4000) -> List[str]:
     """Split text into manageable chunks."""
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    
     logger.info(f"Splitting text into chunks of ~{chunk_size} characters")
     
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
-        chunk_overlap=200,
-        length_function=len
+        chunk_overlap=CHUNK_OVERLAP,
+        length_function=len,
+        separators=CHUNK_SEPARATORS
     )
     
     return text_splitter.split_text(text)
 
+def iter_document_pages(file_path: str, block_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    Lazily yield the text of a document page by page.
+    
+    PDF pages are loaded one at a time; text files are read in blocks of
+    block_size characters. Only the current page is held in memory.
+    
+    Args:
+        file_path: Path to a PDF or text file
+        block_size: Characters per block for text files
+        
+    Yields:
+        Page (or block) text
+    """
+    logger.info(f"Streaming document from {file_path}")
+    
+    file_extension = os.path.splitext(file_path)[1].lower()
+    
+    try:
+        if file_extension == '.pdf':
+            from langchain_community.document_loaders import PyPDFLoader
+            
+            for i, doc in enumerate(PyPDFLoader(file_path).lazy_load()):
+                # Pages are joined with newlines, as in load_document()
+                yield doc.page_content if i == 0 else "\n" + doc.page_content
+        else:  # Assume text file
+            with open(file_path, 'r', encoding='utf-8') as f:
+                while True:
+                    block = f.read(block_size)
+                    if not block:
+                        break
+                    yield block
+    except Exception as e:
+        logger.error(f"Error loading document: {str(e)}")
+        raise
+
+class _ChunkSplitter:
+    """One separator level of a streaming RecursiveCharacterTextSplitter.
+    
+    Input is cut before every occurrence of the separator. Pieces shorter
+    than chunk_size are merged greedily with overlap; a piece that reaches
+    chunk_size is streamed into a splitter for the remaining separators
+    instead of being buffered, so each level holds less than about
+    chunk_size characters plus the text being fed.
+    """
+    
+    def __init__(self, separators: List[str], chunk_size: int, chunk_overlap: int):
+        self.separator = separators[0]
+        self.pattern = re.compile(re.escape(self.separator)) if self.separator else None
+        self.rest = separators[1:]
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        # Unscanned tail that may hold the start of a separator
+        self.held = ""
+        # Parts of the current piece while it is short
+        self.piece: List[str] = []
+        self.piece_length = 0
+        # Splitter receiving the current piece once it is long
+        self.child: Optional["_ChunkSplitter"] = None
+        # Pieces being merged into the next chunk
+        self.current: Deque[str] = deque()
+        self.total = 0
+    
+    def feed(self, text: str) -> Iterator[str]:
+        """Take the next part of the text, yielding the chunks it completes."""
+        if self.pattern is None:
+            # Every character is a piece of its own
+            for char in text:
+                yield from self._extend(char)
+                yield from self._end_piece()
+            return
+        
+        text = self.held + text
+        begin = 0
+        scanned = 0
+        for match in self.pattern.finditer(text):
+            # Pieces keep their leading separator
+            yield from self._extend(text[begin:match.start()])
+            yield from self._end_piece()
+            begin = match.start()
+            scanned = match.end()
+        # A separator may continue in the next part; matches never overlap
+        hold = max(begin, scanned, len(text) - len(self.separator) + 1)
+        yield from self._extend(text[begin:hold])
+        self.held = text[hold:]
+    
+    def finish(self) -> Iterator[str]:
+        """Yield the remaining chunks once the text has ended."""
+        yield from self._extend(self.held)
+        self.held = ""
+        yield from self._end_piece()
+        yield from self._flush()
+    
+    def _extend(self, text: str) -> Iterator[str]:
+        if not text:
+            return
+        if self.child is not None:
+            yield from self.child.feed(text)
+            return
+        self.piece.append(text)
+        self.piece_length += len(text)
+        if self.piece_length >= self.chunk_size and self.rest:
+            # Too long to merge: end the chunk so far and split the piece further
+            yield from self._flush()
+            self.child = _ChunkSplitter(self.rest, self.chunk_size, self.chunk_overlap)
+            piece = "".join(self.piece)
+            self.piece = []
+            self.piece_length = 0
+            yield from self.child.feed(piece)
+    
+    def _end_piece(self) -> Iterator[str]:
+        if self.child is not None:
+            yield from self.child.finish()
+            self.child = None
+            return
+        if not self.piece:
+            return
+        piece = "".join(self.piece)
+        self.piece = []
+        self.piece_length = 0
+        if len(piece) < self.chunk_size:
+            yield from self._merge(piece)
+        else:
+            # No separators left to split on
+            yield from self._flush()
+            yield piece
+    
+    def _merge(self, piece: str) -> Iterator[str]:
+        # Greedy merge of short pieces, as RecursiveCharacterTextSplitter does
+        if self.total + len(piece) > self.chunk_size and self.current:
+            text = "".join(self.current).strip()
+            if text:
+                yield text
+            while self.total > self.chunk_overlap or (
+                    self.total + len(piece) > self.chunk_size and self.total > 0):
+                self.total -= len(self.current.popleft())
+        self.current.append(piece)
+        self.total += len(piece)
+    
+    def _flush(self) -> Iterator[str]:
+        text = "".join(self.current).strip()
+        if text:
+            yield text
+        self.current.clear()
+        self.total = 0
+
+def iter_chunks(pages: Iterable[str], chunk_size: int = 4000,
+                chunk_overlap: int = CHUNK_OVERLAP) -> Iterator[str]:
+    """
+    Split a stream of pages into overlapping chunks incrementally.
+    
+    Produces exactly the chunks chunk_text() produces for the joined pages,
+    so both paths share cache entries. Like RecursiveCharacterTextSplitter,
+    the text is cut into paragraphs (each keeping its leading separator);
+    paragraphs shorter than chunk_size are merged greedily with overlap,
+    longer ones are split on lines, words and characters. Long paragraphs
+    and lines are split as they stream in rather than buffered, so peak
+    memory is about chunk_size per separator plus one page, even for text
+    without any blank lines.
+    
+    Args:
+        pages: Iterable of page texts
+        chunk_size: Target chunk size in characters
+        chunk_overlap: Characters of overlap between consecutive chunks
+        
+    Yields:
+        Text chunks
+    """
+    splitter = _ChunkSplitter(CHUNK_SEPARATORS, chunk_size, chunk_overlap)
+    for page in pages:
+        yield from splitter.feed(page)
+    yield from splitter.finish()
+
+def iter_profile_chunks(file_path: str, chunk_size: int = 4000,
+                        single_chunk_limit: int = 6000,
+                        pages: Optional[Iterable[str]] = None) -> Iterator[str]:
+    """
+    Stream the chunks of a document for profile extraction.
+    
+    Documents shorter than single_chunk_limit are processed as a single chunk.
+    Pass pages to chunk an already opened page stream instead of file_path.
+    """
+    pages = iter(pages) if pages is not None else iter_document_pages(file_path)
+    
+    # Read ahead just far enough to tell whether the document is short
+    head = []
+    length = 0
+    for page in pages:
+        head.append(page)
+        length += len(page)
+        if length >= single_chunk_limit:
+            break
+    else:
+        text = "".join(head)
+        if text:
+            yield text
+        return
+    
+    logger.info(f"Splitting text into chunks of ~{chunk_size} characters")
+    yield from iter_chunks(chain(head, pages), chunk_size=chunk_size)
+
 def create_profile_prompt() -> PromptTemplate:
     """Create the prompt template for profile generation."""
+    from langchain.output_parsers import PydanticOutputParser
+    
     parser = PydanticOutputParser(pydantic_object=ProjectProfile)
     
     template = """
@@ -127,8 +360,235 @@ def create_profile_prompt() -> PromptTemplate:
         partial_variables={"format_instructions": parser.get_format_instructions()}
     )
 
-def extract_profile_from_chunk(chunk: str, llm: ChatOpenAI) -> Dict[str, Any]:
+class StubLLM(LLM):
+    """Offline stand-in for the OpenAI model.
+    
+    Builds a schema-valid profile from the most frequent words of the chunk,
+    optionally sleeping to simulate API latency. Useful for running and
+    benchmarking the pipeline without network access or token cost.
+    """
+    
+    latency: float = 0.0
+    
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+    
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        
+        # Only look at the document content, not the instructions around it
+        content = prompt.split("CONTENT:", 1)[-1]
+        content = content.split("The output should be formatted", 1)[0]
+        words = [w for w in re.findall(r"[A-Za-z][A-Za-z0-9-]{3,}", content)]
+        common = [w for w, _ in Counter(w.lower() for w in words).most_common(10)] or ["project"]
+        name = words[0] if words else "Unknown"
+        summary = " ".join(content.split()[:40])
+        
+        return json.dumps({
+            "name": name,
+            "short_description": summary[:200],
+            "detailed_description": summary,
+            "core_value": f"Focus on {', '.join(common[:3])}",
+            "unique_components": [w.title() for w in common[:6]],
+            "hashtags": [f"#{w.title().replace('-', '')}" for w in common[:8]]
+        })
+
+def create_llm(provider: str = "openai", openai_api_key: Optional[str] = None,
+               model: str = "gpt-4", temperature: float = 0.2, stub_latency: float = 0.0) -> BaseLanguageModel:
+    """
+    Create the language model used for profile extraction.
+    
+    Args:
+        provider: "openai" for ChatOpenAI or "stub" for the offline StubLLM
+        openai_api_key: OpenAI API key (falls back to OPENAI_API_KEY)
+        model: OpenAI model name
+        temperature: Sampling temperature
+        stub_latency: Simulated per-call latency in seconds for the stub model
+        
+    Returns:
+        A LangChain language model
+    """
+    if provider == "stub":
+        return StubLLM(latency=stub_latency)
+    if provider != "openai":
+        raise ValueError(f"Unknown LLM provider: {provider}")
+    
+    if not openai_api_key:
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            raise ValueError(
+                "OpenAI API key is required. Either provide it as an argument or set OPENAI_API_KEY environment variable."
+            )
+    
+    from langchain_openai import ChatOpenAI
+    
+    return ChatOpenAI(
+        temperature=temperature,
+        model=model,
+        api_key=openai_api_key
+    )
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Best-effort check whether an LLM error is a rate limit (HTTP 429) error."""
+    if type(error).__name__ in ("RateLimitError", "RateLimitException"):
+        return True
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "429" in message
+
+def extract_profile_with_retry(chunk: str, llm: BaseLanguageModel, max_retries: int = 3,
+                               backoff_base: float = 1.0, backoff_max: float = 60.0) -> ProjectProfile:
+    """
+    Extract profile information from a chunk, retrying rate limited calls.
+    
+    Rate limit errors are retried after the provider's retry_after hint if
+    it gives one, otherwise with jittered exponential backoff. Other errors
+    are raised immediately.
+    
+    Args:
+        chunk: Text chunk
+        llm: Language model
+        max_retries: Maximum retries after the first attempt
+        backoff_base: Base delay in seconds for exponential backoff
+        backoff_max: Upper bound in seconds for a single backoff delay
+        
+    Returns:
+        Extracted ProjectProfile
+    """
+    attempt = 0
+    while True:
+        try:
+            return extract_profile_from_chunk(chunk, llm)
+        except Exception as e:
+            if attempt >= max_retries or not is_rate_limit_error(e):
+                raise
+            delay = getattr(e, "retry_after", None)
+            if delay is None:
+                delay = random.uniform(0, min(backoff_max, backoff_base * (2 ** attempt)))
+            logger.warning(f"Rate limited by LLM provider, retrying in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+
+def create_extraction_cache(path: str = ".profile_cache.db", max_entries: int = 5000) -> ResponseCache:
+    """
+    Create the on-disk cache of per-chunk extraction results.
+    
+    Entries never expire; they are content addressed (see chunk_cache_key)
+    so a changed chunk, prompt or model simply gets a new key. The oldest
+    unused entries are evicted beyond max_entries.
+    
+    Args:
+        path: SQLite file holding the cache
+        max_entries: Maximum number of cached chunk profiles
+        
+    Returns:
+        ResponseCache
+    """
+    return ResponseCache(max_entries=max_entries, default_ttl=None, path=path)
+
+def extraction_fingerprint(llm: BaseLanguageModel) -> str:
+    """
+    Digest of everything besides the chunk that affects an extraction.
+    
+    Hashes the full prompt template (including format instructions) and
+    the model parameters. Compute it once per run and pass it to
+    chunk_cache_key() for each chunk.
+    """
+    prompt = create_profile_prompt()
+    model_params = {
+        "type": llm._llm_type,
+        "temperature": getattr(llm, "temperature", None),
+        **llm._identifying_params
+    }
+    digest = hashlib.sha256()
+    for part in (prompt.template, json.dumps(prompt.partial_variables, sort_keys=True),
+                 json.dumps(model_params, sort_keys=True, default=str)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def chunk_cache_key(chunk: str, fingerprint: str) -> str:
+    """
+    Content-addressed cache key for extracting a chunk.
+    
+    Combines the hash of the chunk text with an extraction_fingerprint().
+    """
+    digest = hashlib.sha256(fingerprint.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(chunk.encode("utf-8"))
+    return f"profile-chunk:{digest.hexdigest()}"
+
+def extract_profiles(chunks: Iterable[str], llm: BaseLanguageModel, max_workers: int = 4,
+                     max_retries: int = 3, cache: Optional[ResponseCache] = None) -> List[Dict[str, Any]]:
+    """
+    Extract profiles from chunks concurrently.
+    
+    Chunks are consumed lazily: at most 2 * max_workers chunks are in flight
+    at any time, so a streamed document is never held in memory as a whole.
+    
+    Args:
+        chunks: Text chunks (any iterable, e.g. iter_profile_chunks())
+        llm: Language model
+        max_workers: Maximum number of concurrent LLM calls
+        max_retries: Maximum retries per chunk for rate limited calls
+        cache: Optional extraction cache; only chunks missing from it are sent to the LLM
+        
+    Returns:
+        Extracted profile dicts in chunk order
+    """
+    max_workers = max(1, max_workers)
+    profiles: Dict[int, Dict[str, Any]] = {}
+    cached = 0
+    
+    def extract(i, chunk, key):
+        logger.info(f"Processing chunk {i+1}")
+        profile = extract_profile_with_retry(chunk, llm, max_retries=max_retries).dict()
+        if cache is not None:
+            cache.set_key(key, profile, ttl=None)
+        return i, profile
+    
+    def collect(done):
+        for future in done:
+            i, profile = future.result()
+            profiles[i] = profile
+    
+    fingerprint = extraction_fingerprint(llm) if cache is not None else None
+    in_flight = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i, chunk in enumerate(chunks):
+            key = None
+            if cache is not None:
+                key = chunk_cache_key(chunk, fingerprint)
+                profile = cache.get_key(key)
+                if profile is not None:
+                    profiles[i] = profile
+                    cached += 1
+                    continue
+            
+            if len(in_flight) >= 2 * max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            in_flight.add(executor.submit(extract, i, chunk, key))
+        
+        collect(wait(in_flight)[0])
+    
+    chunk_counter = REGISTRY.counter(
+        "socialpulse_profile_chunks_total", "Profile chunks processed by source", ("source",))
+    chunk_counter.inc(cached, source="cache")
+    chunk_counter.inc(len(profiles) - cached, source="llm")
+    if cache is not None:
+        logger.info(f"{cached}/{len(profiles)} chunks served from the extraction cache")
+    
+    return [profiles[i] for i in range(len(profiles))]
+
+def extract_profile_from_chunk(chunk: str, llm: BaseLanguageModel) -> Dict[str, Any]:
     """Extract profile information from a text chunk."""
+    from langchain.chains import LLMChain
+    from langchain.output_parsers import PydanticOutputParser
+    
     parser = PydanticOutputParser(pydantic_object=ProjectProfile)
     prompt = create_profile_prompt()
     
@@ -184,76 +644,65 @@ def merge_profiles(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     return merged
 
-def generate_profile(input_file: str, output_file: str, openai_api_key: Optional[str] = None):
-    """Generate a profile from an input file and save to output file."""
-    # Setup the LLM
-    if not openai_api_key:
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not openai_api_key:
-            raise ValueError(
-                "OpenAI API key is required. Either provide it as an argument or set OPENAI_API_KEY environment variable."
-            )
-    
-    llm = ChatOpenAI(
-        temperature=0.2,
-        model="gpt-4",
-        api_key=openai_api_key
-    )
-    
-    # Load and process the document
-    text = load_document(input_file)
-    
-    # If text is short, process it as a single chunk
-    if len(text) < 6000:
-        chunks = [text]
-    else:
-        chunks = chunk_text(text)
-    
-    logger.info(f"Processing {len(chunks)} text chunks")
+def generate_profile(input_file: str, output_file: str, openai_api_key: Optional[str] = None,
+                     max_workers: int = 4, llm: Optional[BaseLanguageModel] = None,
+                     cache: Optional[ResponseCache] = None):
+    """Generate a profile from an input file and save to output file.
+    
+    Chunks are extracted concurrently by up to max_workers LLM calls and
+    merged in chunk order. Pass llm to use a different model (e.g. StubLLM)
+    and cache to reuse extraction results for unchanged chunks.
+    
+    Loading, chunking and extraction overlap since the document is streamed;
+    the time spent in each is recorded separately in the
+    socialpulse_profile_stage_seconds histogram (stages load, chunk,
+    extract, merge and save).
+    """
+    stages = REGISTRY.histogram(
+        "socialpulse_profile_stage_seconds", "generate_profile time per stage",
+        ("stage",), buckets=STAGE_BUCKETS)
+    load, chunking = Stopwatch(), Stopwatch()
     
-    # Process each chunk
-    profiles = []
-    for i, chunk in enumerate(chunks):
-        logger.info(f"Processing chunk {i+1}/{len(chunks)}")
-        profile = extract_profile_from_chunk(chunk, llm)
-        profiles.append(profile.dict())
+    # Setup the LLM
+    if llm is None:
+        llm = create_llm("openai", openai_api_key)
+    
+    # Stream the document; short documents are processed as a single chunk
+    pages = timed_iter(iter_document_pages(input_file), load)
+    chunks = timed_iter(iter_profile_chunks(input_file, pages=pages), chunking)
+    
+    # Process the chunks, results come back in chunk order
+    with Stopwatch() as extraction:
+        profiles = extract_profiles(chunks, llm, max_workers=max_workers, cache=cache)
+    # Pulling chunks includes loading pages, and extraction includes pulling chunks
+    stages.observe(load.seconds, stage="load")
+    stages.observe(chunking.seconds - load.seconds, stage="chunk")
+    stages.observe(extraction.seconds - chunking.seconds, stage="extract")
+    logger.info(f"Processed {len(profiles)} text chunks")
+    if cache is not None:
+        logger.info(f"Extraction cache stats: {cache.stats()}")
     
     # Merge profiles from different chunks
-    merged_profile = merge_profiles(profiles)
+    with stages.time(stage="merge"):
+        merged_profile = merge_profiles(profiles)
     
     # Save to output file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_profile, f, indent=2, ensure_ascii=False)
+    with stages.time(stage="save"):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(merged_profile, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Profile saved to {output_file}")
     return merged_profile
 
-def main():
-    """Main function to parse arguments and run the profile generator."""
-    parser = argparse.ArgumentParser(description="Generate a profile.json from input text")
-    
-    parser.add_argument(
-        "-i", "--input", 
-        required=True, 
-        help="Path to input file (PDF or TXT)"
-    )
-    
-    parser.add_argument(
-        "-o", "--output", 
-        default="profile.json", 
-        help="Path to output JSON file (default: profile.json)"
-    )
-    
-    parser.add_argument(
-        "-k", "--api-key", 
-        help="OpenAI API key (optional, can also use OPENAI_API_KEY env var)"
-    )
-    
-    args = parser.parse_args()
-    
+def run(args) -> int:
+    """Run the profile generator for parsed command line arguments."""
     try:
-        generate_profile(args.input, args.output, args.api_key)
+        llm = create_llm(args.llm, args.api_key)
+        cache = None if args.no_cache else create_extraction_cache(args.cache, args.cache_size)
+        generate_profile(args.input, args.output, args.api_key, max_workers=args.workers, llm=llm, cache=cache)
         print(f"✅ Profile successfully generated and saved to {args.output}")
+        if args.metrics:
+            REGISTRY.write(args.metrics)
     except Exception as e:
         logger.error(f"Error generating profile: {str(e)}")
         print(f"❌ Error: {str(e)}")
@@ -261,5 +710,11 @@ def main():
     
     return 0
 
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main function to parse arguments and run the profile generator."""
+    parser = argparse.ArgumentParser(description="Generate a profile.json from input text")
+    add_profile_arguments(parser)
+    return run(parser.parse_args(argv))
+
 if __name__ == "__main__":
     main()
@@ -1,9 +1,21 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
+# This file lives inside the package directory, so map the directory itself
+# to the "socialpulse" package instead of discovering packages below it.
 setup(
     name="socialpulse",
     version="0.1.0",
-    packages=find_packages(),
+    package_dir={"socialpulse": "."},
+    packages=[
+        "socialpulse",
+        "socialpulse.benchmarks",
+        "socialpulse.core",
+        "socialpulse.models",
+        "socialpulse.profile",
+        "socialpulse.social_connectors",
+        "socialpulse.utils",
+    ],
+    package_data={"socialpulse.profile": ["*.json"]},
     install_requires=[
         "requests>=2.25.0",
         "fastapi>=0.68.0",
@@ -11,6 +23,11 @@ setup(
         "pydantic>=1.8.0",
         "python-dotenv>=0.19.0",
     ],
+    entry_points={
+        "console_scripts": [
+            "socialpulse=socialpulse.cli:main",
+        ],
+    },
     author="CryptoBrain Team",
     description="Social media analysis for crypto trends",
 )
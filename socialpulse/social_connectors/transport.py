@@ -0,0 +1,257 @@
+"""Pooled HTTP transport shared by SocialPulse connectors.
+
+A single ``HttpTransport`` keeps one ``requests.Session`` alive for the
+lifetime of a connector so that TCP/TLS connections to the API host are
+reused across calls instead of being renegotiated for every request.
+"""
+import time
+import random
+import logging
+from typing import Dict, Optional, Tuple, Union, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Import exceptions
+try:
+    from socialpulse.exceptions import RateLimitException
+    from socialpulse.utils.rate_limiter import TokenBucket
+    from socialpulse.utils.metrics import REGISTRY, MetricsRegistry
+    from socialpulse.utils.quota import SharedQuota, INTERACTIVE
+except ImportError:
+    from exceptions import RateLimitException
+    from utils.rate_limiter import TokenBucket
+    from utils.metrics import REGISTRY, MetricsRegistry
+    from utils.quota import SharedQuota, INTERACTIVE
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+def parse_rate_limit_headers(headers) -> Dict[str, Optional[int]]:
+    """
+    Extract rate limit information from response headers.
+
+    Both the ``x-ratelimit-*`` and the ``x-rate-limit-*`` spellings are
+    recognised since providers are not consistent about them.
+
+    Args:
+        headers: Mapping of response headers
+
+    Returns:
+        Dict with 'limit', 'remaining' and 'reset' (seconds since epoch),
+        each None when the header is absent or not numeric
+    """
+    info = {}
+    for key in ('limit', 'remaining', 'reset'):
+        value = headers.get(f'x-ratelimit-{key}', headers.get(f'x-rate-limit-{key}'))
+        try:
+            info[key] = int(float(value)) if value is not None else None
+        except (TypeError, ValueError):
+            info[key] = None
+    return info
+
+def retry_after_seconds(headers, now: Optional[float] = None) -> Optional[float]:
+    """
+    Work out how long to wait before retrying a rate limited request.
+
+    ``Retry-After`` takes precedence; otherwise the delay is derived from
+    the ``x-ratelimit-reset`` epoch timestamp.
+
+    Args:
+        headers: Mapping of response headers
+        now: Current time in seconds since epoch (defaults to time.time())
+
+    Returns:
+        Number of seconds to wait, or None if the headers don't say
+    """
+    retry_after = headers.get('retry-after')
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+    reset = parse_rate_limit_headers(headers)['reset']
+    if reset is None:
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, reset - now)
+
+class HttpTransport:
+    """Long-lived pooled HTTP transport with retry and backoff.
+
+    Features:
+    - One keep-alive ``requests.Session`` with a configurable connection pool
+    - Connect/read timeouts applied to every request
+    - 429 handling driven by ``Retry-After``/``x-ratelimit-reset`` headers
+    - Jittered exponential backoff for 5xx responses and connection errors
+    - Optional shared token bucket to stay within the API quota
+    - Optional cross-process SharedQuota, kept in sync with rate limit headers
+    - Per-endpoint request, latency, byte, 429 and retry metrics
+    """
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None,
+                 pool_size: int = 10, timeout: Timeout = (5.0, 30.0),
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 sleep_on_rate_limit: bool = True, max_rate_limit_wait: float = 60.0,
+                 limiter: Optional[TokenBucket] = None, metrics: Optional[MetricsRegistry] = None,
+                 quota: Optional[SharedQuota] = None, priority: str = INTERACTIVE):
+        """
+        Initialize the transport.
+
+        Args:
+            base_url: Base URL every endpoint is resolved against
+            headers: Default headers sent with every request
+            pool_size: Maximum number of pooled keep-alive connections per host
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            max_retries: Maximum number of retries after the first attempt
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Upper bound in seconds for a single backoff delay
+            sleep_on_rate_limit: Sleep and retry on 429 instead of raising immediately
+            max_rate_limit_wait: Longest rate limit wait in seconds we are willing to sleep
+            limiter: Optional token bucket consulted before every request attempt
+            metrics: Registry receiving request metrics (defaults to the shared REGISTRY)
+            quota: Optional quota shared with other processes using the same API key,
+                consulted before every request attempt
+            priority: Priority class of this transport's requests in the shared quota
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sleep_on_rate_limit = sleep_on_rate_limit
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.limiter = limiter
+        self.quota = quota
+        self.priority = priority
+        
+        metrics = metrics or REGISTRY
+        self._requests = metrics.counter(
+            "socialpulse_http_requests_total", "HTTP request attempts by endpoint and status",
+            ("endpoint", "status"))
+        self._latency = metrics.histogram(
+            "socialpulse_http_request_duration_seconds", "HTTP request attempt latency by endpoint",
+            ("endpoint",))
+        self._bytes = metrics.counter(
+            "socialpulse_http_response_bytes_total", "Response body bytes received by endpoint",
+            ("endpoint",))
+        self._rate_limited = metrics.counter(
+            "socialpulse_http_rate_limited_total", "429 responses by endpoint", ("endpoint",))
+        self._retries = metrics.counter(
+            "socialpulse_http_retries_total", "Retried request attempts by endpoint and reason",
+            ("endpoint", "reason"))
+
+        # Most recent rate limit headers seen on any response
+        self.rate_limit = {'limit': None, 'remaining': None, 'reset': None}
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self.session.headers['Connection'] = 'keep-alive'
+
+        # Retries are handled in request() so the adapter itself never retries
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for the given attempt number."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                **kwargs) -> requests.Response:
+        """
+        Send a request, retrying on rate limits, server errors and connection errors.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path relative to base_url
+            params: Optional query string parameters
+            **kwargs: Extra arguments passed to ``requests.Session.request``
+
+        Returns:
+            The final response (4xx responses other than 429 are returned as-is)
+
+        Raises:
+            RateLimitException: If rate limited and not allowed to wait it out
+            requests.RequestException: If retries are exhausted
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        kwargs.setdefault('timeout', self.timeout)
+        label = endpoint.strip('/')
+        attempt = 0
+
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            if self.quota is not None:
+                self.quota.acquire(self.priority)
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, params=params, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._latency.observe(time.perf_counter() - started, endpoint=label)
+                self._requests.inc(endpoint=label, status="error")
+                if attempt >= self.max_retries:
+                    raise
+                self._retries.inc(endpoint=label, reason="connection")
+                delay = self._backoff(attempt)
+                logger.warning(f"Request to {endpoint} failed ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self._latency.observe(time.perf_counter() - started, endpoint=label)
+            self._requests.inc(endpoint=label, status=response.status_code)
+            self._bytes.inc(len(response.content), endpoint=label)
+
+            rate_limit = parse_rate_limit_headers(response.headers)
+            if any(v is not None for v in rate_limit.values()):
+                self.rate_limit = rate_limit
+                if self.quota is not None:
+                    self.quota.sync(rate_limit)
+
+            if response.status_code == 429:
+                self._rate_limited.inc(endpoint=label)
+                retry_after = retry_after_seconds(response.headers)
+                if self.quota is not None:
+                    # Hold the other processes too; they would only collect more 429s
+                    self.quota.pause(retry_after if retry_after is not None else self._backoff(attempt))
+                can_wait = (
+                    self.sleep_on_rate_limit
+                    and attempt < self.max_retries
+                    and (retry_after is None or retry_after <= self.max_rate_limit_wait)
+                )
+                if not can_wait:
+                    raise RateLimitException(f"Rate limit exceeded for {endpoint}", retry_after=retry_after)
+                self._retries.inc(endpoint=label, reason="rate_limit")
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                logger.warning(f"Rate limited on {endpoint}, sleeping {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if response.status_code >= 500 and attempt < self.max_retries:
+                self._retries.inc(endpoint=label, reason="server_error")
+                delay = self._backoff(attempt)
+                logger.warning(f"Server error {response.status_code} on {endpoint}, retrying in {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            return response
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
+        """Send a GET request. See request()."""
+        return self.request('GET', endpoint, params=params, **kwargs)
+
+    def close(self):
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -11,23 +11,49 @@ python -m socialpulse.social_connectors.x_connector
 import os
 import sys
 import json
+import asyncio
+import hashlib
 import logging
+import functools
 import requests
-from typing import List, Dict, Optional, Set, Tuple, Union, Any
+from typing import List, Dict, Optional, Set, Tuple, Union, Any, Iterator, Callable
 from pathlib import Path
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import base connector from local package
 from socialpulse.social_connectors.base_connector import BaseSocialConnector
+from socialpulse.social_connectors.transport import HttpTransport, Timeout
+from socialpulse.models.tweet_batch import TweetBatch
+from socialpulse.core.relevance import RelevanceMatcher
+from socialpulse.core.vector_relevance import VectorScorer
+from socialpulse.core.trend_detector import TrendDetector
+from socialpulse.core.query_planner import QueryPlan, plan_queries, DEFAULT_MAX_QUERY_LENGTH
 
 # Import exceptions
 try:
     from socialpulse.exceptions import RateLimitException, AuthenticationException
+    from socialpulse.utils.rate_limiter import TokenBucket
+    from socialpulse.utils.cache import ResponseCache
+    from socialpulse.utils.watermarks import WatermarkStore, tweet_position
+    from socialpulse.utils.entities import Entities, extract_entities, extract_entities_batch
+    from socialpulse.utils.metrics import REGISTRY, MetricsRegistry
+    from socialpulse.utils.tweet_store import TweetStore
+    from socialpulse.utils.quota import SharedQuota, INTERACTIVE
+    from socialpulse.utils.singleflight import SingleFlight
 except ImportError:
     # If running directly from socialpulse directory
     module_path = Path(__file__).resolve()
     sys.path.insert(0, str(module_path.parent.parent))
     from exceptions import RateLimitException, AuthenticationException
+    from utils.rate_limiter import TokenBucket
+    from utils.cache import ResponseCache
+    from utils.watermarks import WatermarkStore, tweet_position
+    from utils.entities import Entities, extract_entities, extract_entities_batch
+    from utils.metrics import REGISTRY, MetricsRegistry
+    from utils.tweet_store import TweetStore
+    from utils.quota import SharedQuota, INTERACTIVE
+    from utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -73,9 +99,35 @@ class XConnector(BaseSocialConnector):
     - Real API integration with the X API v2
     - Automatic fallback to mock data when no token is provided
     - Configurable rate limiting and error handling
+    - Pooled keep-alive HTTP transport shared by all calls
+    - Bulk fetching of tracked accounts with bounded concurrency
+    - Optional TTL/LRU response cache for search and account timelines
+    - Incremental account polling from persisted per-account high-water marks
+    - Columnar TweetBatch output for high-volume processing
+    - Cursor-paginated search streaming with result budgets and early stop
+    - Profile relevance filtering of fetched tweets
+    - Request, latency, cache and error metrics in a MetricsRegistry
     """
     
-    def __init__(self, api_key: str = None, profile_path: str = None, track_path: str = None):
+    DEFAULT_BASE_URL = "https://alpha.pumpagent.ai/api"
+    
+    # Query parameter carrying the cursor of the next search results page
+    SEARCH_CURSOR_PARAM = "cursor"
+    
+    # Suggested per-endpoint TTLs (seconds) for a ResponseCache used with this connector
+    CACHE_TTLS = {
+        "tool/twitter/search": 120.0,
+        "tool/twitter/user-tweets": 300.0
+    }
+    
+    def __init__(self, api_key: str = None, profile_path: str = None, track_path: str = None,
+                 pool_size: int = 10, timeout: Timeout = (5.0, 30.0), max_retries: int = 3,
+                 sleep_on_rate_limit: bool = True, quota_requests: int = 900, quota_window: float = 900.0,
+                 cache: Optional[ResponseCache] = None, watermarks: Optional[WatermarkStore] = None,
+                 base_url: Optional[str] = None, metrics: Optional[MetricsRegistry] = None,
+                 store: Optional[TweetStore] = None, quota: Optional[SharedQuota] = None,
+                 priority: str = INTERACTIVE, coalesce: bool = True,
+                 max_query_length: int = DEFAULT_MAX_QUERY_LENGTH):
         """
         Initialize X connector with API credentials and profile data.
         
@@ -84,15 +136,160 @@ class XConnector(BaseSocialConnector):
             api_secret: X API secret for authentication
             profile_path: Path to profile.json file
             track_path: Path to track_x.json file with accounts to track
+            pool_size: Maximum number of pooled keep-alive connections
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            max_retries: Maximum retries for rate limited, 5xx or failed requests
+            sleep_on_rate_limit: Sleep until the rate limit resets instead of raising RateLimitException
+            quota_requests: Requests allowed per quota window, shared by all calls on this connector
+            quota_window: Quota window length in seconds
+            cache: Optional response cache, e.g. ResponseCache(ttls=XConnector.CACHE_TTLS)
+            watermarks: Store of per-account high-water marks used by incremental polling
+            base_url: API base URL (defaults to DEFAULT_BASE_URL; e.g. a local replay server for benchmarks)
+            metrics: Registry receiving connector and HTTP metrics (defaults to the shared REGISTRY)
+            store: Optional TweetStore that keeps every fetched tweet for offline history queries
+            quota: Optional quota shared by all processes using this API key, e.g.
+                SharedQuota("x_quota.db", name=XConnector.quota_name(api_key))
+            priority: INTERACTIVE or BACKGROUND; background requests leave the quota's reserve alone
+            coalesce: Let concurrent identical search_trendy_tweets/get_account_tweets calls
+                share one request
+            max_query_length: Search query length limit used when packing keywords into OR queries
         """
         self.api_key = api_key
-        self.base_url = "https://alpha.pumpagent.ai/api"
+        self.base_url = base_url or self.DEFAULT_BASE_URL
         
         if not self.api_key:
             raise AuthenticationException("X_API_KEY is required for XConnector. Please provide a valid API key.")
         
         self.profile = load_profile(profile_path)
         self.track_accounts = load_track_accounts(track_path)
+        self.cache = cache
+        self.watermarks = watermarks
+        self.store = store
+        self.max_query_length = max_query_length
+        self._relevance_matcher = None
+        self._vector_scorer = None
+        
+        self.metrics = metrics or REGISTRY
+        self._cache_requests = self.metrics.counter(
+            "socialpulse_cache_requests_total", "Response cache lookups by endpoint and result",
+            ("endpoint", "result"))
+        self._errors = self.metrics.counter(
+            "socialpulse_connector_errors_total", "Connector calls that failed and returned a fallback",
+            ("connector", "method"))
+        self._deduplicated = self.metrics.counter(
+            "socialpulse_singleflight_deduplicated_total",
+            "Calls answered by an identical request already in flight", ("method",))
+        self.singleflight = SingleFlight(
+            on_duplicate=lambda key: self._deduplicated.inc(method=key[0])
+        ) if coalesce else None
+        
+        # Shared token bucket keeping every call on this connector within the API quota
+        self.limiter = TokenBucket.from_quota(quota_requests, quota_window)
+        
+        self.transport = HttpTransport(
+            self.base_url,
+            headers={
+                'Accept': 'application/json',
+                'x-api-key': self.api_key
+            },
+            pool_size=pool_size,
+            timeout=timeout,
+            max_retries=max_retries,
+            sleep_on_rate_limit=sleep_on_rate_limit,
+            limiter=self.limiter,
+            metrics=self.metrics,
+            quota=quota,
+            priority=priority
+        )
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        self.transport.close()
+    
+    def _coalesce(self, key: Tuple, fn: Callable[[], Any]) -> Any:
+        """Run fn, sharing the result with concurrent calls that have the same key."""
+        if self.singleflight is None:
+            return fn()
+        return self.singleflight.do(key, fn)
+    
+    async def _coalesce_async(self, key: Tuple, fn: Callable[[], Any]) -> Any:
+        """Run blocking fn in the default executor, sharing it with concurrent coroutines that have the same key."""
+        if self.singleflight is None:
+            return await asyncio.get_running_loop().run_in_executor(None, fn)
+        return await self.singleflight.do_in_executor(key, fn)
+    
+    @staticmethod
+    def quota_name(api_key: str) -> str:
+        """SharedQuota name for an API key (a hash, so the key itself is not stored)."""
+        return "x:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    
+    @property
+    def relevance_matcher(self) -> RelevanceMatcher:
+        """Keyword/hashtag matcher compiled from the profile on first use."""
+        if self._relevance_matcher is None:
+            self._relevance_matcher = RelevanceMatcher.from_profile(self.profile)
+        return self._relevance_matcher
+    
+    def filter_relevant(self, tweets: List[Dict], min_score: float = 1.0) -> List[Dict]:
+        """
+        Keep only tweets relevant to the project profile.
+        
+        Args:
+            tweets: Tweet dicts (raw or formatted) with a 'text' field
+            min_score: Minimum weighted relevance score
+            
+        Returns:
+            Relevant tweets with 'relevance' and 'matched_terms' added
+        """
+        return self.relevance_matcher.filter_relevant(tweets, min_score=min_score)
+    
+    @property
+    def vector_scorer(self) -> VectorScorer:
+        """Profile similarity scorer, with the profile vector embedded on first use."""
+        if self._vector_scorer is None:
+            self._vector_scorer = VectorScorer.from_profile(self.profile)
+        return self._vector_scorer
+    
+    def rank_relevant(self, tweets: List[Dict], min_similarity: float = 0.05,
+                      top_k: Optional[int] = None) -> List[Dict]:
+        """
+        Rank tweets by semantic similarity to the project profile.
+        
+        Unlike filter_relevant(), tweets don't need an exact keyword hit.
+        
+        Args:
+            tweets: Tweet dicts (raw or formatted) with a 'text' field
+            min_similarity: Minimum cosine similarity to the profile (0-1)
+            top_k: Maximum number of tweets returned
+            
+        Returns:
+            Tweets with 'similarity' added, most similar first
+        """
+        return self.vector_scorer.rank(tweets, min_score=min_similarity, top_k=top_k)
+    
+    def _get_json(self, endpoint: str, params: Dict[str, Any], raise_for_status: bool = True) -> Any:
+        """
+        GET an endpoint and decode its JSON body, going through the response cache if configured.
+        
+        Only successful responses are cached.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, params)
+            label = endpoint.strip('/')
+            if cached is not None:
+                logger.debug(f"Cache hit for {endpoint} {params}")
+                self._cache_requests.inc(endpoint=label, result="hit")
+                return cached
+            self._cache_requests.inc(endpoint=label, result="miss")
+        
+        response = self.transport.get(endpoint, params=params)
+        if raise_for_status:
+            response.raise_for_status()
+        data = response.json()
+        
+        if self.cache is not None and response.ok:
+            self.cache.set(endpoint, params, data)
+        return data
     
     def check_rate_limit(self) -> Dict[str, Any]:
         """
@@ -122,17 +319,8 @@ class XConnector(BaseSocialConnector):
         
         try:
             # Use a lightweight API endpoint that doesn't consume many resources
-            session = requests.Session()
-            endpoint = "tool/twitter/user-info"
-            url = f"{self.base_url}/{endpoint}/?username=web3hobby39067"
-            
-            # Set the API key in the header
-            headers = {
-                'Accept': 'application/json',
-                'x-api-key': self.api_key
-            }
-            
-            response = session.get(url, headers=headers)
+            endpoint = "tool/twitter/user-info/"
+            response = self.transport.get(endpoint, params={'username': 'web3hobby39067'})
             response.raise_for_status()
             print(response.text)
             # Extract response data
@@ -151,6 +339,11 @@ class XConnector(BaseSocialConnector):
             
             return result
             
+        except RateLimitException as e:
+            result['ok'] = False
+            result['message'] = "Rate limit exceeded"
+            result.update(self.transport.rate_limit)
+            return result
         except requests.RequestException as e:
             result['ok'] = False
             
@@ -169,7 +362,7 @@ class XConnector(BaseSocialConnector):
                 
             return result
 
-    def get_account_tweets(self, account_handle: str, date_str: str = None) -> List[Dict]:
+    def get_account_tweets(self, account_handle: str, date_str: str = None, incremental: bool = False) -> List[Dict]:
         """
         Get recent tweets from a specific X account using the X API v2.
         
@@ -177,92 +370,344 @@ class XConnector(BaseSocialConnector):
             account_handle: X account handle (with or without @)
             date_str: Date string in format 'yyyy-mm-dd' to filter tweets from
             count: Maximum number of tweets to return
+            incremental: Only return tweets newer than the account's stored
+                high-water mark (date_str is used for the first poll only)
             
         Returns:
             List of tweet dictionaries with content and metadata
         """
-        # Remove @ if present in the handle
-        handle = account_handle.lstrip('@')
+        if not self.api_key:
+            raise AuthenticationException("API key is required for X API calls")
+        
+        if incremental:
+            # Each incremental call advances the watermark, so they are never shared
+            return self._get_account_tweets(account_handle, date_str, incremental)
+        return self._coalesce(
+            self._account_key(account_handle, date_str),
+            lambda: self._get_account_tweets(account_handle, date_str)
+        )
+    
+    async def get_account_tweets_async(self, account_handle: str, date_str: str = None) -> List[Dict]:
+        """
+        Async variant of get_account_tweets(); the request runs in the event loop's default executor.
         
+        Concurrent identical calls, from coroutines or threads, share one request.
+        """
         if not self.api_key:
             raise AuthenticationException("API key is required for X API calls")
-            
         
+        return await self._coalesce_async(
+            self._account_key(account_handle, date_str),
+            functools.partial(self._get_account_tweets, account_handle, date_str)
+        )
+    
+    @staticmethod
+    def _account_key(account_handle: str, date_str: Optional[str]) -> Tuple:
+        # No date means today, so it coalesces with an explicit date_str for today
+        return (
+            "get_account_tweets",
+            account_handle.lstrip('@').lower(),
+            date_str or datetime.now().strftime('%Y-%m-%d')
+        )
+    
+    def _get_account_tweets(self, account_handle: str, date_str: str = None, incremental: bool = False) -> List[Dict]:
         try:
-            # Use a lightweight API endpoint that doesn't consume many resources
-            session = requests.Session()
-            endpoint = "tool/twitter/user-tweets"
-            url = f"{self.base_url}/{endpoint}/?username={handle}"
+            return self._fetch_account_tweets(account_handle, date_str, incremental)
+        except (requests.RequestException, RateLimitException) as e:
+            logger.error(f"Failed to fetch tweets: {e}")
+            self._errors.inc(connector="x", method="get_account_tweets")
+            return {"error":"failed to get tweets"}
+    
+    def get_all_track_account_tweets(self, handles: Optional[List[str]] = None, date_str: str = None,
+                                      max_workers: int = 8, incremental: bool = False) -> Dict[str, Union[List[Dict], Exception]]:
+        """
+        Get recent tweets from all tracked accounts (or a subset) concurrently.
+        
+        Args:
+            handles: Account handles to fetch (defaults to every account in track_x.json)
+            date_str: Date string in format 'yyyy-mm-dd' to filter tweets from
+            max_workers: Maximum number of accounts fetched at the same time
+            incremental: Only return tweets newer than each account's high-water mark
             
-            # Set the API key in the header
-            headers = {
-                'Accept': 'application/json',
-                'x-api-key': self.api_key
+        Returns:
+            Dict mapping each handle to its list of tweets, or to the exception
+            raised while fetching that account
+        """
+        results = {}
+        for handle, tweets, error in self.iter_track_account_tweets(handles, date_str, max_workers, incremental):
+            results[handle] = error if error is not None else tweets
+        return results
+    
+    def iter_track_account_tweets(self, handles: Optional[List[str]] = None, date_str: str = None,
+                                  max_workers: int = 8, incremental: bool = False) -> Iterator[Tuple[str, List[Dict], Optional[Exception]]]:
+        """
+        Fetch tweets from tracked accounts with bounded concurrency, yielding as each completes.
+        
+        All requests go through the connector's shared transport, so they are
+        throttled together by its token bucket. A failing account is reported
+        in its own result and does not abort the rest of the batch.
+        
+        Args:
+            handles: Account handles to fetch (defaults to every account in track_x.json)
+            date_str: Date string in format 'yyyy-mm-dd' to filter tweets from
+            max_workers: Maximum number of accounts fetched at the same time
+            incremental: Only return tweets newer than each account's high-water mark
+            
+        Yields:
+            (handle, tweets, error) tuples in completion order; tweets is empty
+            and error holds the exception when the fetch failed
+        """
+        if not self.api_key:
+            raise AuthenticationException("API key is required for X API calls")
+        
+        if handles is None:
+            handles = [account["handle"] for account in self.track_accounts if account.get("handle")]
+        
+        # Deduplicate while preserving order
+        unique = {}
+        for handle in handles:
+            unique.setdefault(handle.lstrip('@').lower(), handle)
+        handles = list(unique.values())
+        if not handles:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(handles))) as executor:
+            futures = {
+                executor.submit(self._fetch_account_tweets, handle, date_str, incremental): handle
+                for handle in handles
             }
+            for future in as_completed(futures):
+                handle = futures[future]
+                try:
+                    yield handle, future.result(), None
+                except Exception as e:
+                    logger.error(f"Failed to fetch tweets for {handle}: {e}")
+                    yield handle, [], e
+    
+    def get_account_tweet_batch(self, account_handle: str, date_str: str = None,
+                                incremental: bool = False) -> TweetBatch:
+        """
+        Get recent tweets from a specific X account as a columnar TweetBatch.
+        
+        Same filtering as get_account_tweets(), but the tweets are packed into
+        typed arrays instead of one dict per tweet. Request errors propagate.
+        
+        Args:
+            account_handle: X account handle (with or without @)
+            date_str: Date string in format 'yyyy-mm-dd' to filter tweets from
+            incremental: Only return tweets newer than the account's stored high-water mark
             
-            response = session.get(url, headers=headers)
-            result = response.json()
+        Returns:
+            TweetBatch of the matching tweets
+        """
+        if not self.api_key:
+            raise AuthenticationException("API key is required for X API calls")
+        
+        return TweetBatch.from_raw(self._fetch_account_raw(account_handle, date_str, incremental))
+    
+    def _fetch_account_tweets(self, account_handle: str, date_str: str = None, incremental: bool = False) -> List[Dict]:
+        """
+        Fetch and format recent tweets for one account.
+        
+        Same as get_account_tweets() but lets request errors propagate.
+        """
+        return self._format_tweets(self._fetch_account_raw(account_handle, date_str, incremental))
+    
+    def _fetch_account_raw(self, account_handle: str, date_str: str = None, incremental: bool = False) -> List[Dict]:
+        """Fetch one account's timeline and return the raw API tweets that pass the date or watermark filter."""
+        # Remove @ if present in the handle
+        handle = account_handle.lstrip('@')
+        
+        if incremental and self.watermarks is None:
+            raise ValueError("Incremental polling requires a WatermarkStore (pass watermarks=...)")
+        mark = self.watermarks.get(handle) if incremental else None
+        
+        # Use a lightweight API endpoint that doesn't consume many resources
+        endpoint = "tool/twitter/user-tweets/"
+        if incremental:
+            # A cached timeline would hide new tweets, so always go to the network
+            result = self.transport.get(endpoint, params={'username': handle}).json()
+        else:
+            result = self._get_json(endpoint, {'username': handle}, raise_for_status=False)
+        
+        # Process the response
+        if not result or not isinstance(result, list):
+            logger.warning(f"Invalid response format for user tweets: {result}")
+            return []
+        self._store_tweets(result)
+        
+        if mark is not None:
+            return self._take_new_tweets(handle, result, tweet_position(*mark))
             
-            # Process the response
-            if not result or not isinstance(result, list):
-                logger.warning(f"Invalid response format for user tweets: {result}")
-                return []
-                
-            # Filter tweets by timestamp based on the given date or today
-            if date_str:
-                # Parse the date string in yyyy-mm-dd format
-                try:
-                    filter_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    filter_timestamp = int(filter_date.timestamp())
-                except ValueError:
-                    logger.warning(f"Invalid date format: {date_str}, using current date instead")
-                    filter_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                    filter_timestamp = int(filter_date.timestamp())
-            else:
+        # Filter tweets by timestamp based on the given date or today
+        if date_str:
+            # Parse the date string in yyyy-mm-dd format
+            try:
+                filter_date = datetime.strptime(date_str, '%Y-%m-%d')
+                filter_timestamp = int(filter_date.timestamp())
+            except ValueError:
+                logger.warning(f"Invalid date format: {date_str}, using current date instead")
                 filter_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
                 filter_timestamp = int(filter_date.timestamp())
+        else:
+            filter_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            filter_timestamp = int(filter_date.timestamp())
+        
+        # Debug output
+        logger.debug(f"Filter date: {filter_date.isoformat()}, Timestamp: {filter_timestamp}")
+        logger.debug(f"Received {len(result)} tweets before filtering")
+        
+        filtered_tweets = [tweet for tweet in result if int(tweet.get('timestamp', 0)) >= filter_timestamp]
+        
+        if incremental:
+            self._advance_watermark(handle, result)
+        
+        logger.info(f"Retrieved {len(filtered_tweets)} tweets from {handle}")
+        return filtered_tweets
+    
+    def _take_new_tweets(self, handle: str, result: List[Dict], mark: Tuple[int, int]) -> List[Dict]:
+        """
+        Select the tweets newer than a high-water mark from a newest-first timeline.
+        
+        Parsing stops at the first already-seen tweet; pinned tweets are
+        skipped since they sit at the top regardless of age.
+        """
+        new_tweets = []
+        for tweet in result:
+            if tweet_position(tweet.get("id"), tweet.get("timestamp")) <= mark:
+                if tweet.get("isPin"):
+                    continue
+                break
+            new_tweets.append(tweet)
+        
+        self._advance_watermark(handle, new_tweets)
+        
+        logger.info(f"Retrieved {len(new_tweets)} new tweets from {handle}")
+        return new_tweets
+    
+    def _advance_watermark(self, handle: str, tweets: List[Dict]):
+        """Move the account's high-water mark to the newest of the given tweets."""
+        if not tweets:
+            return
+        newest = max(tweets, key=lambda t: tweet_position(t.get("id"), t.get("timestamp")))
+        self.watermarks.update(handle, newest.get("id"), int(newest.get("timestamp", 0)))
+    
+    def _format_tweets(self, tweets: List[Dict]) -> List[Dict]:
+        """Convert raw API tweets into our internal structure, extracting entities in one batch."""
+        entities = extract_entities_batch([tweet.get("text") for tweet in tweets], normalize=False)
+        return [self._format_tweet(tweet, tweet_entities) for tweet, tweet_entities in zip(tweets, entities)]
+    
+    def _format_tweet(self, tweet: Dict, entities: Optional[Entities] = None) -> Dict:
+        """Convert a raw API tweet into our internal tweet structure."""
+        # Extract hashtags from text if not provided in API response
+        hashtags = tweet.get("hashtags", [])
+        if not hashtags and "text" in tweet:
+            if entities is None:
+                entities = extract_entities(tweet["text"], normalize=False)
+            hashtags = entities.hashtags
+        
+        return {
+            "id": tweet.get("id"),
+            "text": tweet.get("text"),
+            "created_at": datetime.fromtimestamp(int(tweet.get("timestamp", 0))).isoformat(),
+            "author": tweet.get("username"),
+            "metrics": {
+                "likes": tweet.get("likes", 0),
+                "retweets": tweet.get("retweets", 0),
+                "replies": tweet.get("replies", 0),
+                "views": tweet.get("views", 0)
+            },
+            "hashtags": hashtags,
+            "url": tweet.get("permanentUrl")
+        }
+    
+    def get_trending_topics(self, keywords: Optional[List[str]] = None, date_str: str = None,
+                            count: int = 50, window: float = 24 * 60 * 60, top_k: int = 20,
+                            **kwargs) -> List[Dict]:
+        """
+        Derive trending hashtags, cashtags and keywords from recent search results.
+        
+        The API has no trends endpoint, so popular tweets for the keywords
+        (searched in combined OR queries) are fed through a streaming TrendDetector and its top terms are returned
+        in the shape expected by TrendTopic.from_x_data.
+        
+        Args:
+            keywords: Search keywords (defaults to the profile keywords)
+            date_str: Optional date string in format 'yyyy-mm-dd' to search from
+            count: Tweets fetched per keyword (combined queries ask for count per keyword they cover)
+            window: Trend window in seconds
+            top_k: Maximum number of trends returned
+            **kwargs: Extra options passed to search_keywords (min_likes, min_retweets, max_results)
             
-            # Debug output
-            print(f"Filter date: {filter_date.isoformat()}, Timestamp: {filter_timestamp}")
-            print(f"Received {len(result)} tweets before filtering")
-            if result and len(result) > 0:
-                print(f"First tweet timestamp: {result[0].get('timestamp')}")
-                print(f"First tweet date: {datetime.fromtimestamp(int(result[0].get('timestamp', 0))).isoformat()}")
-            
-            filtered_tweets = [tweet for tweet in result if int(tweet.get('timestamp', 0)) >= filter_timestamp]
+        Returns:
+            List of trend dicts with 'name', 'tweet_volume' and detector metadata
+        """
+        keywords = keywords or self.profile.get("keywords", [])
+        detector = TrendDetector(windows=(window,), keyword_matcher=self.relevance_matcher)
+        
+        # Keywords are searched in combined OR queries; a tweet matching several is counted once
+        detector.add_batch(self.search_keywords(keywords, count=count, date_str=date_str, **kwargs))
+        
+        return [
+            {"name": trend.name, "tweet_volume": trend.volume, **trend.metadata}
+            for trend in detector.trending(window=window, top_k=top_k, min_volume=1)
+        ]
+    
+    def plan_keyword_queries(self, keywords: List[str], date_str: str = None, min_likes: int = 10,
+                             min_retweets: int = 10) -> List[QueryPlan]:
+        """
+        Pack keywords into the fewest OR queries that fit max_query_length with the filters appended.
+        
+        Args:
+            keywords: Keywords, hashtags or phrases
+            date_str: Optional date string in format 'yyyy-mm-dd' the queries will filter from
+            min_likes: Minimum likes filter the queries will carry
+            min_retweets: Minimum retweets filter the queries will carry
             
-            # Format the tweets to match our internal structure
-            formatted_tweets = []
-            for tweet in filtered_tweets:
-                # Extract hashtags from text if not provided in API response
-                hashtags = tweet.get("hashtags", [])
-                if not hashtags and "text" in tweet:
-                    # Extract hashtags from tweet text
-                    words = tweet["text"].split()
-                    hashtags = [word[1:] for word in words if word.startswith('#')]
-                
-                formatted_tweet = {
-                    "id": tweet.get("id"),
-                    "text": tweet.get("text"),
-                    "created_at": datetime.fromtimestamp(int(tweet.get("timestamp", 0))).isoformat(),
-                    "author": tweet.get("username"),
-                    "metrics": {
-                        "likes": tweet.get("likes", 0),
-                        "retweets": tweet.get("retweets", 0),
-                        "replies": tweet.get("replies", 0),
-                        "views": tweet.get("views", 0)
-                    },
-                    "hashtags": hashtags,
-                    "url": tweet.get("permanentUrl")
-                }
-                formatted_tweets.append(formatted_tweet)
+        Returns:
+            QueryPlan list; pass plan.query to search_trendy_tweets with the same filters
+        """
+        reserved = len(self._build_search_query("", date_str, min_likes, min_retweets))
+        return plan_queries(keywords, max_length=self.max_query_length, reserved=reserved)
+    
+    def search_keywords(self, keywords: List[str], count: int = 10, date_str: str = None,
+                        min_likes: int = 10, min_retweets: int = 10, max_results: int = 100) -> List[Dict]:
+        """
+        Search for popular tweets about any of the keywords with as few requests as possible.
+        
+        Keywords are packed into combined OR queries (see plan_keyword_queries)
+        and each result is attributed back to the keywords its text mentions.
+        
+        Args:
+            keywords: Keywords, hashtags or phrases
+            count: Tweets wanted per keyword; a combined query asks for count per keyword it covers
+            date_str: Optional date string in format 'yyyy-mm-dd' to filter tweets from
+            min_likes: Minimum number of likes for tweets to include
+            min_retweets: Minimum number of retweets for tweets to include
+            max_results: Upper bound on the tweets requested by one query
             
-            logger.info(f"Retrieved {len(formatted_tweets)} tweets from {handle}")
-            print(formatted_tweets)
-            return formatted_tweets
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch tweets: {e}")
-            return {"error":"failed to get tweets"}
+        Returns:
+            Unique raw tweets (by id) with 'keywords' added: the keywords each tweet matched
+        """
+        results: Dict[Any, Dict] = {}
+        plans = self.plan_keyword_queries(keywords, date_str, min_likes, min_retweets)
+        for plan in plans:
+            tweets = self.search_trendy_tweets(
+                plan.query,
+                count=min(max_results, count * len(plan.keywords)),
+                date_str=date_str,
+                min_likes=min_likes,
+                min_retweets=min_retweets
+            )
+            for tweet, matched in zip(tweets, plan.attribute(tweets)):
+                key = tweet.get("id") if tweet.get("id") is not None else id(tweet)
+                if key in results:
+                    seen = results[key]["keywords"]
+                    seen.extend(k for k in matched if k not in seen)
+                else:
+                    results[key] = {**tweet, "keywords": matched}
+        logger.info(f"Searched {len(keywords)} keywords with {len(plans)} queries, {len(results)} tweets")
+        return list(results.values())
     
     def search_trendy_tweets(self, query: str, count: int = 10, date_str: str = None, min_likes: int = 10, min_retweets: int = 10) -> List[Dict]:
         """
@@ -281,70 +726,196 @@ class XConnector(BaseSocialConnector):
         """
         if not self.api_key:
             raise AuthenticationException("API key is required for X API calls")
-            
+        
+        return self._coalesce(
+            self._search_key(query, count, date_str, min_likes, min_retweets),
+            lambda: self._search_trendy_tweets(query, count, date_str, min_likes, min_retweets)
+        )
+    
+    async def search_trendy_tweets_async(self, query: str, count: int = 10, date_str: str = None,
+                                         min_likes: int = 10, min_retweets: int = 10) -> List[Dict]:
+        """
+        Async variant of search_trendy_tweets(); the request runs in the event loop's default executor.
+        
+        Concurrent identical calls, from coroutines or threads, share one request.
+        """
+        if not self.api_key:
+            raise AuthenticationException("API key is required for X API calls")
+        
+        return await self._coalesce_async(
+            self._search_key(query, count, date_str, min_likes, min_retweets),
+            functools.partial(self._search_trendy_tweets, query, count, date_str, min_likes, min_retweets)
+        )
+    
+    @staticmethod
+    def _search_key(query: str, count: int, date_str: Optional[str], min_likes: int, min_retweets: int) -> Tuple:
+        # Whitespace is normalized but case is kept: "OR" is an operator, "or" is a word
+        return ("search_trendy_tweets", " ".join(query.split()), count, date_str, min_likes, min_retweets)
+    
+    def _search_trendy_tweets(self, query: str, count: int, date_str: Optional[str],
+                              min_likes: int, min_retweets: int) -> List[Dict]:
         try:
-            # Prepare the request
-            session = requests.Session()
-            endpoint = "tool/twitter/search"
-            url = f"{self.base_url}/{endpoint}"
-            
-            # Build query string with date filter if provided
-            query_params = {}
-            
-            # Build the enhanced query with filters
-            enhanced_query = query
-            
-            # Add date filter if provided
-            if date_str:
-                try:
-                    # Validate date format
-                    filter_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    # Add date to query
-                    enhanced_query = f"{enhanced_query} since:{date_str}"
-                except ValueError:
-                    logger.warning(f"Invalid date format: {date_str}, using query without date filter")
-            
-            # Add popularity filters
-            if min_likes is not None and min_likes > 0:
-                enhanced_query = f"{enhanced_query} min_faves:{min_likes}"
-            
-            if min_retweets is not None and min_retweets > 0:
-                enhanced_query = f"{enhanced_query} min_retweets:{min_retweets}"
-            
-            # Set the query parameter
-            query_params['query'] = enhanced_query
-                
-            # Set max results
-            query_params['maxResults'] = count
-            
-            # Set headers
-            headers = {
-                'Accept': 'application/json',
-                'x-api-key': self.api_key
-            }
-            
-            # Make the request
-            response = session.get(url, params=query_params, headers=headers)
-            response.raise_for_status()
-            
-            # Parse the response
-            data = response.json()
-            
-            # Handle different response formats
-            if isinstance(data, dict):
-                # Response is a dictionary with a 'data' field
-                result = data.get('data', [])
-            elif isinstance(data, list):
-                # Response is directly a list
-                result = data
-            else:
-                result = []
-                
+            enhanced_query = self._build_search_query(query, date_str, min_likes, min_retweets)
+            result, _ = self._search_page(enhanced_query, count)
             logger.info(f"Found {len(result)} tweets matching query: {query}")
             return result
-        except requests.RequestException as e:
+        except (requests.RequestException, RateLimitException) as e:
             logger.error(f"Failed to search tweets: {e}")
+            self._errors.inc(connector="x", method="search_trendy_tweets")
             return []
+    
+    def iter_search_tweets(self, query: str, page_size: int = 20, date_str: str = None,
+                           min_likes: int = 10, min_retweets: int = 10, max_results: Optional[int] = None,
+                           max_pages: Optional[int] = None, where: Optional[Callable[[Dict], bool]] = None,
+                           stop: Optional[Callable[[Dict], bool]] = None) -> Iterator[Dict]:
+        """
+        Stream search results across pages, following the API's pagination cursor.
+        
+        Pages are requested only as the caller consumes tweets and just one
+        page is held at a time, so memory stays constant however many
+        results are scanned. Iteration ends when the results run out, a
+        budget is reached, stop() fires or the caller stops iterating.
+        
+        Args:
+            query: Search query string
+            page_size: Tweets requested per page
+            date_str: Optional date string in format 'yyyy-mm-dd' to filter tweets from
+            min_likes: Minimum number of likes for tweets to include
+            min_retweets: Minimum number of retweets for tweets to include
+            max_results: Maximum number of tweets yielded (after where)
+            max_pages: Maximum number of pages requested
+            where: Only yield tweets for which this returns True (e.g. a relevance check)
+            stop: End the search at the first tweet for which this returns True (not yielded)
+            
+        Yields:
+            Raw tweet dictionaries, in API order
+            
+        Raises:
+            requests.RequestException: If a page request fails
+        """
+        if not self.api_key:
+            raise AuthenticationException("API key is required for X API calls")
+        
+        yielded = 0
+        # Ids of the previous page only, to drop repeats at page boundaries
+        previous_ids: Set = set()
+        
+        pages = self.iter_search_pages(query, page_size, date_str, min_likes, min_retweets, max_pages)
+        for page in pages:
+            page_ids = set()
+            for tweet in page:
+                tweet_id = tweet.get("id")
+                if tweet_id is not None:
+                    if tweet_id in previous_ids:
+                        continue
+                    page_ids.add(tweet_id)
+                if stop is not None and stop(tweet):
+                    return
+                if where is not None and not where(tweet):
+                    continue
+                yield tweet
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+            previous_ids = page_ids
+    
+    def iter_search_pages(self, query: str, page_size: int = 20, date_str: str = None,
+                          min_likes: int = 10, min_retweets: int = 10,
+                          max_pages: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Stream raw search result pages, following the pagination cursor.
+        
+        Args:
+            query: Search query string
+            page_size: Tweets requested per page
+            date_str: Optional date string in format 'yyyy-mm-dd' to filter tweets from
+            min_likes: Minimum number of likes for tweets to include
+            min_retweets: Minimum number of retweets for tweets to include
+            max_pages: Maximum number of pages requested
+            
+        Yields:
+            Lists of raw tweet dictionaries, one per page
+        """
+        if not self.api_key:
+            raise AuthenticationException("API key is required for X API calls")
+        
+        enhanced_query = self._build_search_query(query, date_str, min_likes, min_retweets)
+        cursor = None
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            page, next_cursor = self._search_page(enhanced_query, page_size, cursor)
+            pages += 1
+            if page:
+                yield page
+            # A cursor that does not advance would request the same page forever
+            if not page or not next_cursor or next_cursor == cursor:
+                return
+            cursor = next_cursor
+    
+    def _build_search_query(self, query: str, date_str: str = None, min_likes: int = 10,
+                            min_retweets: int = 10) -> str:
+        """Append the since:, min_faves: and min_retweets: filters to a search query."""
+        # Build the enhanced query with filters
+        enhanced_query = query
+        
+        # Add date filter if provided
+        if date_str:
+            try:
+                # Validate date format
+                datetime.strptime(date_str, '%Y-%m-%d')
+                # Add date to query
+                enhanced_query = f"{enhanced_query} since:{date_str}"
+            except ValueError:
+                logger.warning(f"Invalid date format: {date_str}, using query without date filter")
+        
+        # Add popularity filters
+        if min_likes is not None and min_likes > 0:
+            enhanced_query = f"{enhanced_query} min_faves:{min_likes}"
+        
+        if min_retweets is not None and min_retweets > 0:
+            enhanced_query = f"{enhanced_query} min_retweets:{min_retweets}"
+        
+        return enhanced_query
+    
+    def _search_page(self, enhanced_query: str, count: int, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Request one page of search results and return its tweets and the next page cursor."""
+        query_params = {'query': enhanced_query, 'maxResults': count}
+        if cursor:
+            query_params[self.SEARCH_CURSOR_PARAM] = cursor
+        
+        # Make the request and parse the response
+        data = self._get_json("tool/twitter/search", query_params)
+        
+        # Handle different response formats
+        if isinstance(data, dict):
+            # Response is a dictionary with a 'data' field
+            result = data.get('data', [])
+            result = result if isinstance(result, list) else []
+            self._store_tweets(result)
+            return result, self._next_cursor(data)
+        elif isinstance(data, list):
+            # Response is directly a list
+            self._store_tweets(data)
+            return data, None
+        return [], None
+    
+    def _store_tweets(self, tweets: List[Dict]):
+        """Persist fetched raw tweets to the tweet store, if one is configured."""
+        if self.store is not None and tweets:
+            self.store.upsert_tweets(tweets)
+    
+    @staticmethod
+    def _next_cursor(data: Dict) -> Optional[str]:
+        """Next page cursor from a search response, under any of the names providers use."""
+        for key in ('next_cursor', 'nextCursor', 'cursor', 'next_token'):
+            if data.get(key):
+                return str(data[key])
+        meta = data.get('meta')
+        if isinstance(meta, dict):
+            for key in ('next_token', 'next_cursor', 'nextCursor'):
+                if meta.get(key):
+                    return str(meta[key])
+        return None
 
 # Usage example
 if __name__ == "__main__":
@@ -429,5 +1000,10 @@ if __name__ == "__main__":
 
 
     print("\n--- Example 3: Get relevant content filtered by profile ---")
+    candidates = search_results + (account_tweets if isinstance(account_tweets, list) else [])
+    relevant = connector.filter_relevant(candidates, min_score=1.0)
+    print(f"{len(relevant)} of {len(candidates)} tweets are relevant to {connector.profile.get('name', 'the profile')}")
+    for tweet in relevant[:3]:
+        print(f"[{tweet['relevance']:.1f}] {tweet.get('text', '')[:100]} (matched: {', '.join(tweet['matched_terms'])})")
 
 
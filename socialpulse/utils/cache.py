@@ -0,0 +1,266 @@
+"""Response caching with per-endpoint TTLs and an LRU size cap."""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def make_cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a cache key from an endpoint and its normalized parameters.
+
+    Parameter names are case-folded, values are stripped strings, None
+    values are dropped and the parameters are sorted, so requests that
+    differ only in ordering or formatting share the same key.
+
+    Args:
+        endpoint: API endpoint path
+        params: Query parameters
+
+    Returns:
+        Stable string key
+    """
+    normalized = {}
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        normalized[str(name).lower()] = str(value).strip()
+    return f"{endpoint.strip('/')}?{json.dumps(normalized, sort_keys=True, separators=(',', ':'))}"
+
+class SQLiteCacheBackend:
+    """On-disk cache storage so cached responses survive restarts."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " expires_at REAL,"
+            " accessed_at REAL NOT NULL,"
+            " value TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Optional[float], Any]]:
+        """Return (expires_at, value) for a key, or None if absent."""
+        row = self._conn.execute(
+            "SELECT expires_at, value FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        self._conn.commit()
+        return row[0], json.loads(row[1])
+
+    def set(self, key: str, expires_at: Optional[float], value: Any):
+        """Store a value."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, expires_at, accessed_at, value) VALUES (?, ?, ?, ?)",
+            (key, expires_at, time.time(), json.dumps(value))
+        )
+        self._conn.commit()
+
+    def delete(self, key: str):
+        """Remove a key if present."""
+        self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def evict(self, max_entries: int) -> int:
+        """
+        Drop expired entries, then the least recently used ones beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = self._conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        ).rowcount
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        if count > max_entries:
+            removed += self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                " SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                (count - max_entries,)
+            ).rowcount
+        self._conn.commit()
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        self._conn.execute("DELETE FROM cache")
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache for API responses.
+
+    Entries are keyed on endpoint and normalized parameters (see
+    make_cache_key). Each endpoint can have its own TTL, the in-memory store
+    is capped at ``max_entries`` with least-recently-used eviction, and an
+    optional SQLite file keeps entries across restarts.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[float] = 300.0,
+                 ttls: Optional[Dict[str, Optional[float]]] = None, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept (LRU eviction beyond that)
+            default_ttl: TTL in seconds for endpoints without an explicit TTL (None never expires)
+            ttls: Per-endpoint TTLs in seconds, keyed by endpoint path
+            path: Optional SQLite file for a persistent on-disk backend
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = {endpoint.strip('/'): ttl for endpoint, ttl in (ttls or {}).items()}
+        self.backend = SQLiteCacheBackend(path) if path else None
+
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """TTL in seconds applied to responses from the given endpoint."""
+        return self.ttls.get(endpoint.strip('/'), self.default_ttl)
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        return self.get_key(make_cache_key(endpoint, params))
+
+    def set(self, endpoint: str, params: Optional[Dict[str, Any]], value: Any,
+            ttl: Optional[float] = None):
+        """
+        Store a response.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            value: JSON-serializable response data (None is never cached)
+            ttl: Override the endpoint TTL for this entry
+        """
+        ttl = ttl if ttl is not None else self.ttl_for(endpoint)
+        self.set_key(make_cache_key(endpoint, params), value, ttl)
+
+    def get_key(self, key: str) -> Optional[Any]:
+        """Look up a value by a precomputed key. See get()."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.backend is not None:
+                entry = self.backend.get(key)
+                if entry is not None:
+                    self._store(key, entry)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= now:
+                self._entries.pop(key, None)
+                if self.backend is not None:
+                    self.backend.delete(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set_key(self, key: str, value: Any, ttl: Optional[float]):
+        """Store a value under a precomputed key. See set()."""
+        if value is None:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._store(key, (expires_at, value))
+            if self.backend is not None:
+                self.backend.set(key, expires_at, value)
+                if len(self.backend) > self.max_entries:
+                    self.backend.evict(self.max_entries)
+
+    def _store(self, key: str, entry: Tuple[Optional[float], Any]):
+        """Insert into the in-memory LRU, evicting the oldest entries. Caller holds the lock."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, endpoint: str, params: Optional[Dict[str, Any]] = None):
+        """Remove a single cached response."""
+        key = make_cache_key(endpoint, params)
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.backend is not None:
+                self.backend.delete(key)
+
+    def clear(self):
+        """Remove every cached response (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            if self.backend is not None:
+                self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, expirations, size and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._entries),
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def close(self):
+        """Close the on-disk backend, if any."""
+        if self.backend is not None:
+            self.backend.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
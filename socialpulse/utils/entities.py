@@ -0,0 +1,110 @@
+"""Single-pass extraction of hashtags, cashtags, mentions and URLs from post text."""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# One alternation scanned left to right: a sigil followed by a word, or a
+# URL. A URL is consumed whole, so "#" or "@" inside a link is not mistaken
+# for an entity. Sigil words are validated per kind in _add_match().
+_ENTITY_PATTERN = (
+    r"(?<![\w&#$@])([#$@])(\w+)"
+    r"|(https?://[^\s<>\"\x00]*[^\s<>\"\x00.,;:!?)\]'])"
+)
+_ENTITY_RE = re.compile(_ENTITY_PATTERN)
+
+# Batch scans join texts with NUL and match it as an extra alternative to
+# know when the next text starts
+_SEPARATOR = "\x00"
+_BATCH_RE = re.compile(_ENTITY_PATTERN + r"|(\x00)")
+
+_KINDS = ("hashtags", "cashtags", "mentions", "urls")
+
+@dataclass
+class Entities:
+    """Entities found in one text, in order of first appearance, without duplicates."""
+    hashtags: List[str] = field(default_factory=list)
+    cashtags: List[str] = field(default_factory=list)
+    mentions: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Convert to dictionary representation."""
+        return {kind: getattr(self, kind) for kind in _KINDS}
+
+def _add(values: List[str], value: str, normalize: bool):
+    # Hashtags, cashtags and mentions are case-insensitive; URLs keep their case
+    if normalize:
+        value = sys.intern(value.casefold())
+    if value not in values:
+        values.append(value)
+
+def _add_match(entities: Entities, match: Tuple[str, ...], normalize: bool):
+    sigil, word, url = match[:3]
+    if sigil == "#":
+        # Hashtags need at least one non-digit ("#1" is not a hashtag)
+        if not word.isdigit():
+            _add(entities.hashtags, word, normalize)
+    elif sigil == "$":
+        # Cashtags are short and start with a letter ("$100" is an amount)
+        if len(word) <= 10 and word[0].isalpha() and word.isascii():
+            _add(entities.cashtags, word, normalize)
+    elif sigil == "@":
+        if len(word) <= 15:
+            _add(entities.mentions, word, normalize)
+    elif url and url not in entities.urls:
+        entities.urls.append(url)
+
+def extract_entities(text: Optional[str], normalize: bool = True) -> Entities:
+    """
+    Extract hashtags, cashtags, mentions and URLs in a single regex pass.
+
+    Handles entities that touch punctuation ("#BTC," "(@alice)"), ignores
+    "$100"-style amounts and "#" or "@" inside URLs.
+
+    Args:
+        text: Post text
+        normalize: Case-fold and intern hashtags, cashtags and mentions
+
+    Returns:
+        Entities without the leading '#', '$' or '@'
+    """
+    entities = Entities()
+    if text:
+        for match in _ENTITY_RE.findall(text):
+            _add_match(entities, match, normalize)
+    return entities
+
+def extract_hashtags(text: Optional[str], normalize: bool = False) -> List[str]:
+    """Hashtags in text without the leading '#', in their original case unless normalize is set."""
+    return extract_entities(text, normalize=normalize).hashtags
+
+def extract_entities_batch(texts: Sequence[Optional[str]], normalize: bool = True) -> List[Entities]:
+    """
+    Extract entities from many texts with one regex scan.
+
+    The texts are joined with a NUL separator, which no entity can span,
+    and scanned once; each separator match moves on to the next text.
+
+    Args:
+        texts: Post texts (None is treated as empty)
+        normalize: Case-fold and intern hashtags, cashtags and mentions
+
+    Returns:
+        One Entities per text, in order
+    """
+    results = [Entities() for _ in texts]
+    if not results:
+        return results
+
+    index = 0
+    entities = results[0]
+    joined = _SEPARATOR.join(t.replace(_SEPARATOR, " ") if t else "" for t in texts)
+    for match in _BATCH_RE.findall(joined):
+        if match[3]:
+            index += 1
+            entities = results[index]
+        else:
+            _add_match(entities, match, normalize)
+    return results
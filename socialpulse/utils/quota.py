@@ -0,0 +1,206 @@
+"""API quota shared by every process that uses the same API key.
+
+``SharedQuota`` keeps a token bucket in a small SQLite database. Each
+acquire runs in an ``IMMEDIATE`` transaction, so any number of worker
+processes (and threads) draw from one budget. Responses feed their
+``x-ratelimit-*`` headers back with ``sync()``, which corrects the
+bucket to what the server reports. A 429 pauses everyone until the
+reset time.
+
+Calls are either interactive or background. Background calls leave a
+reserve of requests untouched, so CLI and ad-hoc calls still get through
+while a backfill is draining the quota.
+"""
+
+import time
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+class SharedQuota:
+    """Cross-process token bucket synchronized with the server's rate limit headers."""
+
+    def __init__(self, path: str = "x_quota.db", name: str = "default", requests: int = 900,
+                 window: float = 900.0, reserve: Optional[int] = None, poll_interval: float = 0.5):
+        """
+        Open (or create) the shared quota.
+
+        Args:
+            path: Path of the SQLite database file shared by all processes
+            name: Quota name; processes using the same API key must use the same name
+            requests: Requests allowed per window
+            window: Window length in seconds
+            reserve: Requests only interactive calls may use (defaults to 10% of the
+                server-reported limit, or of requests until the server reports one)
+            poll_interval: Longest sleep between checks while waiting, so changes
+                made by other processes are noticed
+        """
+        self.path = path
+        self.name = name
+        self.rate = requests / window
+        self.capacity = float(requests)
+        self.reserve = reserve
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # isolation_level=None: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS quotas ("
+            " name TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " server_limit INTEGER,"
+            " server_remaining INTEGER,"
+            " server_reset REAL,"
+            " paused_until REAL NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO quotas (name, tokens, updated_at) VALUES (?, ?, ?)",
+            (name, self.capacity, time.time())
+        )
+
+    def _begin(self):
+        # Takes the database write lock up front, so read-modify-write is atomic across processes
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def _load(self, now: float) -> Dict:
+        row = self._conn.execute(
+            "SELECT tokens, updated_at, server_limit, server_remaining, server_reset, paused_until"
+            " FROM quotas WHERE name = ?", (self.name,)
+        ).fetchone()
+        tokens, updated_at, limit, remaining, reset, paused_until = row
+        if reset is not None and now >= reset:
+            # The server window has rolled over; its remaining count is stale
+            remaining = reset = None
+        return {
+            "tokens": min(self.capacity, tokens + max(0.0, now - updated_at) * self.rate),
+            "limit": limit,
+            "remaining": remaining,
+            "reset": reset,
+            "paused_until": paused_until
+        }
+
+    def _store(self, state: Dict, now: float):
+        self._conn.execute(
+            "UPDATE quotas SET tokens = ?, updated_at = ?, server_limit = ?, server_remaining = ?,"
+            " server_reset = ?, paused_until = ? WHERE name = ?",
+            (state["tokens"], now, state["limit"], state["remaining"], state["reset"],
+             state["paused_until"], self.name)
+        )
+
+    def _reserve(self, state: Dict) -> int:
+        if self.reserve is not None:
+            return self.reserve
+        return max(1, int(state["limit"] or self.capacity) // 10)
+
+    def _try_take(self, priority: str, now: float) -> float:
+        """Take one request if allowed; return 0, or how long to wait before trying again."""
+        state = self._load(now)
+        floor = 0 if priority == INTERACTIVE else self._reserve(state)
+        if now < state["paused_until"]:
+            return state["paused_until"] - now
+        remaining = state["remaining"]
+        if remaining is not None and remaining <= floor:
+            return state["reset"] - now
+        if state["tokens"] < floor + 1:
+            return (floor + 1 - state["tokens"]) / self.rate
+
+        state["tokens"] -= 1
+        if remaining is not None:
+            # Count the request against the server budget before its response reports it
+            state["remaining"] = remaining - 1
+        self._store(state, now)
+        return 0.0
+
+    def try_acquire(self, priority: str = INTERACTIVE) -> bool:
+        """Take one request from the quota if it is available right now, without blocking."""
+        return self.acquire(priority, timeout=0)
+
+    def acquire(self, priority: str = INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the quota allows one more request and take it.
+
+        Args:
+            priority: INTERACTIVE or BACKGROUND; background calls don't use the reserve
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a request was granted, False if the timeout expired
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {PRIORITIES}")
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            now = time.time()
+            with self._lock:
+                self._begin()
+                try:
+                    wait = self._try_take(priority, now)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            if wait <= 0:
+                return True
+            if deadline is not None:
+                if now >= deadline:
+                    return False
+                wait = min(wait, deadline - now)
+            time.sleep(min(wait, self.poll_interval))
+
+    def sync(self, rate_limit: Dict[str, Optional[int]]):
+        """
+        Correct the shared state from a response's rate limit headers.
+
+        Args:
+            rate_limit: Dict with 'limit', 'remaining' and 'reset' (epoch seconds)
+                as returned by parse_rate_limit_headers()
+        """
+        remaining, reset = rate_limit.get("remaining"), rate_limit.get("reset")
+        if remaining is None:
+            return
+        now = time.time()
+        with self._lock:
+            self._begin()
+            try:
+                state = self._load(now)
+                if state["reset"] is not None and reset is not None and reset < state["reset"]:
+                    # A late response from the previous window
+                    self._conn.execute("ROLLBACK")
+                    return
+                if reset is not None:
+                    same_window = state["remaining"] is not None and reset == state["reset"]
+                    # Responses can arrive out of order; within a window the lowest count is the newest
+                    state["remaining"] = min(state["remaining"], remaining) if same_window else remaining
+                    state["reset"] = reset
+                # Without a reset time the count can't be expired later, so it only caps the bucket
+                state["limit"] = rate_limit.get("limit") or state["limit"]
+                state["tokens"] = min(state["tokens"], float(remaining))
+                self._store(state, now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def pause(self, seconds: float):
+        """Hold every process's requests for the given time (e.g. after a 429)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE quotas SET paused_until = max(paused_until, ?) WHERE name = ?",
+                (now + seconds, self.name)
+            )
+
+    def state(self) -> Dict:
+        """Current shared state: tokens, server limit/remaining/reset and paused_until."""
+        with self._lock:
+            return self._load(time.time())
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,95 @@
+"""Client-side rate limiting utilities."""
+
+import time
+import threading
+from typing import Optional
+
+class TokenBucket:
+    """Thread-safe token bucket limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    A single bucket can be shared by every thread that talks to the same API
+    so that together they stay within the provider's quota.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second's worth, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_quota(cls, requests: int, window: float, burst: Optional[float] = None) -> "TokenBucket":
+        """
+        Create a bucket sized to an API quota such as "900 requests / 15 mins".
+
+        Args:
+            requests: Number of requests allowed per window
+            window: Window length in seconds
+            burst: Maximum burst size (defaults to the full window allowance)
+
+        Returns:
+            TokenBucket refilling at requests/window tokens per second
+        """
+        return cls(rate=requests / window, capacity=burst if burst is not None else requests)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if they are available right now, without blocking."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Block until tokens are available and take them.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the tokens were acquired, False if the timeout expired
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
@@ -0,0 +1,173 @@
+"""Single-flight coalescing of identical concurrent calls.
+
+When several callers ask for the same thing at the same moment, only the
+first one runs the call. The others wait for it and receive the same
+result, or the same exception.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+class _Call:
+    """One in-flight call and the outcome its waiters share."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key, from threads or coroutines.
+
+    Only calls that overlap in time are merged; once a call finishes, the
+    next call with the same key runs again (use ResponseCache to reuse
+    results over time). Waiters receive the very object the call
+    returned, so treat shared results as read-only.
+    """
+
+    def __init__(self, on_duplicate: Callable[[Hashable], None] = None):
+        """
+        Args:
+            on_duplicate: Optional callback invoked with the key of every coalesced call
+        """
+        self.on_duplicate = on_duplicate
+        self.calls = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._in_flight_async: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+
+    def _duplicate(self, key: Hashable):
+        # Called with the lock held
+        self.deduplicated += 1
+        if self.on_duplicate is not None:
+            self.on_duplicate(key)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the identical call already running in another thread.
+
+        Args:
+            key: Normalized request key
+            fn: Zero-argument callable performing the request
+
+        Returns:
+            fn's result (shared with every coalesced caller)
+
+        Raises:
+            Whatever fn raised, in every coalesced caller
+        """
+        return self._do(key, fn, count=True)
+
+    def _do(self, key: Hashable, fn: Callable[[], Any], count: bool) -> Any:
+        with self._lock:
+            if count:
+                self.calls += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+            else:
+                self._duplicate(key)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or the identical call already awaited by another task on this event loop.
+
+        Args:
+            key: Normalized request key
+            fn: Zero-argument callable returning an awaitable that performs the request
+
+        Returns:
+            The awaited result (shared with every coalesced caller)
+
+        Raises:
+            Whatever the awaitable raised, in every coalesced caller
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight_async.get(flight_key)
+            leader = future is None
+            if leader:
+                future = self._in_flight_async[flight_key] = loop.create_future()
+            else:
+                self._duplicate(key)
+
+        if not leader:
+            # shield: a cancelled waiter must not cancel the leader's request
+            return await asyncio.shield(future)
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.cancelled():
+                future.set_exception(e)
+                # Mark retrieved so a call without waiters doesn't log "exception never retrieved"
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight_async[flight_key]
+
+    async def do_in_executor(self, key: Hashable, fn: Callable[[], Any], executor=None) -> Any:
+        """
+        Run blocking fn in an executor, or join the identical call already running.
+
+        Coalesces with coroutines awaiting the same key on this event loop
+        and with threads calling do() with the same key. Each await counts
+        as one call, however it is served.
+
+        Args:
+            key: Normalized request key
+            fn: Zero-argument blocking callable performing the request
+            executor: concurrent.futures executor (None uses the loop's default)
+
+        Returns:
+            fn's result (shared with every coalesced caller)
+        """
+        loop = asyncio.get_running_loop()
+        # The executor thread joins threaded callers too, without counting the call again
+        return await self.do_async(key, lambda: loop.run_in_executor(executor, self._do, key, fn, False))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        with self._lock:
+            return len(self._in_flight) + len(self._in_flight_async)
+
+    def stats(self) -> Dict[str, int]:
+        """Calls made, calls coalesced into another one, and calls currently running."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "deduplicated": self.deduplicated,
+                "in_flight": len(self._in_flight) + len(self._in_flight_async)
+            }
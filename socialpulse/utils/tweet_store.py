@@ -0,0 +1,431 @@
+"""Embedded store of fetched tweets, accounts and trend snapshots.
+
+Tweets are normalized into SQLite (WAL mode) with their hashtags in a
+separate (hashtag, timestamp) table, so historical questions such as "how
+did #DeSci trend this week" are answered from disk without API calls.
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from socialpulse.models.trend import TrendTopic
+    from socialpulse.utils.entities import extract_entities_batch
+except ImportError:
+    # If running directly from socialpulse directory
+    from models.trend import TrendTopic
+    from utils.entities import extract_entities_batch
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS tweets ("
+    " id TEXT PRIMARY KEY,"
+    " author TEXT,"
+    " timestamp INTEGER NOT NULL,"
+    " text TEXT,"
+    " likes INTEGER NOT NULL DEFAULT 0,"
+    " retweets INTEGER NOT NULL DEFAULT 0,"
+    " replies INTEGER NOT NULL DEFAULT 0,"
+    " views INTEGER NOT NULL DEFAULT 0,"
+    " url TEXT,"
+    " fetched_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS tweets_author ON tweets (author, timestamp)",
+    "CREATE INDEX IF NOT EXISTS tweets_timestamp ON tweets (timestamp)",
+    # Clustered on (hashtag, timestamp) so a volume series is one range scan
+    "CREATE TABLE IF NOT EXISTS tweet_hashtags ("
+    " hashtag TEXT NOT NULL,"
+    " timestamp INTEGER NOT NULL,"
+    " tweet_id TEXT NOT NULL,"
+    " PRIMARY KEY (hashtag, timestamp, tweet_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS tweet_hashtags_tweet ON tweet_hashtags (tweet_id)",
+    "CREATE TABLE IF NOT EXISTS accounts ("
+    " handle TEXT PRIMARY KEY,"
+    " last_tweet_at INTEGER,"
+    " updated_at REAL NOT NULL,"
+    " data TEXT)",
+    "CREATE TABLE IF NOT EXISTS trend_snapshots ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " name TEXT NOT NULL,"
+    " platform TEXT,"
+    " volume INTEGER,"
+    " timestamp REAL NOT NULL,"
+    " metadata TEXT)",
+    "CREATE INDEX IF NOT EXISTS trend_snapshots_name ON trend_snapshots (name, timestamp)",
+    "CREATE INDEX IF NOT EXISTS trend_snapshots_timestamp ON trend_snapshots (timestamp)",
+)
+
+_UPSERT_TWEET = (
+    "INSERT INTO tweets (id, author, timestamp, text, likes, retweets, replies, views, url, fetched_at)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (id) DO UPDATE SET"
+    " likes = excluded.likes, retweets = excluded.retweets, replies = excluded.replies,"
+    " views = excluded.views, fetched_at = excluded.fetched_at"
+)
+
+_UPSERT_AUTHOR = (
+    "INSERT INTO accounts (handle, last_tweet_at, updated_at) VALUES (?, ?, ?)"
+    " ON CONFLICT (handle) DO UPDATE SET"
+    " last_tweet_at = max(coalesce(last_tweet_at, 0), excluded.last_tweet_at),"
+    " updated_at = excluded.updated_at"
+)
+
+_TWEET_COLUMNS = "t.id, t.author, t.timestamp, t.text, t.likes, t.retweets, t.replies, t.views, t.url"
+
+def _normalize_handle(handle: Optional[str]) -> Optional[str]:
+    return handle.lstrip('@').lower() if handle else None
+
+def _normalize_hashtag(hashtag: str) -> str:
+    return hashtag.lstrip('#').casefold()
+
+def _epoch(value) -> Optional[int]:
+    """Seconds since epoch from a number, datetime or ISO string (None passes through)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value).timestamp())
+    return int(value)
+
+def _tweet_timestamp(tweet: Dict) -> int:
+    """Epoch timestamp of a raw (timestamp) or formatted (created_at) tweet."""
+    timestamp = tweet.get("timestamp")
+    if timestamp is not None:
+        return int(timestamp)
+    created_at = tweet.get("created_at")
+    if created_at:
+        return int(datetime.fromisoformat(created_at).timestamp())
+    return int(time.time())
+
+class TweetStore:
+    """SQLite-backed history of tweets, accounts and trend snapshots.
+
+    Accepts both raw API tweets and the formatted dicts returned by
+    XConnector. Upserts are keyed on tweet id, so re-fetching a tweet only
+    refreshes its engagement counts.
+    """
+
+    def __init__(self, path: str = "socialpulse.db", batch_size: int = 500):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Path of the SQLite database file (":memory:" for a throwaway store)
+            batch_size: Tweets written per transaction by upsert_tweets
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent on crash; NORMAL only risks the last commits on power loss
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    @staticmethod
+    def _tweet_rows(tweets: Sequence[Dict], fetched_at: float) -> Tuple[List[tuple], List[tuple], Dict[str, int]]:
+        """Tweet rows, (hashtag, timestamp, id) rows and newest tweet per author for a batch."""
+        # Hashtags are only extracted for tweets that don't carry them
+        missing = [i for i, tweet in enumerate(tweets) if not tweet.get("hashtags")]
+        extracted = dict(zip(missing, extract_entities_batch([tweets[i].get("text") for i in missing])))
+
+        tweet_rows, hashtag_rows, authors = [], [], {}
+        for i, tweet in enumerate(tweets):
+            tweet_id = tweet.get("id")
+            if tweet_id is None:
+                continue
+            tweet_id = str(tweet_id)
+            timestamp = _tweet_timestamp(tweet)
+            author = _normalize_handle(tweet.get("author") or tweet.get("username"))
+            metrics = tweet.get("metrics") or tweet
+            tweet_rows.append((
+                tweet_id, author, timestamp, tweet.get("text"),
+                int(metrics.get("likes") or 0), int(metrics.get("retweets") or 0),
+                int(metrics.get("replies") or 0), int(metrics.get("views") or 0),
+                tweet.get("url") or tweet.get("permanentUrl"), fetched_at
+            ))
+            hashtags = extracted[i].hashtags if i in extracted else tweet.get("hashtags") or []
+            for hashtag in {_normalize_hashtag(h) for h in hashtags if h}:
+                hashtag_rows.append((hashtag, timestamp, tweet_id))
+            if author and timestamp > authors.get(author, -1):
+                authors[author] = timestamp
+        return tweet_rows, hashtag_rows, authors
+
+    def upsert_tweets(self, tweets: Iterable[Dict]) -> int:
+        """
+        Insert tweets, or refresh the engagement counts of ones already stored.
+
+        Writes go out in transactions of batch_size tweets; tweets without
+        an id are skipped. Each author is recorded in the accounts table.
+
+        Args:
+            tweets: Raw or formatted tweet dicts
+
+        Returns:
+            Number of tweets written
+        """
+        written = 0
+        batch = []
+        for tweet in tweets:
+            batch.append(tweet)
+            if len(batch) >= self.batch_size:
+                written += self._write_batch(batch)
+                batch = []
+        if batch:
+            written += self._write_batch(batch)
+        return written
+
+    def _write_batch(self, tweets: List[Dict]) -> int:
+        now = time.time()
+        tweet_rows, hashtag_rows, authors = self._tweet_rows(tweets, now)
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT_TWEET, tweet_rows)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tweet_hashtags (hashtag, timestamp, tweet_id) VALUES (?, ?, ?)",
+                hashtag_rows
+            )
+            self._conn.executemany(
+                _UPSERT_AUTHOR, [(author, timestamp, now) for author, timestamp in authors.items()]
+            )
+        return len(tweet_rows)
+
+    def upsert_accounts(self, accounts: Iterable[Dict]):
+        """
+        Store account details (e.g. user-info responses).
+
+        Args:
+            accounts: Dicts with a 'userName', 'username', 'handle' or 'author' key;
+                the whole dict is kept as the account data
+        """
+        now = time.time()
+        rows = []
+        for account in accounts:
+            handle = _normalize_handle(
+                account.get("userName") or account.get("username") or account.get("handle") or account.get("author")
+            )
+            if handle:
+                rows.append((handle, now, json.dumps(account)))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO accounts (handle, updated_at, data) VALUES (?, ?, ?)"
+                " ON CONFLICT (handle) DO UPDATE SET updated_at = excluded.updated_at, data = excluded.data",
+                rows
+            )
+
+    def get_account(self, handle: str) -> Optional[Dict]:
+        """Stored account as {'handle', 'last_tweet_at', 'updated_at', 'data'}, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT handle, last_tweet_at, updated_at, data FROM accounts WHERE handle = ?",
+                (_normalize_handle(handle),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "handle": row[0],
+            "last_tweet_at": row[1],
+            "updated_at": row[2],
+            "data": json.loads(row[3]) if row[3] else {}
+        }
+
+    def save_trends(self, trends: Iterable[TrendTopic], timestamp=None) -> int:
+        """
+        Record a snapshot of trending topics.
+
+        Args:
+            trends: TrendTopic objects
+            timestamp: Snapshot time (datetime or epoch seconds); defaults to now
+
+        Returns:
+            Number of topics saved
+        """
+        taken_at = _epoch(timestamp) if timestamp is not None else time.time()
+        rows = [
+            (trend.name, trend.platform, trend.volume, taken_at, json.dumps(trend.metadata or {}, default=str))
+            for trend in trends
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO trend_snapshots (name, platform, volume, timestamp, metadata) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def trend_history(self, name: Optional[str] = None, since=None, until=None) -> List[TrendTopic]:
+        """
+        Stored trend snapshots, oldest first.
+
+        Args:
+            name: Only snapshots of this topic (all topics if None)
+            since: Start of the range, inclusive (datetime, ISO string or epoch seconds)
+            until: End of the range, exclusive
+
+        Returns:
+            TrendTopic objects with the snapshot time as their timestamp
+        """
+        clauses, params = self._range_clauses("timestamp", since, until)
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT name, platform, volume, timestamp, metadata FROM trend_snapshots{where}"
+                " ORDER BY timestamp, id",
+                params
+            ).fetchall()
+        return [
+            TrendTopic(
+                name=name, volume=volume, platform=platform,
+                timestamp=datetime.fromtimestamp(timestamp), metadata=json.loads(metadata) if metadata else {}
+            )
+            for name, platform, volume, timestamp, metadata in rows
+        ]
+
+    @staticmethod
+    def _range_clauses(column: str, since, until) -> Tuple[List[str], List]:
+        clauses, params = [], []
+        if since is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append(f"{column} < ?")
+            params.append(_epoch(until))
+        return clauses, params
+
+    def get_tweets(self, author: Optional[str] = None, hashtag: Optional[str] = None,
+                   since=None, until=None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Stored tweets, newest first.
+
+        Args:
+            author: Only tweets by this handle
+            hashtag: Only tweets with this hashtag (with or without #, any case)
+            since: Start of the range, inclusive (datetime, ISO string or epoch seconds)
+            until: End of the range, exclusive
+            limit: Maximum number of tweets
+
+        Returns:
+            Tweets in the connector's formatted structure (hashtags are normalized)
+        """
+        joins = ""
+        if hashtag is not None:
+            # Range-filter on the hashtag table so the (hashtag, timestamp) key does the work
+            joins = " JOIN tweet_hashtags h ON h.tweet_id = t.id"
+            clauses, params = self._range_clauses("h.timestamp", since, until)
+            clauses.insert(0, "h.hashtag = ?")
+            params.insert(0, _normalize_hashtag(hashtag))
+        else:
+            clauses, params = self._range_clauses("t.timestamp", since, until)
+        if author is not None:
+            clauses.append("t.author = ?")
+            params.append(_normalize_handle(author))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            f"SELECT {_TWEET_COLUMNS} FROM tweets t{joins}{where}"
+            " ORDER BY t.timestamp DESC, t.id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            hashtags = self._hashtags_for([row[0] for row in rows])
+        return [
+            {
+                "id": tweet_id,
+                "text": text,
+                "created_at": datetime.fromtimestamp(timestamp).isoformat(),
+                "author": author,
+                "metrics": {"likes": likes, "retweets": retweets, "replies": replies, "views": views},
+                "hashtags": hashtags.get(tweet_id, []),
+                "url": url
+            }
+            for tweet_id, author, timestamp, text, likes, retweets, replies, views, url in rows
+        ]
+
+    def _hashtags_for(self, tweet_ids: List[str]) -> Dict[str, List[str]]:
+        result: Dict[str, List[str]] = {}
+        # Stay under SQLite's default limit on bound parameters
+        for start in range(0, len(tweet_ids), 900):
+            chunk = tweet_ids[start:start + 900]
+            rows = self._conn.execute(
+                f"SELECT tweet_id, hashtag FROM tweet_hashtags WHERE tweet_id IN ({', '.join('?' * len(chunk))})"
+                " ORDER BY hashtag",
+                chunk
+            ).fetchall()
+            for tweet_id, hashtag in rows:
+                result.setdefault(tweet_id, []).append(hashtag)
+        return result
+
+    def hashtag_volume(self, hashtag: str, since=None, until=None, bucket: int = 3600,
+                       fill: bool = True) -> List[Tuple[int, int]]:
+        """
+        Time series of how many stored tweets used a hashtag.
+
+        Args:
+            hashtag: Hashtag (with or without #, any case)
+            since: Start of the range, inclusive (datetime, ISO string or epoch seconds)
+            until: End of the range, exclusive (defaults to now when filling)
+            bucket: Bucket width in seconds (e.g. 3600 hourly, 86400 daily, in UTC)
+            fill: Include empty buckets between since and until with a count of 0
+
+        Returns:
+            (bucket start in epoch seconds, tweet count) pairs, oldest first
+        """
+        bucket = int(bucket)
+        clauses, params = self._range_clauses("timestamp", since, until)
+        clauses.insert(0, "hashtag = ?")
+        params.insert(0, _normalize_hashtag(hashtag))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT (timestamp / {bucket}) * {bucket} AS start, COUNT(*) FROM tweet_hashtags"
+                f" WHERE {' AND '.join(clauses)} GROUP BY start ORDER BY start",
+                params
+            ).fetchall()
+        if not fill or (since is None and not rows):
+            return rows
+
+        counts = dict(rows)
+        first = _epoch(since) if since is not None else rows[0][0]
+        last = _epoch(until) - 1 if until is not None else int(time.time())
+        start = first // bucket * bucket
+        return [(t, counts.get(t, 0)) for t in range(start, last // bucket * bucket + 1, bucket)]
+
+    def top_hashtags(self, since=None, until=None, limit: int = 20) -> List[Tuple[str, int]]:
+        """
+        Most used hashtags in a time range.
+
+        Args:
+            since: Start of the range, inclusive (datetime, ISO string or epoch seconds)
+            until: End of the range, exclusive
+            limit: Maximum number of hashtags
+
+        Returns:
+            (hashtag, tweet count) pairs, most used first
+        """
+        clauses, params = self._range_clauses("timestamp", since, until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT hashtag, COUNT(*) AS volume FROM tweet_hashtags{where}"
+                " GROUP BY hashtag ORDER BY volume DESC, hashtag LIMIT ?",
+                params + [int(limit)]
+            ).fetchall()
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts per table."""
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("tweets", "tweet_hashtags", "accounts", "trend_snapshots")
+            }
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
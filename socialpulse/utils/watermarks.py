@@ -0,0 +1,120 @@
+"""Persistent per-account high-water marks for incremental polling."""
+
+import time
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+def tweet_position(tweet_id, timestamp) -> Tuple[int, int]:
+    """
+    Sortable position of a tweet in a timeline.
+
+    Tweet ids are time-ordered snowflakes, so (timestamp, numeric id) orders
+    tweets even when several share the same second.
+
+    Args:
+        tweet_id: Tweet id (numeric string or int)
+        timestamp: Tweet timestamp in seconds since epoch
+
+    Returns:
+        (timestamp, id) tuple; non-numeric ids sort as 0
+    """
+    try:
+        numeric_id = int(tweet_id)
+    except (TypeError, ValueError):
+        numeric_id = 0
+    return int(timestamp or 0), numeric_id
+
+class WatermarkStore:
+    """SQLite-backed store of the newest tweet seen for each account.
+
+    Marks only ever move forward, so concurrent or out-of-order updates can't
+    make a later poll re-deliver tweets that were already returned.
+    """
+
+    def __init__(self, path: str = "x_watermarks.db"):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Path of the SQLite database file (":memory:" for a throwaway store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " handle TEXT PRIMARY KEY,"
+            " tweet_id TEXT NOT NULL,"
+            " timestamp INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _normalize(handle: str) -> str:
+        return handle.lstrip('@').lower()
+
+    def get(self, handle: str) -> Optional[Tuple[str, int]]:
+        """
+        Get the high-water mark for an account.
+
+        Args:
+            handle: Account handle (with or without @)
+
+        Returns:
+            (tweet_id, timestamp) of the newest tweet seen, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tweet_id, timestamp FROM watermarks WHERE handle = ?",
+                (self._normalize(handle),)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def update(self, handle: str, tweet_id, timestamp: int) -> bool:
+        """
+        Advance the high-water mark for an account.
+
+        Args:
+            handle: Account handle (with or without @)
+            tweet_id: Id of the newest tweet seen
+            timestamp: Timestamp of that tweet in seconds since epoch
+
+        Returns:
+            True if the mark moved forward, False if it was already at or past it
+        """
+        handle = self._normalize(handle)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tweet_id, timestamp FROM watermarks WHERE handle = ?", (handle,)
+            ).fetchone()
+            if row and tweet_position(*row) >= tweet_position(tweet_id, timestamp):
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks (handle, tweet_id, timestamp, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (handle, str(tweet_id), int(timestamp), time.time())
+            )
+            self._conn.commit()
+            return True
+
+    def reset(self, handle: Optional[str] = None):
+        """Forget the mark for one account, or for every account if handle is None."""
+        with self._lock:
+            if handle is None:
+                self._conn.execute("DELETE FROM watermarks")
+            else:
+                self._conn.execute("DELETE FROM watermarks WHERE handle = ?", (self._normalize(handle),))
+            self._conn.commit()
+
+    def all(self) -> Dict[str, Tuple[str, int]]:
+        """All marks as {handle: (tweet_id, timestamp)}."""
+        with self._lock:
+            rows = self._conn.execute("SELECT handle, tweet_id, timestamp FROM watermarks").fetchall()
+        return {handle: (tweet_id, timestamp) for handle, tweet_id, timestamp in rows}
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
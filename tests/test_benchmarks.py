@@ -0,0 +1,66 @@
+import json
+
+import requests
+
+from socialpulse.benchmarks.replay_server import ReplayServer, load_payloads, scale_payload, synthetic_payloads
+from socialpulse.benchmarks.run_benchmarks import format_results, run_suite
+
+NOW = 1_750_000_000
+
+
+def test_scaled_payloads_have_unique_ids_newest_first():
+    payload = synthetic_payloads(base_size=5)["search"]
+    scaled = scale_payload(payload, 4, now=NOW)["data"]
+    assert len(scaled) == 20
+    assert len({tweet["id"] for tweet in scaled}) == 20
+    timestamps = [tweet["timestamp"] for tweet in scaled]
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert timestamps[-1] >= NOW - NOW % 86400
+    user_info = synthetic_payloads()["user-info"]
+    assert scale_payload(user_info, 4) is user_info
+
+
+def test_recorded_payloads_override_synthetic_ones(tmp_path):
+    recorded = [{"id": "1", "text": "recorded", "timestamp": NOW, "username": "rec"}]
+    (tmp_path / "user-tweets.json").write_text(json.dumps(recorded))
+    payloads = load_payloads(str(tmp_path))
+    assert payloads["user-tweets"] == recorded
+    assert payloads["user-info"] == synthetic_payloads()["user-info"]
+    assert len(payloads["search"]["data"]) == 20
+
+
+def test_server_injects_rate_limits_and_counts_requests():
+    with ReplayServer(rate_limit_ratio=0.5, retry_after=3, quota=100, seed=1) as server:
+        statuses = [requests.get(f"{server.base_url}/user-tweets").status_code for _ in range(40)]
+        limited = requests.get(f"{server.base_url}/search")
+        missing = requests.get(f"{server.base_url}/nothing-here")
+    assert server.requests == 42
+    assert server.rate_limited == statuses.count(429) + (limited.status_code == 429)
+    assert 5 < statuses.count(429) < 35
+    assert missing.status_code == 404
+    assert int(missing.headers["x-ratelimit-remaining"]) == 100 - 42
+
+
+def test_paginated_search_follows_the_cursor():
+    with ReplayServer(payloads=synthetic_payloads(base_size=7), paginate=True) as server:
+        seen, cursor = [], None
+        while True:
+            params = {"maxResults": 3, **({"cursor": cursor} if cursor else {})}
+            body = requests.get(f"{server.base_url}/search", params=params).json()
+            seen.extend(tweet["id"] for tweet in body["data"])
+            cursor = body.get("next_cursor")
+            if not cursor:
+                break
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_suite_runs_every_benchmark():
+    results = run_suite(scales=[1], iterations=2, base_size=5)
+    names = [result["benchmark"] for result in results]
+    assert names[:5] == ["get_account_tweets", "search_trendy_tweets", "TrendAnalyzer.get_trends",
+                         "TrendAnalyzer.analyze_trend_volume", "VectorScorer.score_batch"]
+    assert names[5].startswith("ScoringPipeline.score_texts")
+    assert all(result["calls_per_sec"] > 0 and result["p99_ms"] >= result["p50_ms"] for result in results)
+    assert results[0]["requests"] == 2 and results[0]["items_per_sec"] > 0
+    table = format_results(results)
+    assert all(name in table for name in names)
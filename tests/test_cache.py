@@ -0,0 +1,70 @@
+import pytest
+
+from socialpulse.utils import cache as cache_module
+from socialpulse.utils.cache import ResponseCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def test_cache_key_normalizes_params():
+    assert make_cache_key("/search/", {"Query": " defi ", "count": 10, "cursor": None}) == \
+        make_cache_key("search", {"count": "10", "query": "defi"})
+    assert make_cache_key("search", {"query": "defi"}) != make_cache_key("search", {"query": "DeFi"})
+
+
+def test_per_endpoint_ttl_expires_entries(clock):
+    cache = ResponseCache(default_ttl=300, ttls={"/tool/twitter/search": 60})
+    cache.set("tool/twitter/search", {"query": "defi"}, {"data": [1]})
+    cache.set("tool/twitter/user-tweets", {"user": "a"}, [1, 2])
+
+    clock.now += 61
+    assert cache.get("tool/twitter/search", {"query": "defi"}) is None
+    assert cache.get("tool/twitter/user-tweets", {"user": "a"}) == [1, 2]
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2, default_ttl=None)
+    cache.set("e", {"k": 1}, "one")
+    cache.set("e", {"k": 2}, "two")
+    assert cache.get("e", {"k": 1}) == "one"
+    cache.set("e", {"k": 3}, "three")
+
+    assert cache.get("e", {"k": 2}) is None
+    assert cache.get("e", {"k": 1}) == "one"
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_none_is_not_cached_and_invalidate_removes():
+    cache = ResponseCache()
+    cache.set("e", None, None)
+    assert len(cache) == 0
+    cache.set("e", {"k": 1}, {"v": 1})
+    cache.invalidate("e", {"k": 1})
+    assert cache.get("e", {"k": 1}) is None
+
+
+def test_sqlite_backend_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResponseCache(path=path, default_ttl=None)
+    cache.set("tool/twitter/search", {"query": "defi"}, {"data": [{"id": "1"}]})
+    cache.close()
+
+    reopened = ResponseCache(path=path)
+    assert reopened.get("tool/twitter/search", {"query": "defi"}) == {"data": [{"id": "1"}]}
+    reopened.close()
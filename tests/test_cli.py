@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from socialpulse import cli
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.benchmarks.startup import heavy_imports_at_startup
+
+
+def test_parser_defaults_and_handlers():
+    parser = cli.build_parser()
+    args = parser.parse_args(["trends"])
+    assert args.handler is cli.run_trends
+    assert args.keywords == cli.DEFAULT_KEYWORDS and not args.concurrent and args.timeout == 30.0
+    args = parser.parse_args(["search", "open source", "--count", "5", "--min-likes", "0"])
+    assert (args.query, args.count, args.min_likes, args.min_retweets) == ("open source", 5, 0, 10)
+    args = parser.parse_args(["profile", "-i", "paper.pdf", "--llm", "stub", "--no-cache"])
+    assert args.handler is cli.run_profile and args.workers == 4 and args.no_cache
+
+
+def test_a_command_is_required():
+    with pytest.raises(SystemExit) as info:
+        cli.build_parser().parse_args([])
+    assert info.value.code == 2
+
+
+def test_building_the_parser_imports_nothing_heavy():
+    assert heavy_imports_at_startup() == []
+
+
+def test_help_runs_as_a_module():
+    result = subprocess.run([sys.executable, "-m", "socialpulse", "search", "--help"],
+                            capture_output=True, text=True)
+    assert result.returncode == 0
+    assert "--min-likes" in result.stdout
+
+
+def test_search_and_account_against_the_replay_server(capsys):
+    with ReplayServer() as server:
+        options = ["--api-key", "test", "--base-url", server.base_url]
+        assert cli.main(["search", "crypto", "--count", "3", "--json", *options]) == 0
+        tweets = json.loads(capsys.readouterr().out)
+        assert 0 < len(tweets) <= 20 and all("text" in tweet for tweet in tweets)
+
+        assert cli.main(["account", "replay", *options]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines and all(line.startswith("@replay [") for line in lines)
+
+
+def test_history_needs_an_existing_store(tmp_path, capsys):
+    assert cli.main(["history", "btc", "--store", str(tmp_path / "missing.db")]) == 1
+    assert "not found" in capsys.readouterr().err
@@ -0,0 +1,43 @@
+from socialpulse.core.dedup import NearDuplicateFilter, collapse_near_duplicates, shingle_text
+
+
+def post(i, text, timestamp=1_700_000_000):
+    return {"id": str(i), "text": text, "timestamp": timestamp + i}
+
+
+def test_shingles_ignore_retweet_prefix_links_and_case():
+    assert shingle_text("RT @bob: Buy $XYZ now!! https://t.co/a") == shingle_text("buy $xyz now")
+    assert shingle_text("https://t.co/a @bob") == []
+
+
+def test_near_duplicates_join_one_cluster():
+    dedup = NearDuplicateFilter()
+    text = "huge airdrop for early $XYZ holders claim before the snapshot closes tonight"
+    kept = dedup.filter([
+        post(0, text),
+        post(1, f"RT @shill: {text} https://t.co/abc"),
+        post(2, "completely different thoughts about rollup sequencer decentralization"),
+    ])
+
+    assert [p["id"] for p in kept] == ["0", "2"]
+    assert dedup.stats()["duplicates"] == 1
+    assert dedup.clusters()[0].member_ids == ["0", "1"]
+
+
+def test_posts_without_shingles_are_never_duplicates():
+    dedup = NearDuplicateFilter()
+    posts = [post(0, "https://t.co/a"), post(1, "@alice @bob"), post(2, ""), post(3, None)]
+
+    assert dedup.filter(posts) == posts
+    assert dedup.stats()["duplicates"] == 0
+    assert not dedup._buckets
+    assert len(collapse_near_duplicates(posts)) == 4
+
+
+def test_clusters_expire_after_window():
+    dedup = NearDuplicateFilter(window=60)
+    text = "gm frens the mainnet launch is live go stake now"
+    assert dedup.add(post(0, text))[0]
+    assert dedup.add(post(100, "unrelated staking yield numbers for the week"))[0]
+    assert dedup.add(post(101, text))[0]
+    assert dedup.stats()["evicted"] == 1
@@ -0,0 +1,42 @@
+import random
+
+from socialpulse.utils.entities import extract_entities, extract_entities_batch, extract_hashtags
+
+
+def test_amounts_are_not_cashtags():
+    entities = extract_entities("$100 and $BTC, $eth. $1k $ABCDEFGHIJK US$5 $Ünï")
+    assert entities.cashtags == ["btc", "eth"]
+    assert extract_entities("$BTC", normalize=False).cashtags == ["BTC"]
+
+
+def test_urls_drop_trailing_punctuation():
+    entities = extract_entities("see https://x.com/a#frag). and (https://t.co/xyz. or https://ex.com/q?a=1#tag, ok")
+    assert entities.urls == ["https://x.com/a#frag", "https://t.co/xyz", "https://ex.com/q?a=1#tag"]
+    # '#' and '@' inside links are part of the link
+    assert entities.hashtags == [] and entities.mentions == []
+
+
+def test_hashtags_and_mentions():
+    entities = extract_entities("email a@b.com &#39; #1 #2024AI #BTC#ETH a#b @averyveryverylongname (@Alice) @alice")
+    assert entities.hashtags == ["2024ai", "btc"]
+    assert entities.mentions == ["alice"]
+    assert extract_hashtags("#DeFi and #defi") == ["DeFi", "defi"]
+    assert extract_entities("#DeFi and #defi").hashtags == ["defi"]
+
+
+def test_empty_texts():
+    assert extract_entities(None).to_dict() == {"hashtags": [], "cashtags": [], "mentions": [], "urls": []}
+    assert extract_entities_batch([]) == []
+
+
+def test_batch_matches_single_texts():
+    rng = random.Random(2)
+    pieces = ["#BTC", "$eth", "@bob", "https://t.co/a.", "$100", "word", "(#x)", "\x00", "a@b", "#1", "!", " "]
+    texts = ["".join(rng.choice(pieces + [" "] * 4) for _ in range(rng.randint(0, 20))) for _ in range(200)]
+    texts[0] = None
+    for normalize in (True, False):
+        batch = extract_entities_batch(texts, normalize=normalize)
+        assert len(batch) == len(texts)
+        for text, entities in zip(texts, batch):
+            expected = extract_entities(text.replace("\x00", " ") if text else text, normalize=normalize)
+            assert entities == expected
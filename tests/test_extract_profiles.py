@@ -0,0 +1,80 @@
+import threading
+import time
+
+from socialpulse.profile import generate_profile
+from socialpulse.profile.generate_profile import ProjectProfile, StubLLM, extract_profiles
+
+
+class SlowExtractor:
+    """Fake per-chunk extraction that records the peak number of concurrent calls."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, chunk, llm):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return ProjectProfile(name=chunk, short_description=chunk, detailed_description=chunk,
+                                  core_value=chunk, unique_components=[chunk], hashtags=[chunk])
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.done += 1
+
+
+def test_profiles_come_back_in_chunk_order(monkeypatch):
+    monkeypatch.setattr(generate_profile, "extract_profile_from_chunk", SlowExtractor(delay=0))
+    chunks = [f"chunk{i}" for i in range(25)]
+    profiles = extract_profiles(chunks, StubLLM(), max_workers=4)
+    assert [profile["name"] for profile in profiles] == chunks
+
+
+def test_llm_calls_are_bounded_by_max_workers(monkeypatch):
+    extractor = SlowExtractor()
+    monkeypatch.setattr(generate_profile, "extract_profile_from_chunk", extractor)
+    extract_profiles([f"chunk{i}" for i in range(12)], StubLLM(), max_workers=3)
+    assert 1 < extractor.peak <= 3
+
+
+def test_chunks_are_pulled_lazily(monkeypatch):
+    extractor = SlowExtractor()
+    monkeypatch.setattr(generate_profile, "extract_profile_from_chunk", extractor)
+    pulled = []
+
+    def chunks():
+        for i in range(20):
+            # Pulled chunks that are not extracted yet are the ones held in memory
+            assert len(pulled) - extractor.done <= 2 * 2
+            pulled.append(i)
+            yield f"chunk{i}"
+
+    profiles = extract_profiles(chunks(), StubLLM(), max_workers=2)
+    assert len(profiles) == 20
+
+
+def test_rate_limited_chunks_are_retried(monkeypatch):
+    failures = {"chunk1": 2}
+    sleeps = []
+
+    class RateLimitError(Exception):
+        retry_after = 0.5
+
+    def extract(chunk, llm):
+        if failures.get(chunk):
+            failures[chunk] -= 1
+            raise RateLimitError("429 Too Many Requests")
+        return SlowExtractor(delay=0)(chunk, llm)
+
+    monkeypatch.setattr(generate_profile, "extract_profile_from_chunk", extract)
+    monkeypatch.setattr(generate_profile.time, "sleep", sleeps.append)
+    profiles = extract_profiles(["chunk0", "chunk1"], StubLLM(), max_workers=2)
+    assert [profile["name"] for profile in profiles] == ["chunk0", "chunk1"]
+    assert sleeps == [0.5, 0.5]
@@ -0,0 +1,81 @@
+import pytest
+from langchain.prompts import PromptTemplate
+
+from socialpulse.profile import generate_profile
+from socialpulse.profile.generate_profile import (
+    ProjectProfile, StubLLM, chunk_cache_key, extract_profiles, extraction_fingerprint
+)
+from socialpulse.utils.cache import ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def calls(monkeypatch):
+    """Record extracted chunks; the real prompt and output parser are not needed here."""
+    extracted = []
+
+    def extract(chunk, llm):
+        extracted.append(chunk)
+        return ProjectProfile(name=chunk.split()[1], short_description=chunk[:40], detailed_description=chunk,
+                              core_value="tooling", unique_components=["x"], hashtags=["x"])
+
+    monkeypatch.setattr(generate_profile, "create_profile_prompt", lambda: PromptTemplate(
+        template="Extract a profile from: {text}\n{format_instructions}",
+        input_variables=["text"], partial_variables={"format_instructions": "Answer in JSON."}))
+    monkeypatch.setattr(generate_profile, "extract_profile_from_chunk", extract)
+    return extracted
+
+
+class OtherLLM(StubLLM):
+    @property
+    def _llm_type(self) -> str:
+        return "other"
+
+
+CHUNKS = [f"Project Alpha builds tooling for chain number {i}. " * 5 for i in range(6)]
+
+
+def test_second_run_is_served_from_the_cache(calls):
+    cache = ResponseCache(default_ttl=None)
+    first = extract_profiles(CHUNKS, StubLLM(), max_workers=2, cache=cache)
+    assert sorted(calls) == sorted(CHUNKS)
+
+    calls.clear()
+    second = extract_profiles(CHUNKS, StubLLM(), max_workers=2, cache=cache)
+    assert calls == []
+    assert second == first
+
+
+def test_only_changed_chunks_are_extracted_again(calls):
+    cache = ResponseCache(default_ttl=None)
+    extract_profiles(CHUNKS, StubLLM(), cache=cache)
+    calls.clear()
+
+    edited = CHUNKS[:3] + ["Project Beta is something else entirely."] + CHUNKS[4:]
+    profiles = extract_profiles(edited, StubLLM(), cache=cache)
+    assert calls == [edited[3]]
+    assert len(profiles) == len(edited)
+
+
+def test_model_parameters_are_part_of_the_key(calls):
+    cache = ResponseCache(default_ttl=None)
+    extract_profiles(CHUNKS[:2], StubLLM(), cache=cache)
+    calls.clear()
+    extract_profiles(CHUNKS[:2], OtherLLM(), cache=cache)
+    assert sorted(calls) == sorted(CHUNKS[:2])
+
+
+def test_the_prompt_is_hashed_once_per_run(monkeypatch):
+    built = []
+    monkeypatch.setattr(generate_profile, "extraction_fingerprint",
+                        lambda llm: built.append(llm) or extraction_fingerprint(llm))
+    cache = ResponseCache(default_ttl=None)
+    extract_profiles(CHUNKS, StubLLM(), cache=cache)
+    assert len(built) == 1
+
+
+def test_keys_depend_on_chunk_and_fingerprint():
+    fingerprint = extraction_fingerprint(StubLLM())
+    assert fingerprint == extraction_fingerprint(StubLLM())
+    assert chunk_cache_key("a", fingerprint) == chunk_cache_key("a", fingerprint)
+    assert chunk_cache_key("a", fingerprint) != chunk_cache_key("b", fingerprint)
+    assert chunk_cache_key("a", fingerprint) != chunk_cache_key("a", extraction_fingerprint(OtherLLM()))
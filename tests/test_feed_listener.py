@@ -0,0 +1,37 @@
+import time
+from types import SimpleNamespace
+
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.core.feed_listener import FeedListener
+from socialpulse.social_connectors.transport import HttpTransport
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+def test_http_429_pauses_polling():
+    with ReplayServer(rate_limit_ratio=1.0, retry_after=120) as server:
+        transport = HttpTransport(server.base_url, max_retries=0, metrics=MetricsRegistry())
+        listener = FeedListener(SimpleNamespace(transport=transport))
+        task = listener.add_task("account:replay", lambda: transport.get("user-tweets").json())
+
+        started = time.time()
+        assert listener.poll(task) == []
+        transport.close()
+
+    assert listener.rate_limited == 1
+    assert task.errors == 0
+    assert 119 <= listener._not_before - started <= 122
+    assert task.next_due == listener._not_before
+    assert listener.poll_due() == {}
+
+
+def test_poll_takes_only_new_tweets():
+    tweets = [{"id": "1", "text": "a"}, {"id": "2", "text": "b"}]
+    seen = []
+    listener = FeedListener(SimpleNamespace(transport=None),
+                            on_items=lambda key, items: seen.append((key, len(items))))
+    task = listener.add_task("query:x", lambda: list(tweets))
+
+    assert len(listener.poll(task)) == 2
+    tweets.append({"id": "3", "text": "c"})
+    assert [t["id"] for t in listener.poll(task)] == ["3"]
+    assert seen == [("query:x", 2), ("query:x", 1)]
@@ -0,0 +1,83 @@
+import random
+
+from socialpulse.profile.generate_profile import chunk_text, iter_chunks, iter_document_pages, load_document
+
+
+def make_document(rng):
+    paragraphs = []
+    for _ in range(rng.randint(5, 60)):
+        kind = rng.random()
+        if kind < 0.1:
+            # No separator at all, split by characters
+            paragraphs.append("x" * rng.randint(3000, 5000))
+        elif kind < 0.3:
+            lines = (" ".join(f"w{rng.randint(0, 99)}" for _ in range(rng.randint(1, 40)))
+                     for _ in range(rng.randint(1, 80)))
+            paragraphs.append("\n".join(lines))
+        else:
+            paragraphs.append(" ".join(f"word{rng.randint(0, 999)}" for _ in range(rng.randint(1, 300))))
+    return rng.choice(["\n\n", "\n\n\n", "\n \n", "\n\n\n\n"]).join(paragraphs)
+
+
+def random_pages(text, rng):
+    pages, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 9000)
+        pages.append(text[i:i + size])
+        i += size
+    return pages
+
+
+def test_iter_chunks_matches_chunk_text():
+    for seed in range(25):
+        rng = random.Random(seed)
+        text = make_document(rng)
+        assert list(iter_chunks(random_pages(text, rng))) == chunk_text(text), f"seed {seed}"
+
+
+def test_iter_chunks_page_boundaries_inside_separators():
+    text = "a" * 3000 + "\n\n\n\n" + "b" * 3000 + "\n\n" + "c" * 500
+    pages = [text[:3001], text[3001:3003], text[3003:6005], text[6005:]]
+    assert list(iter_chunks(pages)) == chunk_text(text)
+    assert list(iter_chunks([])) == chunk_text("") == []
+
+
+def test_streamed_text_file_matches_loaded_document(tmp_path):
+    path = tmp_path / "whitepaper.txt"
+    path.write_text(make_document(random.Random(99)), encoding="utf-8")
+
+    streamed = list(iter_chunks(iter_document_pages(str(path), block_size=1000)))
+    assert streamed == chunk_text(load_document(str(path)))
+
+
+def test_iter_chunks_streams_text_without_blank_lines():
+    rng = random.Random(5)
+    lines = [" ".join(f"w{rng.randint(0, 999)}" for _ in range(rng.randint(1, 30))) for _ in range(3000)]
+    text = "\n".join(lines)
+    assert "\n\n" not in text
+    pulled = []
+
+    def pages():
+        for i in range(0, len(text), 700):
+            pulled.append(i)
+            yield text[i:i + 700]
+
+    chunks = iter_chunks(pages())
+    first = next(chunks)
+    # The first chunk is out after about one chunk of text, not the whole document
+    assert len(pulled) * 700 < 4000 + 2 * 700
+    assert [first, *chunks] == chunk_text(text)
+
+
+def test_iter_chunks_small_chunks_and_overlap():
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    for seed in range(200):
+        rng = random.Random(seed)
+        chunk_size = rng.choice([2, 5, 12, 40])
+        overlap = rng.randint(0, chunk_size - 1)
+        text = "".join(rng.choice(["a", "bc", " ", "\n", "\n\n", "\n \n"]) for _ in range(rng.randint(0, 300)))
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=overlap,
+                                                  separators=["\n\n", "\n", " ", ""])
+        pages = [text[i:i + 7] for i in range(0, len(text), 7)]
+        assert list(iter_chunks(pages, chunk_size, overlap)) == splitter.split_text(text), f"seed {seed}"
@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    registry.counter("socialpulse_requests_total", "Requests", ("endpoint",)).inc(endpoint="search")
+    registry.histogram("socialpulse_latency_seconds", "Latency").observe(0.2)
+    return registry
+
+
+@pytest.mark.parametrize("name", ["metrics.prom", "metrics.txt"])
+def test_write_prometheus_text(registry, tmp_path, name):
+    path = tmp_path / name
+    registry.write(str(path))
+    text = path.read_text()
+    assert "# TYPE socialpulse_requests_total counter" in text
+    assert 'socialpulse_requests_total{endpoint="search"} 1' in text
+
+
+def test_write_json_otherwise(registry, tmp_path):
+    path = tmp_path / "metrics.json"
+    registry.write(str(path))
+    snapshot = json.loads(path.read_text())
+    assert snapshot["socialpulse_requests_total"]["type"] == "counter"
+    assert snapshot["socialpulse_latency_seconds"]["type"] == "histogram"
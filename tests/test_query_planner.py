@@ -0,0 +1,72 @@
+import random
+
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.core.query_planner import QueryPlan, plan_queries, search_term
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+def test_search_term_quotes_phrases():
+    assert search_term("bitcoin") == "bitcoin"
+    assert search_term(" open   source ") == '"open source"'
+    assert search_term('"open source"') == '"open source"'
+
+
+def test_keywords_share_one_query_when_they_fit():
+    plans = plan_queries(["crypto", "Bitcoin", "ethereum", "bitcoin", "open source", "#DeFi"])
+    assert len(plans) == 1
+    assert plans[0].keywords == ["crypto", "Bitcoin", "ethereum", "open source", "#DeFi"]
+    assert plans[0].query == '(crypto OR Bitcoin OR ethereum OR "open source" OR #DeFi)'
+    assert plan_queries(["solo"])[0].query == "solo"
+
+
+def test_queries_respect_the_length_limit():
+    rng = random.Random(5)
+    keywords = ["".join(rng.choice("abcdefgh") for _ in range(rng.randint(3, 25))) for _ in range(200)]
+    plans = plan_queries(keywords, max_length=120, reserved=40)
+
+    assert all(len(plan.query) + 40 <= 120 for plan in plans)
+    covered = [k for plan in plans for k in plan.keywords]
+    assert sorted(covered) == sorted(set(keywords))
+    # First-fit decreasing stays close to the lower bound
+    lower_bound = sum(len(k) + 4 for k in set(keywords)) / 78
+    assert len(plans) <= lower_bound + 2
+
+
+def test_too_long_keyword_gets_its_own_query():
+    plans = plan_queries(["a" * 30, "bb", "cc", "dd"], max_length=40, reserved=10)
+    assert [plan.query for plan in plans] == ["a" * 30, "(bb OR cc OR dd)"]
+
+
+def test_attribute_matches_whole_words_in_plan_order():
+    plan = plan_queries(["crypto", "Bitcoin", "open source", "#DeFi"])[0]
+    matched = plan.attribute([
+        {"text": "OPEN SOURCE wallets for bitcoin"},
+        {"text": "cryptography talk"},
+        {"text": "#defi summer, crypto"},
+        {"text": None},
+    ])
+    assert matched == [["Bitcoin", "open source"], [], ["crypto", "#DeFi"], []]
+
+
+def test_single_keyword_plan_attributes_every_result():
+    plan = QueryPlan(["bitcoin"], ["bitcoin"])
+    assert plan.attribute([{"text": "matched through the author's name"}]) == [["bitcoin"]]
+
+
+def test_search_keywords_spends_one_request():
+    with ReplayServer() as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry())
+        tweets = connector.search_keywords(["crypto", "bitcoin", "defi", "dao", "wallet", "airdrop"],
+                                           min_likes=0, min_retweets=0)
+        connector.close()
+
+    assert server.requests == 1
+    assert tweets and all("keywords" in tweet for tweet in tweets)
+    assert any(tweet["keywords"] for tweet in tweets)
+
+
+def test_plans_use_the_package_matcher():
+    from socialpulse.core.relevance import RelevanceMatcher
+
+    assert isinstance(plan_queries(["a", "b"])[0].matcher, RelevanceMatcher)
@@ -0,0 +1,105 @@
+import time
+from multiprocessing import get_context
+
+import pytest
+
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.exceptions import RateLimitException
+from socialpulse.social_connectors.transport import HttpTransport
+from socialpulse.utils.metrics import MetricsRegistry
+from socialpulse.utils.quota import BACKGROUND, INTERACTIVE, SharedQuota
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "quota.db")
+
+
+def drain(path, name, priority, results):
+    quota = SharedQuota(path, name=name, requests=20, window=3600, reserve=4)
+    granted = 0
+    while quota.try_acquire(priority):
+        granted += 1
+    quota.close()
+    results.put(granted)
+
+
+def test_background_calls_leave_the_reserve(path):
+    quota = SharedQuota(path, requests=10, window=3600, reserve=3)
+    granted = 0
+    while quota.try_acquire(BACKGROUND):
+        granted += 1
+    assert granted == 7
+
+    assert all(quota.try_acquire(INTERACTIVE) for _ in range(3))
+    assert not quota.try_acquire(INTERACTIVE)
+    with pytest.raises(ValueError):
+        quota.acquire("urgent")
+    quota.close()
+
+
+def test_instances_share_one_budget(path):
+    first = SharedQuota(path, name="key", requests=5, window=3600)
+    second = SharedQuota(path, name="key", requests=5, window=3600)
+    other = SharedQuota(path, name="other-key", requests=5, window=3600)
+    assert sum(q.try_acquire() for q in (first, second) * 5) == 5
+    assert other.try_acquire()
+    for quota in (first, second, other):
+        quota.close()
+
+
+def test_processes_share_one_budget(path):
+    context = get_context("spawn")
+    results = context.Queue()
+    workers = [context.Process(target=drain, args=(path, "key", BACKGROUND, results)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+    assert sum(results.get(timeout=5) for _ in workers) == 16
+
+
+def test_sync_follows_server_headers(path):
+    quota = SharedQuota(path, requests=100, window=900)
+    reset = int(time.time()) + 600
+    quota.sync({"limit": 50, "remaining": 6, "reset": reset})
+    state = quota.state()
+    assert (state["limit"], state["remaining"], state["reset"]) == (50, 6, reset)
+    assert state["tokens"] == pytest.approx(6, abs=0.1)
+
+    # Out-of-order responses: within a window the lowest count wins, older windows are ignored
+    quota.sync({"limit": 50, "remaining": 9, "reset": reset})
+    quota.sync({"limit": 50, "remaining": 1, "reset": reset - 900})
+    assert quota.state()["remaining"] == 6
+
+    # Default reserve is 10% of the server limit
+    granted = 0
+    while quota.try_acquire(BACKGROUND):
+        granted += 1
+    assert granted == 1
+    assert quota.try_acquire(INTERACTIVE)
+    quota.close()
+
+
+def test_pause_blocks_every_priority(path):
+    quota = SharedQuota(path, requests=10, window=3600)
+    quota.pause(30)
+    assert not quota.try_acquire(INTERACTIVE)
+    assert not quota.acquire(BACKGROUND, timeout=0.1)
+    assert quota.state()["paused_until"] > time.time() + 25
+    quota.close()
+
+
+def test_transport_pauses_quota_on_429(path):
+    quota = SharedQuota(path, requests=100, window=900)
+    with ReplayServer(rate_limit_ratio=1.0, retry_after=30) as server:
+        transport = HttpTransport(server.base_url, max_retries=0, metrics=MetricsRegistry(), quota=quota)
+        with pytest.raises(RateLimitException) as error:
+            transport.get("search")
+        transport.close()
+
+    assert error.value.retry_after == 30
+    state = quota.state()
+    assert state["paused_until"] == pytest.approx(time.time() + 30, abs=2)
+    assert state["remaining"] == 899
+    quota.close()
@@ -0,0 +1,88 @@
+import random
+
+from socialpulse.core.relevance import RelevanceMatcher, normalize_text
+
+PROFILE = {
+    "keywords": ["open source", "source code", "code", "DeFi", "on-chain"],
+    "hashtags": ["#DeFi", "Web3"],
+    "unique_components": ["Code Provenance"],
+}
+
+
+def is_word(c):
+    return c.isalnum() or c == "_"
+
+
+def reference_terms(patterns, text):
+    """Count bounded occurrences of every pattern with plain substring search."""
+    text = normalize_text(text)
+    terms = {}
+    for pattern, term, _ in patterns:
+        pattern = normalize_text(pattern)
+        start = text.find(pattern)
+        while start != -1:
+            end = start + len(pattern)
+            bounded_start = not is_word(pattern[0]) or start == 0 or not is_word(text[start - 1])
+            bounded_end = not is_word(pattern[-1]) or end == len(text) or not is_word(text[end])
+            if bounded_start and bounded_end:
+                terms[term] = terms.get(term, 0) + 1
+            start = text.find(pattern, start + 1)
+    return terms
+
+
+def test_overlapping_terms_are_all_reported():
+    matcher = RelevanceMatcher.from_profile(PROFILE)
+    result = matcher.match("Open   SOURCE code provenance for everyone")
+    assert result.terms == {"open source": 1, "source code": 1, "code": 1, "code provenance": 1}
+    assert result.score == 1.0 + 1.0 + 1.0 + 2.0
+
+
+def test_matches_respect_word_boundaries():
+    matcher = RelevanceMatcher.from_profile(PROFILE)
+    assert matcher.match("undefined behaviour in opensource codebases").terms == {}
+    assert matcher.match("decode the sourcecode").terms == {}
+    assert matcher.match("code_review and code-review").terms == {"code": 1}
+    assert matcher.match("data lives on-chain.").terms == {"on-chain": 1}
+
+
+def test_hashtags_match_with_and_without_the_hash():
+    matcher = RelevanceMatcher.from_profile(PROFILE)
+    result = matcher.match("#defi summer, DeFi winter, #Web3")
+    assert result.terms == {"defi": 2, "#defi": 2, "#web3": 1}
+    # A term counts once towards the score however often it occurs
+    assert result.score == 1.0 + 1.5 + 1.5
+
+
+def test_duplicate_patterns_keep_the_highest_weight():
+    matcher = RelevanceMatcher([("btc", "btc", 1.0), ("BTC", "btc", 3.0), ("  ", "blank", 9.0)])
+    assert matcher.weights == {"btc": 3.0}
+    assert matcher.score("btc btc") == 3.0
+    assert matcher.match(None).matched is False
+
+
+def test_batch_matches_single_scans_and_brute_force():
+    rng = random.Random(11)
+    words = ["open", "source", "code", "defi", "#defi", "undefined", "on-chain", "web3", "provenance",
+             "x", "codes", "Code", "OPEN", "\n", "  ", "#web3!", "on", "chain"]
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 15))) for _ in range(300)]
+    texts[3] = None
+    matcher = RelevanceMatcher.from_profile(PROFILE)
+    patterns = (
+        [(k, normalize_text(k), 1.0) for k in PROFILE["keywords"]]
+        + [(normalize_text(h).lstrip("#"), "#" + normalize_text(h).lstrip("#"), 1.5) for h in PROFILE["hashtags"]]
+        + [(c, normalize_text(c), 2.0) for c in PROFILE["unique_components"]]
+    )
+    batch = matcher.match_batch(texts)
+    for text, result in zip(texts, batch):
+        single = matcher.match(text)
+        assert result.terms == single.terms and result.score == single.score
+        assert result.terms == reference_terms(patterns, text or "")
+
+
+def test_filter_relevant_annotates_copies():
+    matcher = RelevanceMatcher.from_profile(PROFILE)
+    posts = [{"text": "open source"}, {"text": "nothing here"}, {"text": "#DeFi code"}]
+    relevant = matcher.filter_relevant(posts, min_score=2.0)
+    assert [post["text"] for post in relevant] == ["#DeFi code"]
+    assert relevant[0]["matched_terms"] == {"defi": 1, "#defi": 1, "code": 1}
+    assert "relevance" not in posts[2]
@@ -0,0 +1,61 @@
+import pytest
+
+from socialpulse.benchmarks.replay_server import ReplayServer, synthetic_tweet
+from socialpulse.core import scoring_pipeline
+from socialpulse.core.scoring_pipeline import ScoringPipeline
+from socialpulse.models.tweet_batch import StringColumn
+from socialpulse.social_connectors.x_connector import XConnector, load_profile
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture(scope="module")
+def profile():
+    return load_profile(None)
+
+
+def rows(scored):
+    return [
+        (scored.relevance[i], scored.similarity[i], scored.matched_terms(i), scored.entities(i).to_dict())
+        for i in range(len(scored))
+    ]
+
+
+def test_connector_batch_takes_the_columnar_path(profile, monkeypatch):
+    with ReplayServer() as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry())
+        batch = connector.get_account_tweet_batch("replay")
+        connector.close()
+    assert len(batch)
+
+    def rebuilt(values):
+        raise AssertionError("TweetBatch texts were rebuilt from strings")
+
+    monkeypatch.setattr(StringColumn, "from_strings", rebuilt)
+    assert isinstance(batch.texts, scoring_pipeline.StringColumn)
+    with ScoringPipeline(profile, workers=1) as pipeline:
+        scored = pipeline.score(batch)
+    assert len(scored) == len(batch)
+
+
+def test_results_do_not_depend_on_worker_count(profile):
+    tweets = [synthetic_tweet(i) for i in range(60)]
+    tweets[3]["text"] = None
+    tweets[10]["text"] = "Traceable open source code provenance for #DeSci $BTC @alice"
+
+    with ScoringPipeline(profile, workers=1) as pipeline:
+        local = pipeline.score(tweets)
+    with ScoringPipeline(profile, workers=2, shard_size=7) as pipeline:
+        sharded = pipeline.score(tweets)
+
+    assert len(sharded) == 60
+    assert rows(sharded) == rows(local)
+    assert sharded.entities(10).cashtags == ["btc"]
+
+
+def test_filter_relevant_annotates_kept_tweets(profile):
+    tweets = [{"id": "1", "text": "nothing to see here"},
+              {"id": "2", "text": f"all about {profile['keywords'][0]}"}]
+    with ScoringPipeline(profile, workers=1) as pipeline:
+        kept = pipeline.filter_relevant(tweets, min_relevance=0.1)
+    assert [t["id"] for t in kept] == ["2"]
+    assert kept[0]["matched_terms"]
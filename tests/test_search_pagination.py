@@ -0,0 +1,69 @@
+import pytest
+
+from socialpulse.benchmarks.replay_server import ReplayServer, synthetic_payloads
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def server():
+    with ReplayServer(payloads=synthetic_payloads(base_size=10), scale=5, paginate=True) as server:
+        yield server
+
+
+@pytest.fixture
+def connector(server):
+    connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry())
+    yield connector
+    connector.close()
+
+
+def test_pages_end_when_the_cursor_runs_out(server, connector):
+    pages = list(connector.iter_search_pages("crypto", page_size=15))
+    assert [len(page) for page in pages] == [15, 15, 15, 5]
+    assert server.requests == 4
+    ids = [tweet["id"] for page in pages for tweet in page]
+    assert len(set(ids)) == 50
+
+
+def test_max_pages_limits_requests(server, connector):
+    assert len(list(connector.iter_search_pages("crypto", page_size=10, max_pages=2))) == 2
+    assert server.requests == 2
+
+
+def test_pages_are_requested_lazily(server, connector):
+    tweets = connector.iter_search_tweets("crypto", page_size=10, max_results=12)
+    assert server.requests == 0
+    assert len(list(tweets)) == 12
+    assert server.requests == 2
+
+
+def test_where_and_stop(server, connector):
+    popular = list(connector.iter_search_tweets("crypto", page_size=10, where=lambda t: t["likes"] > 2500))
+    assert popular and all(tweet["likes"] > 2500 for tweet in popular)
+    assert server.requests == 5
+
+    server.reset_counters()
+    stop_id = str(1_800_000_000_000_000_000 + 23)
+    before = list(connector.iter_search_tweets("crypto", page_size=10, stop=lambda t: t["id"] == stop_id))
+    assert len(before) == 23
+    assert server.requests == 3
+
+
+def test_a_repeated_cursor_ends_the_search(connector):
+    requests = []
+
+    def get_json(endpoint, params):
+        requests.append(params.get("cursor"))
+        return {"data": [{"id": str(len(requests)), "text": "gm"}], "cursor": "same"}
+
+    connector._get_json = get_json
+    pages = list(connector.iter_search_pages("crypto", page_size=1))
+    assert len(pages) == 2
+    assert requests == [None, "same"]
+
+
+def test_an_empty_page_ends_the_search(connector):
+    responses = iter([{"data": [{"id": "1"}], "next_cursor": "a"}, {"data": [], "next_cursor": "b"}])
+    connector._get_json = lambda endpoint, params: next(responses)
+    assert [len(page) for page in connector.iter_search_pages("crypto")] == [1]
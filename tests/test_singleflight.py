@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+from socialpulse.utils.singleflight import SingleFlight
+
+
+class SlowCall:
+    def __init__(self, result="ok", error=None, delay=0.2):
+        self.result, self.error, self.delay = result, error, delay
+        self.runs = 0
+
+    def __call__(self):
+        self.runs += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def run_threads(n, target):
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_threads_share_one_call():
+    duplicates = []
+    flight = SingleFlight(on_duplicate=duplicates.append)
+    fn = SlowCall()
+
+    results, errors = run_threads(8, lambda: flight.do("k", fn))
+
+    assert fn.runs == 1
+    assert results == ["ok"] * 8 and not errors
+    assert flight.stats() == {"calls": 8, "deduplicated": 7, "in_flight": 0}
+    assert duplicates == ["k"] * 7
+
+
+def test_error_is_raised_in_every_caller_and_next_call_runs_again():
+    flight = SingleFlight()
+    failing = SlowCall(error=ValueError("boom"))
+
+    results, errors = run_threads(4, lambda: flight.do("k", failing))
+    assert failing.runs == 1
+    assert not results and len(errors) == 4 and all(isinstance(e, ValueError) for e in errors)
+
+    assert flight.do("k", lambda: "again") == "again"
+    assert flight.in_flight == 0
+
+
+def test_coroutines_share_one_call():
+    flight = SingleFlight()
+    runs = []
+
+    async def fetch():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        return [1, 2]
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("k", fetch) for _ in range(5)),
+                                    flight.do_async("other", fetch))
+
+    results = asyncio.run(main())
+    assert len(runs) == 2
+    assert results[:5] == [[1, 2]] * 5
+    assert flight.stats() == {"calls": 6, "deduplicated": 4, "in_flight": 0}
+
+
+def test_executor_calls_join_threads_and_count_once():
+    flight = SingleFlight()
+    fn = SlowCall(delay=0.3)
+
+    async def main():
+        return await asyncio.gather(*(flight.do_in_executor("k", fn) for _ in range(3)))
+
+    thread = threading.Thread(target=lambda: flight.do("k", fn))
+    thread.start()
+    time.sleep(0.05)
+    results = asyncio.run(main())
+    thread.join()
+
+    assert fn.runs == 1
+    assert results == ["ok"] * 3
+    # One threaded call plus three awaits; two awaits joined the first, which joined the thread
+    assert flight.stats() == {"calls": 4, "deduplicated": 3, "in_flight": 0}
+
+
+def test_cancelled_waiter_does_not_cancel_leader():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do_async("k", fetch))
+        waiter = asyncio.ensure_future(flight.do_async("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_connector_coalesces_identical_searches():
+    metrics = MetricsRegistry()
+    with ReplayServer(latency=0.2) as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=metrics)
+
+        async def main():
+            return await asyncio.gather(
+                *(connector.search_trendy_tweets_async("defi", count=5, min_likes=0, min_retweets=0)
+                  for _ in range(4))
+            )
+
+        thread_results, _ = run_threads(
+            3, lambda: connector.search_trendy_tweets("defi", count=5, min_likes=0, min_retweets=0))
+        async_results = asyncio.run(main())
+        connector.close()
+
+    assert len({len(r) for r in thread_results}) == 1 and len({len(r) for r in async_results}) == 1
+    assert server.requests == 2
+    assert connector.singleflight.stats() == {"calls": 7, "deduplicated": 5, "in_flight": 0}
+    assert "socialpulse_singleflight_deduplicated_total" in metrics.to_prometheus()
@@ -0,0 +1,68 @@
+import threading
+import time
+
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+class InFlight:
+    """Wraps a fetch function and records the peak number of concurrent calls."""
+
+    def __init__(self, fetch, fail=()):
+        self.fetch = fetch
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, handle, *args):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(handle)
+        try:
+            time.sleep(0.02)
+            if handle in self.fail:
+                raise ValueError(f"no such account: {handle}")
+            return self.fetch(handle, *args)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_fetches_are_bounded_by_max_workers():
+    handles = [f"account{i}" for i in range(12)]
+    with ReplayServer(latency=0.01) as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry())
+        fetch = InFlight(connector._fetch_account_tweets)
+        connector._fetch_account_tweets = fetch
+        results = list(connector.iter_track_account_tweets(handles, max_workers=3))
+        connector.close()
+    assert sorted(handle for handle, _, _ in results) == sorted(handles)
+    assert all(error is None and tweets for _, tweets, error in results)
+    assert 1 < fetch.peak <= 3
+
+
+def test_duplicate_handles_are_fetched_once():
+    with ReplayServer() as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry())
+        fetch = InFlight(connector._fetch_account_tweets)
+        connector._fetch_account_tweets = fetch
+        results = list(connector.iter_track_account_tweets(["@Alice", "alice", "bob", "@bob"]))
+        connector.close()
+    assert sorted(handle for handle, _, _ in results) == ["@Alice", "bob"]
+    assert sorted(fetch.calls) == ["@Alice", "bob"]
+
+
+def test_a_failing_account_does_not_abort_the_batch():
+    with ReplayServer() as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry())
+        connector._fetch_account_tweets = InFlight(connector._fetch_account_tweets, fail={"broken"})
+        results = {handle: (tweets, error)
+                   for handle, tweets, error in connector.iter_track_account_tweets(["ok", "broken", "fine"])}
+        connector.close()
+    assert isinstance(results["broken"][1], ValueError) and results["broken"][0] == []
+    assert results["ok"][1] is None and results["ok"][0]
+    assert results["fine"][1] is None and results["fine"][0]
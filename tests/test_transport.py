@@ -0,0 +1,143 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from socialpulse.exceptions import RateLimitException
+from socialpulse.social_connectors import transport as transport_module
+from socialpulse.social_connectors.transport import HttpTransport
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+
+
+class ScriptedServer:
+    """Answers requests with a fixed sequence of (status, headers) pairs, then 200s."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.requests = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with lock:
+                    server.requests += 1
+                    status, headers = server.script.pop(0) if server.script else (200, {})
+                body = json.dumps({"data": []} if status == 200 else {}).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(transport_module.time, "sleep", slept.append)
+    return slept
+
+
+def make_transport(server, **kwargs):
+    kwargs.setdefault("metrics", MetricsRegistry())
+    return HttpTransport(server.base_url, timeout=5.0, **kwargs)
+
+
+def test_429_waits_for_retry_after(sleeps):
+    with ScriptedServer([(429, {"Retry-After": "7"})]) as server:
+        metrics = MetricsRegistry()
+        with make_transport(server, metrics=metrics) as transport:
+            response = transport.get("search")
+    assert response.status_code == 200
+    assert server.requests == 2
+    assert sleeps == [7.0]
+    assert metrics.get("socialpulse_http_rate_limited_total").value(endpoint="search") == 1
+    assert metrics.get("socialpulse_http_retries_total").value(endpoint="search", reason="rate_limit") == 1
+
+
+def test_429_beyond_the_wait_limit_raises(sleeps):
+    with ScriptedServer([(429, {"Retry-After": "120"})]) as server:
+        with make_transport(server, max_rate_limit_wait=60.0) as transport:
+            with pytest.raises(RateLimitException) as info:
+                transport.get("search")
+    assert info.value.retry_after == 120.0
+    assert server.requests == 1
+    assert sleeps == []
+
+
+def test_5xx_backs_off_and_retries(sleeps):
+    with ScriptedServer([(503, {}), (502, {})]) as server:
+        with make_transport(server, backoff_base=0.5, backoff_max=30.0) as transport:
+            response = transport.get("search")
+    assert response.status_code == 200
+    assert server.requests == 3
+    assert len(sleeps) == 2
+    # Full jitter: attempt n waits at most backoff_base * 2**n
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+
+def test_5xx_returns_the_last_response_once_retries_run_out(sleeps):
+    with ScriptedServer([(500, {})] * 5) as server:
+        with make_transport(server, max_retries=2) as transport:
+            response = transport.get("search")
+    assert response.status_code == 500
+    assert server.requests == 3
+    assert len(sleeps) == 2
+
+
+def test_rate_limits_run_out_of_retries(sleeps):
+    with ScriptedServer([(429, {"Retry-After": "1"})] * 5) as server:
+        with make_transport(server, max_retries=2) as transport:
+            with pytest.raises(RateLimitException):
+                transport.get("search")
+    assert server.requests == 3
+    assert sleeps == [1.0, 1.0]
+
+
+def test_connection_errors_are_reraised_after_retries(sleeps):
+    with ScriptedServer([]) as server:
+        base_url = server.base_url
+    # The server is gone, so every attempt is refused
+    transport = HttpTransport(base_url, max_retries=2, metrics=MetricsRegistry())
+    with pytest.raises(requests.ConnectionError):
+        transport.get("search")
+    transport.close()
+    assert len(sleeps) == 2
+
+
+def test_connector_falls_back_when_rate_limited(sleeps):
+    with ScriptedServer([(429, {"Retry-After": "120"})] * 2) as server:
+        metrics = MetricsRegistry()
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=metrics, coalesce=False)
+        assert connector.search_trendy_tweets("bitcoin") == []
+        assert connector.get_account_tweets("replay") == {"error": "failed to get tweets"}
+        connector.close()
+    errors = metrics.get("socialpulse_connector_errors_total")
+    assert errors.value(connector="x", method="search_trendy_tweets") == 1
+    assert errors.value(connector="x", method="get_account_tweets") == 1
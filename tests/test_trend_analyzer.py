@@ -0,0 +1,84 @@
+import threading
+import time
+
+from socialpulse.core.trend_analyzer import TrendAnalyzer
+from socialpulse.social_connectors import BaseSocialConnector
+
+
+class FakeConnector(BaseSocialConnector):
+    def __init__(self, trends=(), delay=0.0, error=None):
+        self.trends = list(trends)
+        self.delay = delay
+        self.error = error
+        self.release = threading.Event()
+
+    def get_trending_topics(self, keywords=None, **kwargs):
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.error:
+            raise self.error
+        return [{"name": name, "volume": volume} for name, volume in self.trends]
+
+    def search_posts(self, query, **kwargs):
+        return []
+
+
+class RedditConnector(FakeConnector):
+    pass
+
+
+class SlowConnector(FakeConnector):
+    pass
+
+
+class BrokenConnector(FakeConnector):
+    pass
+
+
+def test_partial_results_when_a_connector_times_out():
+    slow = SlowConnector([("late", 1)], delay=5.0)
+    analyzer = TrendAnalyzer([RedditConnector([("bitcoin", 10), ("eth", 3)]), slow])
+    started = time.monotonic()
+    result = analyzer.get_trends_concurrent(["crypto"], timeout=0.2)
+    elapsed = time.monotonic() - started
+    slow.release.set()
+
+    assert elapsed < 2.0
+    assert [trend.name for trend in result.trends] == ["bitcoin", "eth"]
+    assert result.trends[0].platform == "reddit"
+    assert result.statuses["RedditConnector"].status == "ok"
+    assert result.statuses["RedditConnector"].count == 2
+    assert result.statuses["SlowConnector"].status == "timeout"
+    assert not result.complete
+
+
+def test_failures_are_reported_per_connector():
+    analyzer = TrendAnalyzer([BrokenConnector(error=RuntimeError("api down")), RedditConnector([("nft", 5)])])
+    result = analyzer.get_trends_concurrent([])
+    assert [trend.name for trend in result.trends] == ["nft"]
+    broken = result.statuses["BrokenConnector"]
+    assert broken.status == "error" and broken.error == "api down"
+    assert result.to_dict()["complete"] is False
+
+
+def test_per_connector_deadlines_override_the_default():
+    slow = SlowConnector([("late", 1)], delay=0.3)
+    analyzer = TrendAnalyzer([slow])
+    result = analyzer.get_trends_concurrent([], timeout=0.05, deadlines={"SlowConnector": 5.0})
+    assert result.complete
+    assert [trend.name for trend in result.trends] == ["late"]
+
+
+def test_connectors_run_concurrently_and_duplicate_names_are_kept_apart():
+    connectors = [RedditConnector([(f"t{i}", i)], delay=0.3) for i in range(3)]
+    analyzer = TrendAnalyzer(connectors)
+    started = time.monotonic()
+    result = analyzer.get_trends_concurrent([])
+    assert time.monotonic() - started < 0.8
+    assert sorted(result.statuses) == ["RedditConnector", "RedditConnector#2", "RedditConnector#3"]
+    assert sorted(trend.name for trend in result.trends) == ["t0", "t1", "t2"]
+
+
+def test_no_connectors():
+    result = TrendAnalyzer([]).get_trends_concurrent(["btc"])
+    assert result.trends == [] and result.statuses == {} and result.complete
@@ -0,0 +1,76 @@
+import random
+from collections import Counter
+
+from socialpulse.core.trend_detector import SlidingWindowCounter, SpaceSaving, TrendDetector
+
+NOW = 1_700_000_000.0
+
+
+def test_space_saving_is_exact_below_capacity():
+    summary = SpaceSaving(capacity=10)
+    for term in "a b a c a b".split():
+        summary.add(term)
+    assert summary.counts == {"a": 3, "b": 2, "c": 1}
+    assert set(summary.errors.values()) == {0}
+
+
+def test_space_saving_bounds_heavy_hitters():
+    rng = random.Random(3)
+    stream = ["hot"] * 500 + ["warm"] * 200 + [f"tail{rng.randint(0, 5000)}" for _ in range(3000)]
+    rng.shuffle(stream)
+    summary = SpaceSaving(capacity=50)
+    for term in stream:
+        summary.add(term)
+
+    true = Counter(stream)
+    assert len(summary) == 50
+    for term in ("hot", "warm"):
+        count, error = summary.counts[term], summary.errors[term]
+        assert count - error <= true[term] <= count
+    assert max(summary.counts, key=summary.counts.get) == "hot"
+
+
+def test_sliding_window_moves_counts_to_previous_window_and_expires():
+    counter = SlidingWindowCounter(window=60, buckets=6)
+    counter.add("#btc", NOW - 30)
+    counter.add("#btc", NOW - 90)
+    counter.add("#eth", NOW - 90)
+
+    assert counter.counts(NOW)[0] == {"#btc": 1}
+    assert counter.counts(NOW, previous=True)[0] == {"#btc": 1, "#eth": 1}
+
+    counter.expire(NOW + 120)
+    assert counter.size == 0
+
+
+def tweet(i, text, offset):
+    return {"id": str(i), "text": text, "timestamp": NOW - offset}
+
+
+def test_trending_reports_volume_and_acceleration():
+    detector = TrendDetector(windows=(300, 3600))
+    tweets = [tweet(i, "Buying $BTC #Bitcoin #bitcoin", 30 + i) for i in range(5)]
+    tweets += [tweet(10 + i, "still early #Bitcoin", 400 + i) for i in range(2)]
+    tweets += [tweet(20, "gm #DeFi", 60), {"id": "21", "text": "gm", "hashtags": ["DeFi"], "timestamp": NOW - 70}]
+    detector.add_batch(tweets)
+
+    trends = {t.name: t for t in detector.trending(now=NOW)}
+    assert set(trends) == {"#bitcoin", "$btc", "#defi"}
+    assert trends["#bitcoin"].volume == 5
+    assert trends["#bitcoin"].metadata["previous_volume"] == 2
+    assert trends["#bitcoin"].metadata["acceleration"] == 3
+    assert trends["$btc"].metadata["kind"] == "cashtag"
+    # A term is counted once per tweet, from the text or the hashtags field
+    assert trends["#defi"].volume == 2
+
+    hourly = {t.name: t.volume for t in detector.trending(window=3600, now=NOW)}
+    assert hourly["#bitcoin"] == 7
+    assert detector.tweets_seen == 9
+
+
+def test_analyzer_and_connector_share_the_detector_class():
+    from socialpulse.core import trend_analyzer
+    from socialpulse.social_connectors import x_connector
+
+    assert trend_analyzer.TrendDetector is TrendDetector
+    assert x_connector.TrendDetector is TrendDetector
@@ -0,0 +1,27 @@
+from socialpulse.core.trend_stats import compute_trend_stats, percentile
+from socialpulse.models.trend import TrendTopic
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) == 0.0
+    assert percentile([10, 20, 30, 40], 50) == 25.0
+    assert percentile([10, 20, 30, 40], 100) == 40
+
+
+def test_compute_trend_stats():
+    trends = [
+        TrendTopic("#BTC", 300, "x"),
+        TrendTopic("#ETH", 100, "x"),
+        TrendTopic("#SOL", None, "x"),
+        TrendTopic("r/defi", 300, "reddit"),
+        TrendTopic("#ARB", 50, "x"),
+    ]
+    stats = compute_trend_stats(iter(trends), top_k=2)
+
+    assert (stats.total_trends, stats.with_volume, stats.total_volume) == (5, 4, 750)
+    assert stats.average_volume == 187.5
+    assert stats.median_volume == 200.0
+    assert stats.platforms["x"].trends == 4
+    assert stats.platforms["reddit"].total_volume == 300
+    # Ties keep input order
+    assert [t.name for t in stats.top_trends] == ["#BTC", "r/defi"]
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from socialpulse.benchmarks.replay_server import synthetic_tweet
+from socialpulse.models.tweet_batch import StringColumn, TweetBatch
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+
+NOW = 1_750_000_000
+
+
+@pytest.fixture(scope="module")
+def raw():
+    rng = random.Random(3)
+    tweets = [synthetic_tweet(i, handle=rng.choice(["alice", "bob", "carol"]), now=NOW, rng=rng)
+              for i in range(40)]
+    tweets[5]["hashtags"] = ["Given", "ByApi"]
+    tweets[7]["text"] = "no tags here"
+    return tweets
+
+
+@pytest.fixture(scope="module")
+def formatted(raw):
+    connector = XConnector(api_key="test", base_url="http://127.0.0.1:9", metrics=MetricsRegistry())
+    tweets = connector._format_tweets(raw)
+    connector.close()
+    return tweets
+
+
+def test_from_raw_matches_the_connector_format(raw, formatted):
+    batch = TweetBatch.from_raw(raw)
+    assert len(batch) == len(raw)
+    assert batch.to_dicts() == formatted
+    assert batch.hashtags_of(5) == ["Given", "ByApi"]
+    assert batch.hashtags_of(7) == []
+    assert sorted(batch.authors) == ["alice", "bob", "carol"]
+
+
+def test_from_dicts_round_trips(formatted):
+    batch = TweetBatch.from_dicts(formatted)
+    assert batch.to_dicts() == formatted
+    assert list(batch) == formatted
+    assert batch[-1] == formatted[-1]
+    with pytest.raises(IndexError):
+        batch[len(formatted)]
+
+
+def test_slicing_take_and_filter(raw, formatted):
+    batch = TweetBatch.from_raw(raw)
+    assert batch[10:20].to_dicts() == formatted[10:20]
+    assert batch[::3].to_dicts() == formatted[::3]
+    assert batch[30:10].to_dicts() == []
+    assert batch.take([3, 1, 3]).to_dicts() == [formatted[3], formatted[1], formatted[3]]
+    popular = batch.filter(likes > 2500 for likes in batch.likes)
+    assert popular.to_dicts() == [t for t in formatted if t["metrics"]["likes"] > 2500]
+    cutoff = NOW - 10 * 30
+    assert batch.since(cutoff).to_dicts() == formatted[:11]
+
+
+def test_concat_merges_vocabularies(raw, formatted):
+    first, second = TweetBatch.from_raw(raw[:15]), TweetBatch.from_raw(raw[15:])
+    merged = TweetBatch.concat([first, TweetBatch(), second])
+    assert merged.to_dicts() == formatted
+    assert len(merged.authors) == len(set(merged.authors))
+    assert len(TweetBatch.concat([])) == 0
+
+
+def test_odd_values_are_stored_safely():
+    batch = TweetBatch.from_raw([{"id": "not-a-number", "text": None, "likes": "12", "views": -5}])
+    tweet = batch[0]
+    assert tweet["id"] == "0"
+    assert tweet["text"] == ""
+    assert tweet["metrics"]["likes"] == 12 and tweet["metrics"]["views"] == 0
+    assert tweet["url"] is None
+
+
+def test_string_column():
+    values = ["alpha", "", None, "ünïcode", "z"]
+    column = StringColumn.from_strings(values)
+    expected = [v or "" for v in values]
+    assert list(column) == expected and len(column) == 5
+    assert list(column.slice(1, 4)) == expected[1:4]
+    assert list(column.take([4, 0])) == ["z", "alpha"]
+    assert list(StringColumn.concat([column, StringColumn(), column.slice(3, 5)])) == expected + expected[3:]
+
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.models.trend import TrendTopic
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+from socialpulse.utils.tweet_store import TweetStore
+
+DAY = 86400
+START = 1_750_032_000  # Midnight UTC
+
+
+def raw(tweet_id, timestamp, text, author="Alice", likes=1, **extra):
+    return {"id": tweet_id, "timestamp": timestamp, "text": text, "username": author, "likes": likes, **extra}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TweetStore(str(tmp_path / "tweets.db"), batch_size=2)
+    yield store
+    store.close()
+
+
+def test_upsert_refreshes_counts_without_duplicates(store):
+    assert store.upsert_tweets([raw(1, START, "gm #BTC"), raw(2, START + 60, "gn"), {"text": "no id"}]) == 2
+    store.upsert_tweets([raw(1, START, "gm #BTC", likes=50)])
+
+    tweets = store.get_tweets()
+    assert [tweet["id"] for tweet in tweets] == ["2", "1"]
+    assert tweets[1]["metrics"]["likes"] == 50
+    assert tweets[1]["text"] == "gm #BTC"
+    assert tweets[1]["hashtags"] == ["btc"]
+    assert store.stats() == {"tweets": 2, "tweet_hashtags": 1, "accounts": 1, "trend_snapshots": 0}
+
+
+def test_raw_and_formatted_tweets_are_stored_alike(store):
+    formatted = {"id": "9", "text": "#DeSci", "created_at": datetime.fromtimestamp(START).isoformat(),
+                 "author": "@Bob", "metrics": {"likes": 3, "retweets": 1}, "hashtags": ["DeSci", "#AI"],
+                 "url": "https://x.com/bob/status/9"}
+    store.upsert_tweets([formatted])
+    tweet = store.get_tweets(author="bob")[0]
+    assert tweet == {**formatted, "author": "bob", "hashtags": ["ai", "desci"],
+                     "metrics": {"likes": 3, "retweets": 1, "replies": 0, "views": 0}}
+    assert store.get_account("@BOB")["last_tweet_at"] == START
+
+
+def test_hashtag_history(store):
+    tweets = [raw(i, START + i * 6 * 3600, f"#DeSci update {i}" + (" #AI" if i % 2 else "")) for i in range(12)]
+    store.upsert_tweets(tweets)
+
+    assert store.hashtag_volume("#desci", since=START, until=START + 3 * DAY, bucket=DAY) == [
+        (START, 4), (START + DAY, 4), (START + 2 * DAY, 4)]
+    # Empty buckets are filled up to until
+    assert store.hashtag_volume("AI", since=START, until=START + 4 * DAY, bucket=DAY)[-1] == (START + 3 * DAY, 0)
+    assert store.hashtag_volume("AI", since=START, until=START + 4 * DAY, bucket=DAY, fill=False) == [
+        (START, 2), (START + DAY, 2), (START + 2 * DAY, 2)]
+    assert store.hashtag_volume("nothing") == []
+
+    assert store.top_hashtags(since=START, until=START + DAY) == [("desci", 4), ("ai", 2)]
+    recent = store.get_tweets(hashtag="#AI", since=START + DAY, limit=2)
+    assert [tweet["id"] for tweet in recent] == ["11", "9"]
+
+
+def test_trend_snapshots(store):
+    store.save_trends([TrendTopic("#btc", 100, "x"), TrendTopic("#eth", None, "x")], timestamp=START)
+    store.save_trends([TrendTopic("#btc", 150, "x", metadata={"rank": 1})], timestamp=START + 3600)
+    history = store.trend_history("#btc")
+    assert [(t.volume, t.timestamp) for t in history] == [
+        (100, datetime.fromtimestamp(START)), (150, datetime.fromtimestamp(START + 3600))]
+    assert history[1].metadata == {"rank": 1}
+    assert [t.name for t in store.trend_history(since=START, until=START + 1)] == ["#btc", "#eth"]
+
+
+def test_connector_writes_fetched_tweets(tmp_path):
+    store = TweetStore(str(tmp_path / "tweets.db"))
+    with ReplayServer() as server:
+        connector = XConnector(api_key="test", base_url=server.base_url, metrics=MetricsRegistry(), store=store)
+        tweets = connector.get_account_tweets("replay")
+        connector.close()
+    assert tweets and store.stats()["tweets"] == 20
+    assert store.get_account("replay") is not None
+    store.close()
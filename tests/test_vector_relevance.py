@@ -0,0 +1,94 @@
+import math
+import pickle
+import random
+
+import pytest
+
+from socialpulse.core.vector_relevance import VectorScorer, tokenize
+
+PROFILE = {
+    "short_description": "Open source code provenance for blockchain developers",
+    "core_value": "Traceable code you can verify on chain",
+    "unique_components": ["provenance graph", "code signing", "audit trail"],
+    "keywords": ["provenance", "opensource", "web3"],
+}
+
+
+def exact_cosine(scorer, text):
+    """Cosine similarity computed from scratch, without any caches."""
+    tokens = tokenize(text)
+    if not tokens:
+        return 0.0
+    counts = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    vector = {}
+    for token, count in counts.items():
+        tf = 1.0 + math.log(count) if count > 1 else 1.0
+        for index, value in scorer._weighted_features(token).items():
+            vector[index] = vector.get(index, 0.0) + tf * value
+    pairs = {}
+    for pair in zip(tokens, tokens[1:]):
+        pairs[pair] = pairs.get(pair, 0.0) + scorer.bigram_weight
+    profile, profile_bigrams = scorer.profile_vector, scorer._profile_bigrams
+    dot = sum(value * profile.get(index, 0.0) for index, value in vector.items())
+    dot += sum(value * profile_bigrams.get(pair, 0.0) for pair, value in pairs.items())
+    norm = math.sqrt(sum(v * v for v in vector.values()) + sum(v * v for v in pairs.values()))
+    return dot / norm if dot > 0.0 else 0.0
+
+
+def random_post(rng):
+    words = tokenize(" ".join(text for text, _ in VectorScorer.from_profile(PROFILE).documents))
+    words += ["market", "pump", "moon", "traceability", "coder", "chains"]
+    return " ".join(rng.choice(words) for _ in range(rng.randint(1, 25)))
+
+
+@pytest.mark.parametrize("n_features", [1 << 18, 64])
+def test_scores_are_exact_cosines(n_features):
+    # 64 buckets force many collisions between the features of different tokens
+    scorer = VectorScorer.from_profile(PROFILE, n_features=n_features)
+    rng = random.Random(n_features)
+    posts = [random_post(rng) for _ in range(200)]
+    for post, score in zip(posts, scorer.score_batch(posts)):
+        assert score == pytest.approx(exact_cosine(scorer, post), abs=1e-9)
+        assert 0.0 <= score <= 1.0 + 1e-12
+
+
+def test_repeated_words_and_pairs_stay_within_one():
+    scorer = VectorScorer.from_profile({"keywords": ["code provenance"]}, n_features=32)
+    assert scorer.score("code provenance " * 20) <= 1.0 + 1e-12
+    assert scorer.score("code provenance") == pytest.approx(1.0)
+
+
+def test_word_pairs_count_without_profile_pairs():
+    scorer = VectorScorer.from_profile({"keywords": ["provenance", "code"]}, n_features=32)
+    post = "code provenance code provenance"
+    assert scorer.score(post) == pytest.approx(exact_cosine(scorer, post), abs=1e-9)
+    assert VectorScorer.from_profile(PROFILE, bigram_weight=0.0).score(post) > 0.0
+
+
+def test_related_wording_scores_above_unrelated():
+    scorer = VectorScorer.from_profile(PROFILE)
+    related, unrelated, empty = scorer.score_batch(
+        ["Code traceability for open source projects", "Lunch was great today", None])
+    assert related > unrelated >= 0.0
+    assert empty == 0.0
+
+
+def test_fit_and_pickling_keep_scores():
+    scorer = VectorScorer.from_profile(PROFILE)
+    posts = ["provenance of open source code", "code code code everywhere", "web3 audit trail"]
+    before = scorer.score_batch(posts)
+    scorer.fit(["code is everywhere", "more code", "provenance matters"])
+    fitted = scorer.score_batch(posts)
+    assert fitted != before
+    assert pickle.loads(pickle.dumps(scorer)).score_batch(posts) == fitted
+
+
+def test_rank_orders_and_filters():
+    scorer = VectorScorer.from_profile(PROFILE)
+    posts = [{"text": "Lunch was great"}, {"text": "Open source code provenance"}, {"text": "code signing"}]
+    ranked = scorer.rank(posts, min_score=0.05, top_k=2)
+    assert [post["text"] for post in ranked] == ["Open source code provenance", "code signing"]
+    assert ranked[0]["similarity"] >= ranked[1]["similarity"]
+    assert "similarity" not in posts[1]
@@ -0,0 +1,49 @@
+from socialpulse.benchmarks.replay_server import ReplayServer
+from socialpulse.social_connectors.x_connector import XConnector
+from socialpulse.utils.metrics import MetricsRegistry
+from socialpulse.utils.watermarks import WatermarkStore, tweet_position
+
+
+def test_tweet_position_orders_by_time_then_id():
+    assert tweet_position("20", 100) > tweet_position("19", 100)
+    assert tweet_position("1", 101) > tweet_position("99", 100)
+    assert tweet_position("not-a-number", None) == (0, 0)
+
+
+def test_marks_only_move_forward():
+    store = WatermarkStore(":memory:")
+    assert store.get("@Alice") is None
+    assert store.update("@Alice", "20", 100)
+    assert not store.update("alice", "19", 100)
+    assert not store.update("ALICE", "20", 100)
+    assert store.update("alice", "21", 100)
+    assert store.get("alice") == ("21", 100)
+
+    store.update("bob", "5", 50)
+    store.reset("alice")
+    assert store.all() == {"bob": ("5", 50)}
+    store.close()
+
+
+def test_marks_persist(tmp_path):
+    path = str(tmp_path / "marks.db")
+    store = WatermarkStore(path)
+    store.update("alice", "7", 70)
+    store.close()
+
+    reopened = WatermarkStore(path)
+    assert reopened.get("@alice") == ("7", 70)
+    reopened.close()
+
+
+def test_incremental_polls_return_only_unseen_tweets():
+    store = WatermarkStore(":memory:")
+    with ReplayServer() as server:
+        connector = XConnector(api_key="test", base_url=server.base_url,
+                               watermarks=store, metrics=MetricsRegistry())
+        first = connector.get_account_tweets("replay", incremental=True)
+        second = connector.get_account_tweets("replay", incremental=True)
+        connector.close()
+
+    assert first and second == []
+    assert store.get("replay")[0] in {tweet["id"] for tweet in first}